@@ -6,6 +6,7 @@ import pyperf
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from sqlglot.optimizer import optimize
+from sqlglot.optimizer.normalize import normalize
 from sqlglot import parse_one
 from tests.helpers import load_sql_fixture_pairs, TPCH_SCHEMA, TPCDS_SCHEMA
 
@@ -17,6 +18,10 @@ def gen_condition(n):
     return parse_one(" OR ".join(f"a = {i} AND b = {i}" for i in range(n)))
 
 
+def gen_factorable_condition(n):
+    return parse_one(" OR ".join(f"(x = 1 AND y > 2 AND a = {i} AND b = {i})" for i in range(n)))
+
+
 # Create benchmark functions that return the setup data
 def get_tpch_setup():
     return (
@@ -44,12 +49,25 @@ def get_condition_1000_setup():
     return ([gen_condition(1000)], {})
 
 
+def get_factorable_condition_100_setup():
+    return ([gen_factorable_condition(100)], {})
+
+
+def get_factorable_condition_1000_setup():
+    return ([gen_factorable_condition(1000)], {})
+
+
 # Optimizer functions that will be benchmarked
 def optimize_queries(expressions, schema):
     for e in expressions:
         optimize(e, schema)
 
 
+def normalize_conditions(expressions, factor):
+    for e in expressions:
+        normalize(e.copy(), factor=factor)
+
+
 def run_benchmarks():
     runner = pyperf.Runner()
 
@@ -67,6 +85,23 @@ def run_benchmarks():
 
         runner.bench_func(f"optimize_{benchmark_name}", optimize_queries, expressions, schema)
 
+    # Compare normalizing large conditions with the distributive law and with factoring
+    normalize_benchmarks = {
+        "condition_10": get_condition_10_setup,
+        "condition_100": get_condition_100_setup,
+        "condition_1000": get_condition_1000_setup,
+        "factorable_condition_100": get_factorable_condition_100_setup,
+        "factorable_condition_1000": get_factorable_condition_1000_setup,
+    }
+
+    for benchmark_name, benchmark_setup in normalize_benchmarks.items():
+        expressions, _ = benchmark_setup()
+
+        runner.bench_func(f"normalize_{benchmark_name}", normalize_conditions, expressions, False)
+        runner.bench_func(
+            f"normalize_factor_{benchmark_name}", normalize_conditions, expressions, True
+        )
+
 
 if __name__ == "__main__":
     run_benchmarks()
@@ -46,6 +46,7 @@ from sqlglot.expressions import (
     to_table as to_table,
     union as union,
 )
+from sqlglot.batch import parse_many as parse_many, transpile_many as transpile_many
 from sqlglot.generator import Generator as Generator
 from sqlglot.parser import Parser as Parser
 from sqlglot.schema import MappingSchema as MappingSchema, Schema as Schema
@@ -103,6 +104,28 @@ def parse(
     return Dialect.get_or_raise(read or dialect).parse(sql, **opts)
 
 
+def parse_iter(
+    sql: str | t.TextIO, read: DialectType = None, dialect: DialectType = None, **opts
+) -> t.Iterator[t.Optional[Expression]]:
+    """
+    Lazily parses the given SQL string or text file, yielding one syntax tree per SQL statement.
+
+    Unlike `parse`, the input is tokenized in chunks and each statement is parsed as soon as its
+    terminating semicolon is reached, so that huge scripts can be processed in bounded memory.
+
+    Args:
+        sql: the SQL code string or text file object to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+        **opts: other `sqlglot.parser.Parser` options, or `chunk_size`, the number of characters
+            to tokenize at a time.
+
+    Returns:
+        An iterator over the resulting syntax trees.
+    """
+    return Dialect.get_or_raise(read or dialect).parse_iter(sql, **opts)
+
+
 @t.overload
 def parse_one(sql: str, *, into: t.Type[E], **opts) -> E: ...
 
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ErrorLevel
+
+if t.TYPE_CHECKING:
+    from sqlglot.dialects.dialect import DialectType
+    from sqlglot.expressions import Expression
+
+    BatchResult = t.List[t.Any]
+
+
+class _Worker:
+    """Holds the state that is initialized once per process and reused for every statement."""
+
+    def __init__(
+        self,
+        read: DialectType,
+        write: DialectType,
+        error_level: t.Optional[ErrorLevel],
+        opts: t.Dict[str, t.Any],
+    ) -> None:
+        self.read = Dialect.get_or_raise(read)
+        self.write = Dialect.get_or_raise(write)
+        self.tokenizer = self.read.tokenizer()
+        self.parser = self.read.parser(error_level=error_level)
+        self.generator = self.write.generator(**opts)
+
+    def parse(self, sql: str) -> t.List[t.Optional[Expression]]:
+        tokens = self.tokenizer.tokenize(sql)
+        return self.parser.parse(tokens, sql, self.tokenizer.semicolons)
+
+    def transpile(self, sql: str) -> t.List[str]:
+        return [
+            self.generator.generate(expression, copy=False) if expression else ""
+            for expression in self.parse(sql)
+        ]
+
+    def run(self, method: str, sqls: t.List[str]) -> BatchResult:
+        func = getattr(self, method)
+        results: BatchResult = []
+
+        for sql in sqls:
+            try:
+                results.append(func(sql))
+            except Exception as e:
+                results.append(e)
+
+        return results
+
+
+_WORKER: t.Optional[_Worker] = None
+
+
+def _init_worker(*args: t.Any) -> None:
+    global _WORKER
+    _WORKER = _Worker(*args)
+
+
+def _run_chunk(method: str, sqls: t.List[str]) -> BatchResult:
+    assert _WORKER is not None
+    return _WORKER.run(method, sqls)
+
+
+def _run(
+    method: str,
+    sqls: t.Iterable[str],
+    read: DialectType,
+    write: DialectType,
+    error_level: t.Optional[ErrorLevel],
+    opts: t.Dict[str, t.Any],
+    max_workers: t.Optional[int],
+    chunksize: int,
+) -> BatchResult:
+    sqls = list(sqls)
+    initargs = (read, write, error_level, opts)
+
+    # Invalid settings are reported here, rather than by each worker's initializer
+    worker = _Worker(*initargs)
+
+    if max_workers == 1 or len(sqls) <= chunksize:
+        return worker.run(method, sqls)
+
+    chunks = [sqls[i : i + chunksize] for i in range(0, len(sqls), chunksize)]
+    results: BatchResult = []
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=initargs
+    ) as pool:
+        for chunk_results in pool.map(_run_chunk, repeat(method), chunks):
+            results.extend(chunk_results)
+
+    return results
+
+
+def parse_many(
+    sqls: t.Iterable[str],
+    read: DialectType = None,
+    dialect: DialectType = None,
+    error_level: t.Optional[ErrorLevel] = None,
+    max_workers: t.Optional[int] = None,
+    chunksize: int = 64,
+) -> t.List[t.Union[t.List[t.Optional[Expression]], Exception]]:
+    """
+    Parses a batch of SQL strings, sharding them across a pool of worker processes.
+
+    Each worker sets up the dialect and the parser once, and then reuses them for every string it's
+    handed. Errors don't abort the batch: the exception raised for a given string is returned in its
+    place instead.
+
+    Args:
+        sqls: the SQL code strings to parse.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+        error_level: the desired error level of the parser.
+        max_workers: the maximum number of worker processes. If set to 1, the batch is processed
+            in the current process.
+        chunksize: the number of SQL strings that are sent to a worker at a time.
+
+    Returns:
+        A list containing either the syntax trees or the raised exception for each SQL string,
+        in input order.
+    """
+    read = read or dialect
+    return _run("parse", sqls, read, read, error_level, {}, max_workers, chunksize)
+
+
+def transpile_many(
+    sqls: t.Iterable[str],
+    read: DialectType = None,
+    write: DialectType = None,
+    identity: bool = True,
+    error_level: t.Optional[ErrorLevel] = None,
+    max_workers: t.Optional[int] = None,
+    chunksize: int = 64,
+    **opts,
+) -> t.List[t.Union[t.List[str], Exception]]:
+    """
+    Transpiles a batch of SQL strings, sharding them across a pool of worker processes.
+
+    Each worker sets up the source and target dialects, as well as the generator settings, once
+    and then reuses them for every string it's handed. Errors don't abort the batch: the exception
+    raised for a given string is returned in its place instead.
+
+    Args:
+        sqls: the SQL code strings to transpile.
+        read: the source dialect used to parse the input strings (eg. "spark", "hive", "presto", "mysql").
+        write: the target dialect into which the input should be transformed (eg. "spark", "hive", "presto", "mysql").
+        identity: if set to `True` and if the target dialect is not specified the source dialect will be used as both:
+            the source and the target dialect.
+        error_level: the desired error level of the parser.
+        max_workers: the maximum number of worker processes. If set to 1, the batch is processed
+            in the current process.
+        chunksize: the number of SQL strings that are sent to a worker at a time.
+        **opts: other `sqlglot.generator.Generator` options.
+
+    Returns:
+        A list containing either the transpiled SQL statements or the raised exception for each
+        SQL string, in input order.
+    """
+    write = (read if write is None else write) if identity else write
+    return _run("transpile", sqls, read, write, error_level, opts, max_workers, chunksize)
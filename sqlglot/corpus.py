@@ -0,0 +1,287 @@
+"""
+## Corpus
+
+A corpus is a file that holds a collection of parsed statements, e.g. the contents of a query log.
+It's written once with a `CorpusWriter` and then opened as a `Corpus`, which memory-maps the file
+and only deserializes the statements that are accessed. It also keeps an index of the tables that
+each statement references, so that looking them up doesn't require loading any of the trees.
+
+Example:
+    >>> import os, tempfile
+    >>> from sqlglot import parse_one
+    >>> path = os.path.join(tempfile.mkdtemp(), "queries.corpus")
+    >>> with CorpusWriter(path) as writer:
+    ...     writer.add(parse_one("SELECT a FROM x"))
+    ...     writer.add(parse_one("SELECT b FROM db.y JOIN x ON y.id = x.id"))
+    0
+    1
+    >>> with Corpus(path) as corpus:
+    ...     [corpus[i].sql() for i in corpus.referencing("x")]
+    ['SELECT a FROM x', 'SELECT b FROM db.y JOIN x ON y.id = x.id']
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+import typing as t
+from array import array
+
+from sqlglot import expressions as exp
+from sqlglot.serde import _read_varint, _write_varint, dumps, loads
+
+# The file starts with a header and is followed by the serialized statements, an array with the
+# offset of each statement, the table index and a footer that points to the last two sections.
+# The index maps each table name to the ids of the statements that reference it, which are stored
+# as the varint-encoded differences between consecutive ids.
+MAGIC = b"SQLGCORP"
+VERSION = 1
+
+_OFFSET = struct.Struct("<Q")
+_FOOTER = struct.Struct("<QQQ")
+
+
+def table_names(expression: exp.Expression) -> t.Set[str]:
+    """
+    Returns the names under which the statement is indexed, i.e. the names of the tables it
+    references, along with every suffix of their qualified names.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> sorted(table_names(parse_one("SELECT * FROM c.db.x")))
+        ['c.db.x', 'db.x', 'x']
+
+    Args:
+        expression: the statement.
+
+    Returns:
+        The set of table names.
+    """
+    names = set()
+
+    for table in expression.find_all(exp.Table):
+        parts = [part.name for part in table.parts]
+        for i in range(len(parts)):
+            names.add(".".join(parts[i:]))
+
+    return names
+
+
+class CorpusWriter:
+    """
+    Writes a corpus of statements to a file.
+
+    Args:
+        path: the path of the file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file: t.BinaryIO = open(path, "wb")
+        self._file.write(MAGIC)
+        self._file.write(bytes([VERSION]))
+        self._offsets = array("Q", [self._file.tell()])
+        self._tables: t.Dict[str, array] = {}
+
+    def __enter__(self) -> CorpusWriter:
+        return self
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def add(self, expression: exp.Expression) -> int:
+        """
+        Appends a statement to the corpus.
+
+        Args:
+            expression: the statement.
+
+        Returns:
+            The id of the statement, i.e. its position in the corpus.
+        """
+        index = len(self)
+        data = dumps(expression)
+
+        for name in table_names(expression):
+            ids = self._tables.get(name)
+            if ids is None:
+                ids = self._tables[name] = array("Q")
+            ids.append(index)
+
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+        return index
+
+    def close(self) -> None:
+        """Writes the index of the corpus and closes the file."""
+        if self._file.closed:
+            return
+
+        offsets_pos = self._file.tell()
+        offsets = self._offsets
+        if sys.byteorder != "little":
+            offsets = array("Q", offsets)
+            offsets.byteswap()
+
+        self._file.write(offsets.tobytes())
+        tables_pos = self._file.tell()
+
+        buf = bytearray()
+        _write_varint(buf, len(self._tables))
+
+        for name, ids in self._tables.items():
+            encoded = name.encode("utf-8", "surrogatepass")
+            _write_varint(buf, len(encoded))
+            buf += encoded
+
+            postings = bytearray()
+            _write_varint(postings, len(ids))
+            previous = 0
+            for i in ids:
+                _write_varint(postings, i - previous)
+                previous = i
+
+            _write_varint(buf, len(postings))
+            buf += postings
+
+        self._file.write(buf)
+        self._file.write(_FOOTER.pack(len(self), offsets_pos, tables_pos))
+        self._file.write(MAGIC)
+        self._file.close()
+
+
+class Corpus:
+    """
+    A read-only, memory-mapped corpus of statements.
+
+    Statements are deserialized every time they're accessed, so callers that need to reuse a
+    statement should hold on to it instead of indexing the corpus again.
+
+    Args:
+        path: the path of a file written by `CorpusWriter`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._mmap)
+        footer_pos = size - len(MAGIC) - _FOOTER.size
+
+        if (
+            footer_pos < len(MAGIC) + 1
+            or self._mmap[: len(MAGIC)] != MAGIC
+            or self._mmap[size - len(MAGIC) :] != MAGIC
+        ):
+            self._mmap.close()
+            raise ValueError(f"Invalid corpus file: {path}")
+        if self._mmap[len(MAGIC)] != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported corpus version: {self._mmap[len(MAGIC)]}")
+
+        self._count, self._offsets_pos, self._tables_pos = _FOOTER.unpack_from(
+            self._mmap, footer_pos
+        )
+        self._tables: t.Optional[t.Dict[str, int]] = None
+
+    def __enter__(self) -> Corpus:
+        return self
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> exp.Expression:
+        return loads(self.data(index))
+
+    def __iter__(self) -> t.Iterator[exp.Expression]:
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def data(self, index: int) -> bytes:
+        """
+        Returns the serialized form of a statement, as produced by `sqlglot.serde.dumps`.
+
+        Args:
+            index: the id of the statement.
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Statement {index} is out of range")
+
+        pos = self._offsets_pos + index * _OFFSET.size
+        start = _OFFSET.unpack_from(self._mmap, pos)[0]
+        end = _OFFSET.unpack_from(self._mmap, pos + _OFFSET.size)[0]
+        return self._mmap[start:end]
+
+    def tables(self) -> t.List[str]:
+        """Returns the names of the tables in the index of the corpus."""
+        return list(self._load_tables())
+
+    def referencing(self, table: str) -> t.List[int]:
+        """
+        Returns the ids of the statements that reference a table, without deserializing them.
+
+        Args:
+            table: the name of the table. It's matched exactly against the names returned by
+                `table_names`, so a qualified name matches both its own and more qualified
+                references, whereas a bare name matches all references to a table with that name.
+
+        Returns:
+            The ids of the statements, in ascending order.
+        """
+        pos = self._load_tables().get(table)
+        if pos is None:
+            return []
+
+        data: t.Any = self._mmap
+        count, pos = _read_varint(data, pos)
+        ids = []
+        index = 0
+
+        for _ in range(count):
+            delta, pos = _read_varint(data, pos)
+            index += delta
+            ids.append(index)
+
+        return ids
+
+    def find_all(self, table: str) -> t.Iterator[exp.Expression]:
+        """
+        Yields the statements that reference a table, deserializing only those.
+
+        Args:
+            table: the name of the table, as in `Corpus.referencing`.
+        """
+        for index in self.referencing(table):
+            yield self[index]
+
+    def _load_tables(self) -> t.Dict[str, int]:
+        # The names are read once, whereas the statement ids are only decoded when they're needed
+        if self._tables is None:
+            data: t.Any = self._mmap
+            count, pos = _read_varint(data, self._tables_pos)
+            tables = {}
+
+            for _ in range(count):
+                size, pos = _read_varint(data, pos)
+                name = data[pos : pos + size].decode("utf-8", "surrogatepass")
+                size, pos = _read_varint(data, pos + size)
+                tables[name] = pos
+                pos += size
+
+            self._tables = tables
+
+        return self._tables
@@ -68,10 +68,12 @@ class Athena(Dialect):
         opts["trino"] = self._trino
         return super().parse_into(expression_type, sql, **opts)
 
-    def generate(self, expression: exp.Expression, copy: bool = True, **opts) -> str:
+    def generate(
+        self, expression: exp.Expression, copy: bool = True, copy_on_write: bool = False, **opts
+    ) -> str:
         opts["hive"] = self._hive
         opts["trino"] = self._trino
-        return super().generate(expression, copy=copy, **opts)
+        return super().generate(expression, copy=copy, copy_on_write=copy_on_write, **opts)
 
     # This Tokenizer consumes a combination of HiveQL and Trino SQL and then processes the tokens
     # to disambiguate which dialect needs to be actually used in order to tokenize correctly.
@@ -104,6 +106,9 @@ class Athena(Dialect):
         def tokenize(self, sql: str) -> t.List[Token]:
             tokens = super().tokenize(sql)
 
+            # The returned tokens come from a different tokenizer, so the indices don't apply
+            self.semicolons = None
+
             if _tokenize_as_hive(tokens):
                 return [Token(TokenType.HIVE_TOKEN_STREAM, "")] + self._hive_tokenizer.tokenize(sql)
 
@@ -120,7 +125,10 @@ class Athena(Dialect):
             self._trino_parser = _TrinoParser(*args, **{**kwargs, "dialect": trino})
 
         def parse(
-            self, raw_tokens: t.List[Token], sql: t.Optional[str] = None
+            self,
+            raw_tokens: t.Sequence[Token],
+            sql: t.Optional[str] = None,
+            semicolons: t.Optional[t.List[int]] = None,
         ) -> t.List[t.Optional[exp.Expression]]:
             if raw_tokens and raw_tokens[0].token_type == TokenType.HIVE_TOKEN_STREAM:
                 return self._hive_parser.parse(raw_tokens[1:], sql)
@@ -130,8 +138,9 @@ class Athena(Dialect):
         def parse_into(
             self,
             expression_types: exp.IntoType,
-            raw_tokens: t.List[Token],
+            raw_tokens: t.Sequence[Token],
             sql: t.Optional[str] = None,
+            semicolons: t.Optional[t.List[int]] = None,
         ) -> t.List[t.Optional[exp.Expression]]:
             if raw_tokens and raw_tokens[0].token_type == TokenType.HIVE_TOKEN_STREAM:
                 return self._hive_parser.parse_into(expression_types, raw_tokens[1:], sql)
@@ -148,13 +157,15 @@ class Athena(Dialect):
             self._hive_generator = _HiveGenerator(*args, **{**kwargs, "dialect": hive})
             self._trino_generator = _TrinoGenerator(*args, **{**kwargs, "dialect": trino})
 
-        def generate(self, expression: exp.Expression, copy: bool = True) -> str:
+        def generate(
+            self, expression: exp.Expression, copy: bool = True, copy_on_write: bool = False
+        ) -> str:
             if _generate_as_hive(expression):
                 generator = self._hive_generator
             else:
                 generator = self._trino_generator
 
-            return generator.generate(expression, copy=copy)
+            return generator.generate(expression, copy=copy, copy_on_write=copy_on_write)
 
 
 def _tokenize_as_hive(tokens: t.List[Token]) -> bool:
@@ -10,10 +10,12 @@ from functools import reduce
 
 from sqlglot import exp
 from sqlglot.dialects import DIALECT_MODULE_NAMES
-from sqlglot.errors import ParseError
+from sqlglot.errors import ParseError, TokenError
 from sqlglot.generator import Generator, unsupported_args
 from sqlglot.helper import (
     AutoName,
+    LRUCache,
+    ensure_list,
     flatten,
     is_int,
     seq_get,
@@ -944,6 +946,19 @@ class Dialect(metaclass=_Dialect):
         "version",
     }
 
+    PARSE_CACHE: t.Optional[LRUCache] = None
+    """
+    An optional LRU cache that memoizes the syntax trees produced by `Dialect.parse` and `Dialect.parse_into`.
+
+    Setting it on `Dialect` enables it for every dialect, whereas setting it on a subclass only affects that
+    dialect. Entries are keyed by the SQL text, the dialect's settings and the parser options, and callers
+    always receive fresh copies of the cached trees, so they're free to mutate them.
+
+    Example:
+        >>> from sqlglot.helper import LRUCache
+        >>> Dialect.PARSE_CACHE = LRUCache(maxsize=10_000)  # doctest: +SKIP
+    """
+
     @classmethod
     def get_or_raise(cls, dialect: DialectType) -> Dialect:
         """
@@ -1160,15 +1175,163 @@ class Dialect(metaclass=_Dialect):
         return path
 
     def parse(self, sql: str, **opts) -> t.List[t.Optional[exp.Expression]]:
-        return self.parser(**opts).parse(self.tokenize(sql), sql)
+        return self._parse(None, sql, **opts)
 
     def parse_into(
         self, expression_type: exp.IntoType, sql: str, **opts
     ) -> t.List[t.Optional[exp.Expression]]:
-        return self.parser(**opts).parse_into(expression_type, self.tokenize(sql), sql)
+        return self._parse(expression_type, sql, **opts)
+
+    def parse_iter(
+        self, sql: str | t.TextIO, chunk_size: int = 1 << 20, **opts
+    ) -> t.Iterator[t.Optional[exp.Expression]]:
+        """
+        Lazily parses a (potentially huge) multi-statement SQL script, yielding one syntax tree
+        per statement as soon as its terminating semicolon has been tokenized.
+
+        The input is consumed in chunks of roughly `chunk_size` characters, so only the tokens of
+        the current chunk are held in memory. A statement that spans multiple chunks is carried
+        over and re-tokenized once more input is available.
 
-    def generate(self, expression: exp.Expression, copy: bool = True, **opts) -> str:
-        return self.generator(**opts).generate(expression, copy=copy)
+        Args:
+            sql: the SQL code string, or a text file object to read it from.
+            chunk_size: the number of characters to read from `sql` at a time.
+            **opts: other `sqlglot.parser.Parser` options.
+
+        Returns:
+            An iterator over the syntax trees, one per parsed SQL statement.
+        """
+        if isinstance(sql, str):
+            text = sql
+            chunks: t.Iterator[str] = (
+                text[i : i + chunk_size] for i in range(0, len(text), chunk_size)
+            )
+        else:
+            file = sql
+            chunks = iter(lambda: file.read(chunk_size), "")
+
+        tokenizer = self.tokenizer()
+        parser = self.parser(**opts)
+
+        buffer = ""
+        # The position of the buffer in the input: the lines and characters before it, as well as
+        # the characters between its start and the start of its first line
+        line_offset = 0
+        char_offset = 0
+        col_offset = 0
+        # The size the buffer has to reach before it's tokenized again after an attempt that didn't
+        # yield any statement, so that a long statement or an early error isn't re-tokenized on
+        # every chunk, which would take quadratic time
+        retry_size = 0
+        exhausted = False
+
+        while not exhausted:
+            chunk = next(chunks, None)
+            if chunk is None:
+                exhausted = True
+            else:
+                buffer += chunk
+                if len(buffer) < retry_size:
+                    continue
+
+            try:
+                tokens = tokenizer.tokenize(buffer)
+            except TokenError:
+                # The error may be caused by a string or a comment that continues in the next chunk
+                if exhausted:
+                    raise
+                retry_size = 2 * len(buffer)
+                continue
+
+            if line_offset:
+                for token in tokens:
+                    token.line += line_offset
+
+            end = len(tokens) if exhausted else 0
+            consumed = 0
+
+            # The last token may be cut off by the chunk boundary, so a semicolon is only a safe cut
+            # point once a complete token follows it. We also need to make sure that the comments
+            # between it and the next token stay attached to the same token after the cut
+            for i in range(-1 if exhausted else len(tokens) - 3, -1, -1):
+                semicolon = tokens[i]
+                if semicolon.token_type != TokenType.SEMICOLON:
+                    continue
+
+                if not semicolon.comments:
+                    end, consumed = i + 1, semicolon.end + 1
+                    break
+                if not tokens[i + 1].comments:
+                    end, consumed = i + 1, tokens[i + 1].start
+                    break
+
+            start = 0
+            for i in range(end):
+                if tokens[i].token_type == TokenType.SEMICOLON or i == end - 1:
+                    # The tokens are parsed against the buffer, so their positions are only made
+                    # relative to the input in the resulting trees
+                    for expression in parser.parse(tokens[start : i + 1], buffer):
+                        if expression and char_offset:
+                            _shift_positions(expression, line_offset + 1, char_offset, col_offset)
+                        yield expression
+                    start = i + 1
+
+            if not consumed:
+                retry_size = 2 * len(buffer)
+                continue
+
+            retry_size = 0
+            newlines = buffer.count("\n", 0, consumed)
+            if newlines:
+                col_offset = consumed - buffer.rfind("\n", 0, consumed) - 1
+            else:
+                col_offset += consumed
+            line_offset += newlines
+            char_offset += consumed
+            buffer = buffer[consumed:]
+
+    def _parse(
+        self, expression_type: t.Optional[exp.IntoType], sql: str, **opts
+    ) -> t.List[t.Optional[exp.Expression]]:
+        cache = self.PARSE_CACHE
+        key = None
+
+        if cache is not None:
+            key = (
+                type(self),
+                self.version,
+                self.normalization_strategy,
+                tuple(sorted(self.settings.items())),
+                tuple(ensure_list(expression_type)),
+                tuple(sorted(opts.items())),
+                sql,
+            )
+
+            cached = cache.get(key)
+            if cached is not None:
+                return [expression.copy() if expression else None for expression in cached]
+
+        tokenizer = self.tokenizer()
+        tokens = tokenizer.tokenize(sql)
+        parser = self.parser(**opts)
+
+        if expression_type:
+            expressions = parser.parse_into(expression_type, tokens, sql, tokenizer.semicolons)
+        else:
+            expressions = parser.parse(tokens, sql, tokenizer.semicolons)
+
+        # Trees that were produced alongside (logged or ignored) errors are not worth memoizing
+        if cache is not None and not parser.errors:
+            cache.put(
+                key, [expression.copy() if expression else None for expression in expressions]
+            )
+
+        return expressions
+
+    def generate(
+        self, expression: exp.Expression, copy: bool = True, copy_on_write: bool = False, **opts
+    ) -> str:
+        return self.generator(**opts).generate(expression, copy=copy, copy_on_write=copy_on_write)
 
     def transpile(self, sql: str, **opts) -> t.List[str]:
         return [
@@ -1201,6 +1364,22 @@ class Dialect(metaclass=_Dialect):
 DialectType = t.Union[str, Dialect, t.Type[Dialect], None]
 
 
+def _shift_positions(
+    expression: exp.Expression, first_line: int, char_offset: int, col_offset: int
+) -> None:
+    # Makes the positions of a tree parsed from a fragment of the input relative to the input,
+    # where the columns of the fragment's first line are preceded by `col_offset` characters
+    for node in expression.walk():
+        meta = node._meta
+        if not meta or meta.get("start") is None:
+            continue
+
+        meta["start"] += char_offset
+        meta["end"] += char_offset
+        if meta.get("line") == first_line and meta.get("col") is not None:
+            meta["col"] += col_offset
+
+
 def rename_func(name: str) -> t.Callable[[Generator, exp.Expression], str]:
     return lambda self, expression: self.func(name, *flatten(expression.args.values()))
 
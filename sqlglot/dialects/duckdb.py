@@ -2619,8 +2619,9 @@ class DuckDB(Dialect):
             if explode_array:
                 # In BigQuery, UNNESTing a nested array leads to explosion of the top-level array & struct
                 # This is transpiled to DDB by transforming "FROM UNNEST(...)" to "FROM (SELECT UNNEST(..., max_depth => 2))"
-                expression.expressions.append(
-                    exp.Kwarg(this=exp.var("max_depth"), expression=exp.Literal.number(2))
+                expression.append(
+                    "expressions",
+                    exp.Kwarg(this=exp.var("max_depth"), expression=exp.Literal.number(2)),
                 )
 
                 # If BQ's UNNEST is aliased, we transform it from a column alias to a table alias in DDB
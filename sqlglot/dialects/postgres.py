@@ -121,7 +121,7 @@ def _auto_increment_to_serial(expression: exp.Expression) -> exp.Expression:
     auto = expression.find(exp.AutoIncrementColumnConstraint)
 
     if auto:
-        expression.args["constraints"].remove(auto.parent)
+        auto.parent.pop()  # type: ignore
         kind = expression.args["kind"]
 
         if kind.this == exp.DataType.Type.INT:
@@ -82,7 +82,7 @@ def _schema_sql(self: Presto.Generator, expression: exp.Schema) -> str:
 
             column_defs = schema.find_all(exp.ColumnDef)
             if column_defs and isinstance(schema.parent, exp.Property):
-                expression.expressions.extend(column_defs)
+                expression.set("expressions", [*expression.expressions, *column_defs])
 
     return self.schema_sql(expression)
 
@@ -49,7 +49,7 @@ def _transform_create(expression: exp.Expression) -> exp.Expression:
             column.append(
                 "constraints", exp.ColumnConstraint(kind=exp.PrimaryKeyColumnConstraint())
             )
-            schema.expressions.remove(primary_key)
+            primary_key.pop()
         else:
             for column in defs.values():
                 auto_increment = None
@@ -59,7 +59,7 @@ def _transform_create(expression: exp.Expression) -> exp.Expression:
                     if isinstance(constraint.kind, exp.AutoIncrementColumnConstraint):
                         auto_increment = constraint
                 if auto_increment:
-                    column.constraints.remove(auto_increment)
+                    auto_increment.pop()
 
     return expression
 
@@ -43,6 +43,10 @@ class ParseError(SqlglotError):
         super().__init__(message)
         self.errors = errors or []
 
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        # Preserve the structured errors when the exception crosses process boundaries
+        return (self.__class__, (*self.args, self.errors))
+
     @classmethod
     def new(
         cls,
@@ -13,6 +13,7 @@ import typing as t
 from sqlglot import exp
 from sqlglot.errors import ExecuteError
 from sqlglot.executor.python import PythonExecutor
+from sqlglot.executor.streaming import StreamingExecutor
 from sqlglot.executor.table import Table, ensure_tables
 from sqlglot.helper import dict_depth
 from sqlglot.optimizer import optimize
@@ -33,6 +34,10 @@ def execute(
     schema: t.Optional[t.Dict | Schema] = None,
     dialect: DialectType = None,
     tables: t.Optional[t.Dict] = None,
+    vectorized: bool = False,
+    codegen: bool = False,
+    memory_budget: t.Optional[int] = None,
+    streaming: bool = False,
 ) -> Table:
     """
     Run a sql query against data.
@@ -46,6 +51,21 @@ def execute(
             3. {catalog: {db: {table: {col: type}}}}
         dialect: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
         tables: additional tables to register.
+        vectorized: whether to run the query with `sqlglot.executor.vectorized.VectorizedExecutor`,
+            which evaluates its steps over NumPy arrays instead of one row at a time. NumPy must be
+            installed in order to use it.
+        codegen: whether to compile the filter, projections and limit of each scan and join into a
+            single Python function that loops over the rows, instead of evaluating every expression
+            separately for each row.
+        memory_budget: the approximate number of bytes of rows that a join, aggregation, sort or
+            set operation may hold in memory. Those whose rows are estimated to exceed it spill them
+            to temporary files, e.g. sorted runs that are then merged. Queries with a budget are run
+            with `sqlglot.executor.streaming.StreamingExecutor`, so that the steps don't hold their
+            inputs and outputs either. It can't be combined with `vectorized`.
+        streaming: whether to run the query with `sqlglot.executor.streaming.StreamingExecutor`,
+            which pulls batches of rows through the steps instead of materializing each of them, so
+            that e.g. a LIMIT stops the work of the steps it depends on early. The order of the
+            rows is only guaranteed by an ORDER BY. It can't be combined with `vectorized`.
 
     Returns:
         Simple columnar data structure.
@@ -69,6 +89,11 @@ def execute(
 
     schema = ensure_schema(schema, dialect=dialect)
 
+    if vectorized and streaming:
+        raise ExecuteError("Vectorized and streaming execution can't be combined")
+    if vectorized and memory_budget is not None:
+        raise ExecuteError("Vectorized execution can't be combined with a memory budget")
+
     if tables_.supported_table_args and tables_.supported_table_args != schema.supported_table_args:
         raise ExecuteError("Tables must support the same table args as schema")
 
@@ -83,7 +108,16 @@ def execute(
     logger.debug("Logical Plan: %s", plan)
 
     now = time.time()
-    result = PythonExecutor(tables=tables_).execute(plan)
+    if vectorized:
+        from sqlglot.executor.vectorized import VectorizedExecutor
+
+        executor: PythonExecutor = VectorizedExecutor(tables=tables_, codegen=codegen)
+    elif streaming or memory_budget is not None:
+        executor = StreamingExecutor(tables=tables_, codegen=codegen, memory_budget=memory_budget)
+    else:
+        executor = PythonExecutor(tables=tables_, codegen=codegen)
+
+    result = executor.execute(plan)
 
     logger.debug("Query finished: %f", time.time() - now)
 
@@ -0,0 +1,254 @@
+"""
+Hash aggregation for the executor.
+
+`HashAggregate` groups rows by a key in a dictionary and folds each row into the states of its
+accumulators, so computing a GROUP BY takes a single pass over its input instead of a sort. The
+rows can be fed in any number of batches, and the partial aggregates computed separately, e.g. per
+partition of the input, can be merged before they're finalized.
+
+Example:
+    >>> aggregate = HashAggregate(1, [Sum(1), Count(1)])
+    >>> aggregate.update([("a", 1), ("b", 2)])
+    >>> other = HashAggregate(1, [Sum(1), Count(1)])
+    >>> other.update([("a", 3), ("a", None)])
+    >>> aggregate.merge(other)
+    >>> {key: aggregate.finalize(states) for key, states in aggregate.groups.items()}
+    {('a',): [4, 2], ('b',): [2, 1]}
+"""
+
+from __future__ import annotations
+
+import math
+import typing as t
+
+from sqlglot import exp
+
+
+class Accumulator:
+    """
+    Computes an aggregate incrementally from the values at `index` in each row of a group.
+
+    The accumulators mirror the corresponding functions of the executor's environment, e.g. `SUM`
+    ignores nulls and returns None if there are no values.
+    """
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def initial(self) -> t.Any:
+        """Returns the state of an empty group."""
+        return None
+
+    def update(self, state: t.Any, row: t.Tuple) -> t.Any:
+        """Returns the state after folding a row into it."""
+        raise NotImplementedError
+
+    def merge(self, state: t.Any, other: t.Any) -> t.Any:
+        """Returns the state that combines two states, `other` holding the rows after `state`."""
+        raise NotImplementedError
+
+    def finalize(self, state: t.Any) -> t.Any:
+        """Returns the value of the aggregate."""
+        return state
+
+
+class Sum(Accumulator):
+    def update(self, state: t.Any, row: t.Tuple) -> t.Any:
+        value = row[self.index]
+        if value is None:
+            return state
+        return (0 if state is None else state) + value
+
+    def merge(self, state: t.Any, other: t.Any) -> t.Any:
+        if state is None:
+            return other
+        if other is None:
+            return state
+        return state + other
+
+
+class Count(Accumulator):
+    def initial(self) -> int:
+        return 0
+
+    def update(self, state: int, row: t.Tuple) -> int:
+        return state if row[self.index] is None else state + 1
+
+    def merge(self, state: int, other: int) -> int:
+        return state + other
+
+
+class Max(Accumulator):
+    def update(self, state: t.Any, row: t.Tuple) -> t.Any:
+        return self.merge(state, row[self.index])
+
+    def merge(self, state: t.Any, other: t.Any) -> t.Any:
+        # Like max, the first of several equal values is kept
+        if other is None or (state is not None and not other > state):
+            return state
+        return other
+
+
+class Min(Accumulator):
+    def update(self, state: t.Any, row: t.Tuple) -> t.Any:
+        return self.merge(state, row[self.index])
+
+    def merge(self, state: t.Any, other: t.Any) -> t.Any:
+        if other is None or (state is not None and not other < state):
+            return state
+        return other
+
+
+class Avg(Accumulator):
+    """
+    Averages the values like `statistics.fmean`, i.e. their sum is exact before it's divided.
+
+    The state is the number of values, the non-overlapping partial sums of the finite values and
+    the infinite or NaN values, whose sum `math.fsum` computes separately.
+    """
+
+    def update(self, state: t.Any, row: t.Tuple) -> t.Any:
+        value = row[self.index]
+        if value is None:
+            return state
+        if state is None:
+            state = [0, [], []]
+
+        # fsum converts the value the same way, e.g. it rejects strings unlike float
+        value = value if type(value) is float else math.fsum((value,))
+        state[0] += 1
+
+        if math.isfinite(value):
+            _add_partial(state[1], value)
+        else:
+            state[2].append(value)
+
+        return state
+
+    def merge(self, state: t.Any, other: t.Any) -> t.Any:
+        if state is None:
+            return other
+        if other is not None:
+            state[0] += other[0]
+            for partial in other[1]:
+                _add_partial(state[1], partial)
+            state[2].extend(other[2])
+        return state
+
+    def finalize(self, state: t.Any) -> t.Any:
+        if state is None:
+            return None
+        count, partials, specials = state
+        return math.fsum(partials + specials) / count
+
+
+class Collect(Accumulator):
+    """
+    Collects the values at `indices` in each row and passes them to `function` as one list per
+    index, which is used for the aggregates that can't be computed incrementally.
+    """
+
+    def __init__(self, indices: t.Sequence[int], function: t.Callable) -> None:
+        super().__init__(-1)
+        self.indices = indices
+        self.function = function
+
+    def initial(self) -> t.List:
+        return []
+
+    def update(self, state: t.List, row: t.Tuple) -> t.List:
+        state.append(row)
+        return state
+
+    def merge(self, state: t.List, other: t.List) -> t.List:
+        state.extend(other)
+        return state
+
+    def finalize(self, state: t.List) -> t.Any:
+        return self.function(*([row[index] for row in state] for index in self.indices))
+
+
+ACCUMULATORS: t.Dict[t.Type[exp.AggFunc], t.Type[Accumulator]] = {
+    exp.Avg: Avg,
+    exp.Count: Count,
+    exp.Max: Max,
+    exp.Min: Min,
+    exp.Sum: Sum,
+}
+"""The aggregate functions that are computed incrementally, if they only have a column argument."""
+
+
+class HashAggregate:
+    """
+    Groups rows by their first `key_width` values and maintains the states of the accumulators
+    for each group.
+
+    Args:
+        key_width: the number of values at the start of each row that make up its group's key.
+        accumulators: the accumulators that compute the aggregates of each group.
+    """
+
+    def __init__(self, key_width: int, accumulators: t.Sequence[Accumulator]) -> None:
+        self.key_width = key_width
+        self.accumulators = tuple(accumulators)
+        self.groups: t.Dict[t.Tuple, t.List] = {}
+
+    def update(self, rows: t.Iterable[t.Tuple]) -> None:
+        """Folds a batch of rows into the states of their groups."""
+        groups = self.groups
+        width = self.key_width
+        initial = [accumulator.initial for accumulator in self.accumulators]
+        updates = tuple(enumerate(accumulator.update for accumulator in self.accumulators))
+
+        for row in rows:
+            key = row[:width]
+            states = groups.get(key)
+
+            if states is None:
+                states = groups[key] = [init() for init in initial]
+
+            for i, update in updates:
+                states[i] = update(states[i], row)
+
+    def merge(self, other: HashAggregate) -> None:
+        """Merges the groups of another aggregate over the rows that follow this one's."""
+        for key, states in other.groups.items():
+            current = self.groups.get(key)
+
+            if current is None:
+                self.groups[key] = list(states)
+            else:
+                for i, accumulator in enumerate(self.accumulators):
+                    current[i] = accumulator.merge(current[i], states[i])
+
+    def group(self, key: t.Tuple) -> t.List:
+        """Returns the states of a group, which is added if it doesn't exist."""
+        states = self.groups.get(key)
+        if states is None:
+            states = self.groups[key] = [accumulator.initial() for accumulator in self.accumulators]
+        return states
+
+    def finalize(self, states: t.List) -> t.List:
+        """Returns the values of the aggregates of a group."""
+        return [
+            accumulator.finalize(state) for accumulator, state in zip(self.accumulators, states)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+
+def _add_partial(partials: t.List[float], value: float) -> None:
+    # Shewchuk's algorithm, which math.fsum is based on: the partials are kept non-overlapping
+    # and sum exactly to the values added so far
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
@@ -1,10 +1,12 @@
 import collections
+import heapq
 import itertools
 import math
 
 from sqlglot import exp, generator, planner, tokens
 from sqlglot.dialects.dialect import Dialect, inline_array_sql
 from sqlglot.errors import ExecuteError
+from sqlglot.executor.aggregate import ACCUMULATORS, Collect, HashAggregate
 from sqlglot.executor.context import Context
 from sqlglot.executor.env import ENV
 from sqlglot.executor.table import RowReader, Table
@@ -12,10 +14,11 @@ from sqlglot.helper import subclasses
 
 
 class PythonExecutor:
-    def __init__(self, env=None, tables=None):
+    def __init__(self, env=None, tables=None, codegen=False):
         self.generator = Python().generator(identify=True, comments=False)
         self.env = {**ENV, **(env or {})}
         self.tables = tables or {}
+        self.codegen = codegen
 
     def execute(self, plan):
         finished = set()
@@ -75,6 +78,58 @@ class PythonExecutor:
             return tuple()
         return tuple(self.generate(expression) for expression in expressions)
 
+    def compile_step(self, context, rows, condition=None, projections=None, limit=math.inf):
+        """
+        Convert a filter, projections and a limit over the rows of a context into a single Python
+        function, which loops over the rows and accesses their columns by position.
+
+        Returns None if a column can't be resolved to a position in the rows, in which case the
+        expressions should be evaluated per row instead.
+        """
+        positions = {}
+        for name, table in context.tables.items():
+            if table.rows is rows:
+                positions[name] = table.reader.columns
+
+        def to_position(node):
+            if isinstance(node, exp.Column):
+                position = positions.get(node.table or None, {}).get(node.name)
+                if position is None:
+                    raise KeyError(node.sql())
+                return exp.var(f"row[{position}]")
+            return node
+
+        try:
+            lines = [
+                "def step(rows):",
+                "    sink = []",
+                "    append = sink.append",
+                "    for row in rows:",
+            ]
+
+            if not math.isinf(limit):
+                lines.append(f"        if len(sink) >= {limit}: break")
+            if condition:
+                condition = self.generator.generate(condition.transform(to_position))
+                lines.append(f"        if not ({condition}): continue")
+            if projections:
+                values = "".join(
+                    f"{self.generator.generate(projection.transform(to_position))}, "
+                    for projection in projections
+                )
+                lines.append(f"        append(({values}))")
+            else:
+                lines.append("        append(row)")
+
+            lines.append("    return sink")
+
+            namespace = {}
+            exec(compile("\n".join(lines), "<step>", "exec", optimize=2), self.env, namespace)
+        except (KeyError, SyntaxError):
+            return None
+
+        return namespace["step"]
+
     def context(self, tables):
         return Context(tables, env=self.env)
 
@@ -92,17 +147,29 @@ class PythonExecutor:
 
         if source is None:
             context, table_iter = self.static()
+            rows = [()]
         elif source in context:
             if not step.projections and not step.condition:
                 return self.context({step.name: context.tables[source]})
             table_iter = context.table_iter(source)
+            rows = context.tables[source].rows
         else:
             context, table_iter = self.scan_table(step)
+            rows = context.table.rows
 
-        return self.context({step.name: self._project_and_filter(context, step, table_iter)})
+        return self.context({step.name: self._project_and_filter(context, step, table_iter, rows)})
 
-    def _project_and_filter(self, context, step, table_iter):
+    def _project_and_filter(self, context, step, table_iter, rows=None):
         sink = self.table(step.projections if step.projections else context.columns)
+
+        if self.codegen and rows is not None:
+            function = self.compile_step(
+                context, rows, step.condition, step.projections, step.limit
+            )
+            if function:
+                sink.rows = function(rows)
+                return sink
+
         condition = self.generate(step.condition)
         projections = self.generate_tuple(step.projections)
 
@@ -152,9 +219,18 @@ class PythonExecutor:
                     for name, column_range in column_ranges.items()
                 }
             )
-            condition = self.generate(join["condition"])
-            if condition:
-                source_context.filter(condition)
+            condition = join["condition"]
+            function = (
+                self.codegen
+                and condition
+                and self.compile_step(source_context, table.rows, condition)
+            )
+            if function:
+                rows = function(table.rows)
+                for name in column_ranges:
+                    source_context.tables[name].rows = rows
+            elif condition:
+                source_context.filter(self.generate(condition))
 
         if not step.condition and not step.projections:
             return source_context
@@ -163,6 +239,7 @@ class PythonExecutor:
             source_context,
             step,
             (reader for reader, _ in iter(source_context)),
+            source_context.table.rows,
         )
 
         if step.projections:
@@ -212,6 +289,152 @@ class PythonExecutor:
         return table
 
     def aggregate(self, step, context):
+        if self.requires_sort_aggregate(step):
+            return self.sort_aggregate(step, context)
+        return self.hash_aggregate(step, context)
+
+    def requires_sort_aggregate(self, step):
+        """
+        Whether an aggregation step must be computed over sorted groups: the aggregates that depend
+        on the order of the rows are, as are the expressions that reference columns outside of
+        aggregate functions.
+        """
+        return any(
+            aggregation.find(exp.Order, exp.WithinGroup)
+            or any(
+                isinstance(node, exp.Column)
+                for node in aggregation.walk(prune=lambda n: isinstance(n, exp.AggFunc))
+            )
+            for aggregation in step.aggregations
+        )
+
+    def aggregator(self, step):
+        """
+        Returns the expressions whose values make up the rows that an aggregation step folds into
+        its groups, i.e. the groups' keys followed by the aggregates' inputs, the accumulators of
+        the aggregates and the finalizers that compute each aggregation from their values.
+        """
+        operands = {operand.alias: operand for operand in step.operands}
+        # Each row that's aggregated holds the group's key, followed by the aggregates' inputs
+        expressions = list(step.group.values())
+        inputs = {}
+
+        def input_index(expression):
+            if not isinstance(expression, exp.Column):
+                key = expression
+            else:
+                key = (expression.table or None, expression.name)
+                expression = operands.get(expression.name, expression)
+
+            index = inputs.get(key)
+
+            if index is None:
+                index = inputs[key] = len(expressions)
+                expressions.append(expression)
+
+            return index
+
+        accumulators = []
+        finalizers = []
+
+        for aggregation in step.aggregations:
+            aggregation = aggregation.unalias().copy()
+            funcs = [
+                node
+                for node in aggregation.walk(prune=lambda n: isinstance(n, exp.AggFunc))
+                if isinstance(node, exp.AggFunc)
+            ]
+            start = len(accumulators)
+
+            for func in funcs:
+                accumulators.append(self.accumulator(func, input_index))
+
+            if aggregation is funcs[0]:
+                finalizers.append((start, len(funcs), None))
+            else:
+                for i, func in enumerate(funcs):
+                    func.replace(exp.var(f"_v{i}"))
+
+                args = ", ".join(f"_v{i}" for i in range(len(funcs)))
+                code = f"lambda {args}: {self.generator.generate(aggregation)}"
+                finalizers.append((start, len(funcs), eval(code, self.env)))
+
+        return expressions, accumulators, finalizers
+
+    def hash_aggregate(self, step, context):
+        expressions, accumulators, finalizers = self.aggregator(step)
+        function = self.codegen and self.compile_step(
+            context, context.table.rows, projections=expressions
+        )
+
+        if function:
+            rows = function(context.table.rows)
+        else:
+            codes = self.generate_tuple(expressions)
+            rows = (ctx.eval_tuple(codes) for _, ctx in context)
+
+        table = self.table(list(step.group) + step.aggregations)
+        hash_aggregate = HashAggregate(len(step.group), accumulators)
+        hash_aggregate.update(rows)
+        table.rows = list(self.aggregate_groups(step, hash_aggregate, finalizers))
+
+        context = self.context({step.name: table, **{name: table for name in context.tables}})
+
+        if step.projections or step.condition:
+            return self.scan(step, context)
+        return context
+
+    def aggregate_groups(self, step, hash_aggregate, finalizers):
+        """Yields the rows of a hash aggregate's groups, sorted by their keys, up to the limit."""
+        if not hash_aggregate and not hash_aggregate.key_width and step.limit > 0:
+            hash_aggregate.group(())
+
+        # The groups are sorted by their keys, like the groups of sort_aggregate
+        if math.isinf(step.limit):
+            keys = sorted(hash_aggregate.groups, key=_group_key)
+        else:
+            keys = heapq.nsmallest(step.limit, hash_aggregate.groups, key=_group_key)
+
+        for key in keys:
+            values = hash_aggregate.finalize(hash_aggregate.groups[key])
+            yield key + tuple(
+                values[start] if finalize is None else finalize(*values[start : start + count])
+                for start, count, finalize in finalizers
+            )
+
+    def accumulator(self, func, input_index):
+        """
+        Returns the accumulator that computes an aggregate function for each group, given a
+        function that returns the position of an expression's value in the rows being aggregated.
+        """
+        accumulator = ACCUMULATORS.get(type(func))
+        name = func.key.upper()
+        operand = func.this
+
+        if (
+            accumulator
+            and (
+                isinstance(operand, exp.Column)
+                # COUNT(*) and COUNT(<literal>) count every row, since their operand is never null
+                or (isinstance(func, exp.Count) and isinstance(operand, (exp.Star, exp.Literal)))
+            )
+            # COUNT's big_int flag only affects the type of its result
+            and not any(value for key, value in func.args.items() if key not in ("this", "big_int"))
+            and self.env.get(name) is ENV.get(name)
+        ):
+            return accumulator(input_index(operand))
+
+        func = func.copy()
+        columns = {}
+
+        for column in list(func.find_all(exp.Column)):
+            index = input_index(column)
+            column.replace(exp.var(columns.setdefault(index, f"_c{len(columns)}")))
+
+        code = f"lambda {', '.join(columns.values())}: {self.generator.generate(func)}"
+        return Collect(list(columns), eval(code, self.env))
+
+    def sort_aggregate(self, step, context):
         group_by = self.generate_tuple(step.group.values())
         aggregations = self.generate_tuple(step.aggregations)
         operands = self.generate_tuple(step.operands)
@@ -324,6 +547,10 @@ class PythonExecutor:
         return self.context({step.name: sink})
 
 
+def _group_key(key):
+    return tuple((value is None, value) for value in key)
+
+
 def _ordered_py(self, expression):
     this = self.sql(expression, "this")
     desc = "True" if expression.args.get("desc") else "False"
@@ -0,0 +1,225 @@
+"""
+Spilling rows to temporary files, which lets the executor's operators run within a memory budget.
+
+Rows are appended to a `SpillFile` in pickled batches and read back in the same order. An operator
+reads its rows with `buffer` until they exceed its budget, and if they do, it either sorts them
+with `external_sort`, which spills sorted runs and merges them, or splits them into files with
+`split`, so that each partition can be processed in memory on its own, e.g. by a grace hash join.
+
+Example:
+    >>> rows = [(3, "c"), (1, "a"), (2, "b"), (1, "d")]
+    >>> list(external_sort(rows, key=lambda row: row[0], budget=1))
+    [(1, 'a'), (1, 'd'), (2, 'b'), (3, 'c')]
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import pickle
+import sys
+import tempfile
+import typing as t
+
+BATCH_SIZE = 1024
+"""The number of rows that are pickled together."""
+SAMPLE_SIZE = 100
+"""The number of rows whose sizes are measured in order to estimate the size of all of them."""
+MAX_PARTITIONS = 256
+"""The maximum number of files that rows are partitioned into."""
+MAX_RUNS = 64
+"""The maximum number of sorted runs that are kept before they're merged into a single one."""
+
+
+class SpillFile:
+    """
+    A temporary file that rows are appended to and then read back in order, possibly by several
+    readers at once.
+    """
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        self.file = tempfile.TemporaryFile(buffering=0)
+        self.batch_size = batch_size
+        self.buffer: t.List = []
+        self.count = 0
+
+    def append(self, row: t.Any) -> None:
+        self.buffer.append(row)
+        self.count += 1
+
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, rows: t.Iterable) -> None:
+        for row in rows:
+            self.append(row)
+
+    def flush(self) -> None:
+        if self.buffer:
+            self.file.seek(0, 2)
+            pickle.dump(self.buffer, self.file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.buffer = []
+
+    def close(self) -> None:
+        self.file.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> t.Iterator:
+        self.flush()
+        # Each reader keeps track of its own position, since others may move the file's in between
+        position = 0
+
+        while True:
+            self.file.seek(position)
+            try:
+                batch = pickle.load(self.file)
+            except EOFError:
+                return
+            position = self.file.tell()
+            yield from batch
+
+
+def value_size(value: t.Any) -> int:
+    """Returns the number of bytes held by a value, including the items of tuples and lists."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(value_size(item) for item in value)
+    return size
+
+
+class SizeEstimate:
+    """Estimates the number of bytes held by rows as they're counted, from the first of them."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sampled = 0
+        self.sampled_size = 0
+
+    def add(self, row: t.Any) -> None:
+        self.count += 1
+
+        if self.sampled < SAMPLE_SIZE:
+            self.sampled += 1
+            self.sampled_size += value_size(row)
+
+    @property
+    def size(self) -> int:
+        return self.count * self.sampled_size // max(self.sampled, 1)
+
+    def capacity(self, budget: int) -> int:
+        """Returns the number of rows that fit in a budget."""
+        return max(1, budget * self.sampled // max(self.sampled_size, 1))
+
+
+def partition_count(size: int, budget: int) -> int:
+    """Returns the number of partitions that rows of the given size should be split into."""
+    return max(2, min(MAX_PARTITIONS, math.ceil(2 * size / max(budget, 1))))
+
+
+def partition(
+    rows: t.Iterable, key: t.Callable[[t.Any], t.Hashable], count: int
+) -> t.List[SpillFile]:
+    """
+    Splits rows into files by the hashes of their keys, so that the rows with equal keys end up in
+    the same file, in their original order.
+    """
+    # The files hold a batch each until it's flushed, so the more files, the smaller the batches
+    files = [SpillFile(max(1, BATCH_SIZE // count)) for _ in range(count)]
+
+    try:
+        for row in rows:
+            files[hash(key(row)) % count].append(row)
+    except BaseException:
+        close(files)
+        raise
+
+    return files
+
+
+def split(rows: t.Iterable, key: t.Callable[[t.Any], t.Hashable], budget: int) -> t.List[SpillFile]:
+    """
+    Splits rows into files like `partition`, as many as needed for each of them to fit in the
+    budget. The rows are spilled to a single file first, in order to estimate their size.
+    """
+    file = SpillFile()
+    estimate = SizeEstimate()
+
+    try:
+        for row in rows:
+            file.append(row)
+            estimate.add(row)
+
+        return partition(file, key, partition_count(estimate.size, budget))
+    finally:
+        file.close()
+
+
+def buffer(rows: t.Iterable, budget: int) -> t.Tuple[t.List, t.Optional[t.Iterator]]:
+    """
+    Reads rows into a list until they're estimated to exceed the budget, and returns it along with
+    the iterator of the rows that are left, or None if all of them fit in the budget.
+    """
+    rows = iter(rows)
+    buffered = []
+    estimate = SizeEstimate()
+
+    for row in rows:
+        buffered.append(row)
+        estimate.add(row)
+
+        if estimate.size > budget:
+            return buffered, rows
+
+    return buffered, None
+
+
+def close(files: t.Iterable[SpillFile]) -> None:
+    for file in files:
+        file.close()
+
+
+def external_sort(rows: t.Iterable, key: t.Callable[[t.Any], t.Any], budget: int) -> t.Iterator:
+    """
+    Sorts rows like `sorted`, which is stable, while holding roughly at most `budget` bytes of them
+    in memory. Sorted runs are spilled whenever the budget is exceeded and then merged.
+    """
+    runs: t.List[SpillFile] = []
+    buffered: t.List = []
+    # The number of rows that fit in the budget is estimated from the sizes of the first rows
+    estimate = SizeEstimate()
+
+    try:
+        for row in rows:
+            buffered.append(row)
+            estimate.add(row)
+
+            capacity = estimate.capacity(budget)
+
+            if len(buffered) >= capacity:
+                # The merge reads a batch of each run at a time, so they fit in the budget together
+                batch_size = min(BATCH_SIZE, max(1, capacity // MAX_RUNS))
+
+                buffered.sort(key=key)
+                runs.append(_spill(buffered, batch_size))
+                buffered = []
+
+                if len(runs) >= MAX_RUNS:
+                    merged = _spill(heapq.merge(*runs, key=key), batch_size)
+                    close(runs)
+                    runs = [merged]
+
+        buffered.sort(key=key)
+
+        # heapq.merge takes equal rows from the earlier runs first, so the merge is stable too
+        yield from heapq.merge(*runs, buffered, key=key) if runs else buffered
+    finally:
+        close(runs)
+
+
+def _spill(rows: t.Iterable, batch_size: int) -> SpillFile:
+    file = SpillFile(batch_size)
+    file.extend(rows)
+    file.flush()
+    return file
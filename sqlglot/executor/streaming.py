@@ -0,0 +1,694 @@
+"""
+## Streaming execution
+
+`StreamingExecutor` runs the same plans as `sqlglot.executor.python.PythonExecutor`, but instead of
+materializing every step into a `Table` before the steps that depend on it run, it turns each step
+into a generator of batches of rows, which pulls batches from the steps it depends on only when its
+own consumer asks for more rows.
+
+Steps that don't need all of their input stop pulling it as soon as they're done, so the work of
+the steps they depend on stops too: a LIMIT only computes the batches it needs, an uncorrelated
+EXISTS only looks for the first row of its subquery and the semi-joins that subqueries are unnested
+into probe their grouped side one batch at a time. Scans, filters, projections, the probe side of
+joins and UNION ALL hold a single batch at a time, so their memory tracks the size of the batches
+rather than that of the tables. Only the steps that are blocking by nature hold more: the build
+side of a join, the groups of an aggregation, the rows of a sort, or only the top rows if there's a
+LIMIT, the rows seen by a distinct set operation and the rows of a step that several others depend
+on. If there's a memory budget, they spill those rows to temporary files once they exceed it:
+joins, aggregations and set operations split them into partitions, by the hashes of their keys,
+that are processed one at a time, and sorts merge sorted runs of them.
+
+The rows of a join are produced in the order of its probe side, and those of a distinct set
+operation in the order they're first seen, so the order of the rows may differ from that of
+`PythonExecutor` when the query doesn't specify it with an ORDER BY.
+
+Example:
+    >>> from sqlglot.executor import execute
+    >>> tables = {"x": [{"a": i} for i in range(1000)], "y": [{"a": 1}, {"a": 3}]}
+    >>> execute("SELECT x.a FROM x JOIN y ON x.a = y.a LIMIT 1", tables=tables, streaming=True).rows
+    [(1,)]
+"""
+
+from __future__ import annotations
+
+import heapq
+import inspect
+import itertools
+import math
+import operator
+import typing as t
+
+from sqlglot import exp, planner
+from sqlglot.errors import ExecuteError
+from sqlglot.executor import spill
+from sqlglot.executor.aggregate import HashAggregate
+from sqlglot.executor.python import PythonExecutor
+from sqlglot.executor.table import Table
+from sqlglot.optimizer.scope import traverse_scope
+
+BATCH_SIZE = 1024
+"""The default number of rows in the batches that are pulled from the tables."""
+
+Batches = t.Iterator[t.List[t.Tuple]]
+Ranges = t.Mapping[t.Optional[str], t.Optional[range]]
+
+
+class Stream:
+    """
+    The output of a step: the generator of its batches of rows, along with their columns and the
+    names of the tables they hold, which map to the ranges of the tables' columns in the rows.
+    """
+
+    def __init__(
+        self,
+        columns: t.Iterable[str],
+        ranges: Ranges,
+        batches: Batches,
+    ) -> None:
+        self.columns = tuple(columns)
+        self.ranges = ranges
+        self.batches = batches
+
+    def table(self, name: t.Optional[str]) -> Table:
+        """Pulls all of the batches and returns them as a table."""
+        rows = [row for batch in self.batches for row in batch]
+        return Table(self.columns, rows, self.ranges.get(name))
+
+
+class StreamingExecutor(PythonExecutor):
+    """
+    Executes plans by pulling batches of rows through their steps.
+
+    Args:
+        env: additional functions for the expressions' environment.
+        tables: the tables that are queried.
+        codegen: whether to compile the filters and projections into Python functions.
+        memory_budget: the approximate number of bytes of rows that a join, aggregation, sort, set
+            operation or shared step may hold in memory before it spills them to temporary files.
+        batch_size: the number of rows in the batches that are pulled from the tables.
+    """
+
+    def __init__(
+        self, env=None, tables=None, codegen=False, memory_budget=None, batch_size=BATCH_SIZE
+    ):
+        super().__init__(env=env, tables=tables, codegen=codegen)
+        self.memory_budget = memory_budget
+        self.batch_size = batch_size
+        self._shared: t.Dict[planner.Step, t.List] = {}
+
+    def execute(self, plan):
+        root = plan.root
+        stream = self.stream(root)
+
+        try:
+            return stream.table(root.name)
+        finally:
+            stream.batches.close()
+            spill.close(
+                rows for _, rows in self._shared.values() if isinstance(rows, spill.SpillFile)
+            )
+            self._shared.clear()
+
+    def stream(self, step: planner.Step) -> Stream:
+        """Returns the stream of a step's rows, which computes them as its batches are pulled."""
+        if len(step.dependents) > 1:
+            return self.shared_stream(step)
+        return self.step_stream(step)
+
+    def step_stream(self, step: planner.Step) -> Stream:
+        try:
+            streams = [self.stream(dependency) for dependency in step.dependencies]
+
+            if isinstance(step, planner.Scan):
+                stream = self.scan_stream(step, streams)
+            elif isinstance(step, planner.Aggregate):
+                stream = self.aggregate_stream(step, streams)
+            elif isinstance(step, planner.Join):
+                stream = self.join_stream(step, streams)
+            elif isinstance(step, planner.Sort):
+                stream = self.sort_stream(step, streams)
+            elif isinstance(step, planner.SetOperation):
+                stream = self.set_operation_stream(step, streams)
+            else:
+                raise NotImplementedError
+        except ExecuteError:
+            raise
+        except Exception as e:
+            raise ExecuteError(f"Step '{step.id}' failed: {e}") from e
+
+        return Stream(stream.columns, stream.ranges, _guard(step, stream.batches))
+
+    def shared_stream(self, step: planner.Step) -> Stream:
+        """
+        Returns the stream of a step that several steps depend on, e.g. a CTE, whose rows are
+        computed once, when any of them first pulls a batch, and then replayed to each of them.
+        """
+        shared = self._shared.get(step)
+
+        if shared is None:
+            shared = self._shared[step] = [self.step_stream(step), None]
+
+        stream = shared[0]
+
+        def batches():
+            if shared[1] is None:
+                rows, rest = self.buffer(stream)
+
+                # The rows are spilled if they exceed the memory budget, and read back by each step
+                if rest is None:
+                    shared[1] = rows
+                else:
+                    shared[1] = spill.SpillFile()
+                    shared[1].extend(itertools.chain(rows, rest))
+                    del rows
+
+            if isinstance(shared[1], list):
+                yield from self.chunks(shared[1])
+            else:
+                yield from _batched(shared[1], self.batch_size)
+
+        return Stream(stream.columns, stream.ranges, batches())
+
+    def buffer(self, stream: Stream) -> t.Tuple[t.List[t.Tuple], t.Optional[t.Iterator[t.Tuple]]]:
+        """
+        Pulls the rows of a stream until they exceed the memory budget, like `spill.buffer`, or all
+        of them if there's no budget.
+        """
+        rows = (row for batch in stream.batches for row in batch)
+
+        if self.memory_budget is None:
+            return list(rows), None
+        return spill.buffer(rows, self.memory_budget)
+
+    def chunks(self, rows: t.List[t.Tuple]) -> Batches:
+        """Yields the batches of a list of rows."""
+        for i in range(0, len(rows), self.batch_size):
+            yield rows[i : i + self.batch_size]
+
+    def pipeline(
+        self,
+        columns: t.Tuple[str, ...],
+        ranges: Ranges,
+        condition: t.Optional[exp.Expression] = None,
+        projections: t.Optional[t.Sequence[exp.Expression]] = None,
+    ) -> t.Callable[..., t.List[t.Tuple]]:
+        """
+        Returns a function that filters a batch of rows, whose columns and tables are laid out as
+        given, keeps at most as many of the remaining ones as the limit it's passed, if any, and
+        evaluates the projections over them, or keeps them as they are if there are no projections.
+        The function is compiled once if codegen is enabled.
+        """
+        condition = condition and self.evaluate_exists(condition)
+        projections = [self.evaluate_exists(projection) for projection in projections or ()]
+
+        if not condition and not projections:
+            return lambda rows, limit=math.inf: rows if len(rows) <= limit else rows[: int(limit)]
+
+        rows: t.List[t.Tuple] = []
+        tables = {name: Table(columns, column_range=r) for name, r in ranges.items()}
+        for table in tables.values():
+            table.rows = rows
+        context = self.context(tables)
+
+        if self.codegen:
+            # The filter and the projections are compiled separately, so that the rows past the
+            # limit are cut before they're projected, as they would be by a single loop
+            filter_rows = self.compile_step(context, rows, condition) if condition else False
+            project_rows = projections and self.compile_step(context, rows, projections=projections)
+
+            if filter_rows is not None and project_rows is not None:
+
+                def run(batch, limit=math.inf):
+                    if filter_rows:
+                        batch = filter_rows(batch)
+                    if len(batch) > limit:
+                        batch = batch[: int(limit)]
+                    return project_rows(batch) if project_rows else batch
+
+                return run
+
+        condition_code = self.generate(condition)
+        projection_codes = self.generate_tuple(projections)
+
+        def evaluate(batch, limit=math.inf):
+            for table in tables.values():
+                table.rows = batch
+
+            sink = []
+            for reader, ctx in context:
+                if len(sink) >= limit:
+                    break
+                if condition_code and not ctx.eval(condition_code):
+                    continue
+                sink.append(ctx.eval_tuple(projection_codes) if projection_codes else reader.row)
+            return sink
+
+        return evaluate
+
+    def evaluate_exists(self, expression: exp.Expression) -> exp.Expression:
+        """
+        Replaces the uncorrelated EXISTS predicates of an expression with their values, which are
+        computed by pulling the batches of their subqueries until one of them has a row.
+        """
+        if not expression.find(exp.Exists):
+            return expression
+
+        def transform(node):
+            if isinstance(node, exp.Exists) and not _is_correlated(node.this):
+                stream = self.stream(planner.Plan(node.this.copy()).root)
+                try:
+                    return exp.Boolean(this=any(stream.batches))
+                finally:
+                    stream.batches.close()
+            return node
+
+        return expression.transform(transform)
+
+    def scan_stream(self, step: planner.Scan, streams: t.List[Stream]) -> Stream:
+        expression = step.source
+        source = (expression.name or expression.alias) if expression else None
+        inputs = {name: stream for stream in streams for name in stream.ranges}
+
+        if expression is None:
+            stream = Stream((), {None: None}, iter([[()]]))
+        elif source in inputs:
+            stream = inputs[source]
+            if not step.projections and not step.condition:
+                return Stream(stream.columns, {step.name: stream.ranges[source]}, stream.batches)
+        else:
+            table = self.tables.find(expression)
+            stream = Stream(
+                table.columns,
+                {expression.alias_or_name: table.column_range},
+                self.chunks(table.rows),
+            )
+
+        return self._project_and_filter_stream(step, stream)
+
+    def _project_and_filter_stream(self, step: planner.Step, stream: Stream) -> Stream:
+        pipeline = self.pipeline(stream.columns, stream.ranges, step.condition, step.projections)
+        columns = self.table(step.projections).columns if step.projections else stream.columns
+        return Stream(columns, {step.name: None}, _limit(stream.batches, step.limit, pipeline))
+
+    def join_stream(self, step: planner.Join, streams: t.List[Stream]) -> Stream:
+        inputs = {name: stream for stream in streams for name in stream.ranges}
+        source_name = step.source_name
+        source = inputs[source_name]
+
+        column_ranges = {source_name: range(0, len(source.columns))}
+        columns = source.columns
+        for name in step.joins:
+            start = max(r.stop for r in column_ranges.values())
+            column_ranges[name] = range(start, start + len(inputs[name].columns))
+            columns += inputs[name].columns
+
+        def batches():
+            # Each join probes the batches of the previous one, or those of the source, which are
+            # pulled once its build side is materialized
+            output = source.batches
+            probe_columns = source.columns
+            probe_ranges = {source_name: source.ranges[source_name]}
+            ranges = {source_name: column_ranges[source_name]}
+
+            for name, join in step.joins.items():
+                ranges[name] = column_ranges[name]
+                output = self.join_batches(
+                    join, name, inputs[name], output, probe_columns, probe_ranges, dict(ranges)
+                )
+                probe_columns += inputs[name].columns
+                probe_ranges = dict(ranges)
+
+            yield from output
+
+        if not step.projections and not step.condition:
+            return Stream(columns, column_ranges, _limit(batches(), step.limit))
+
+        stream = Stream(columns, column_ranges, batches())
+        pipeline = self.pipeline(columns, column_ranges, step.condition, step.projections)
+        output = _limit(stream.batches, step.limit, pipeline)
+
+        if step.projections:
+            return Stream(self.table(step.projections).columns, {step.name: None}, output)
+        return Stream(columns, column_ranges, output)
+
+    def join_batches(
+        self,
+        join: t.Dict[str, t.Any],
+        name: str,
+        build: Stream,
+        batches: Batches,
+        columns: t.Tuple[str, ...],
+        ranges: Ranges,
+        joined_ranges: Ranges,
+    ) -> Batches:
+        """
+        Joins batches of rows, whose columns and tables are laid out as given, to the rows of a
+        join's build side. If they exceed the memory budget, both sides are split into partitions
+        by the hashes of their keys, which are joined one at a time, or, if the join has no keys,
+        the build side is spilled and read back for each batch.
+        """
+        condition = self.pipeline(columns + build.columns, joined_ranges, join["condition"])
+        column_range = build.ranges.get(name)
+        rows, rest = self.buffer(build)
+
+        if rest is None:
+            table = Table(build.columns, rows, column_range)
+
+            if join.get("source_key"):
+                probe, unmatched = self.hash_probe(join, name, table, columns, ranges)
+            else:
+                probe, unmatched = self.nested_loop_probe(table)
+
+            for batch in batches:
+                yield condition(probe(batch))
+
+            # The rows of the build side of a right join that didn't match are only known once the
+            # probe side is exhausted
+            for batch in self.chunks(unmatched()):
+                yield condition(batch)
+            return
+
+        if not join.get("source_key"):
+            file = spill.SpillFile()
+
+            try:
+                file.extend(itertools.chain(rows, rest))
+                for batch in batches:
+                    for chunk in _batched(file, self.batch_size):
+                        yield condition([a_row + b_row for a_row in batch for b_row in chunk])
+            finally:
+                file.close()
+            return
+
+        join_key = self.pipeline(build.columns, {name: column_range}, projections=join["join_key"])
+        source_key = self.pipeline(columns, ranges, projections=join["source_key"])
+        files = spill.split(
+            _keyed(_batched(itertools.chain(rows, rest), self.batch_size), join_key),
+            key=operator.itemgetter(0),
+            budget=self.memory_budget,
+        )
+        del rows
+
+        try:
+            count = len(files)
+            files += spill.partition(
+                _keyed(batches, source_key), key=operator.itemgetter(0), count=count
+            )
+
+            for build_file, probe_file in zip(files[:count], files[count:]):
+                table = Table(build.columns, [row for _, row in build_file], column_range)
+                probe, unmatched = self.hash_probe(join, name, table, columns, ranges)
+
+                for batch in _batched(probe_file, self.batch_size):
+                    yield condition(probe([row for _, row in batch]))
+                for batch in self.chunks(unmatched()):
+                    yield condition(batch)
+        finally:
+            spill.close(files)
+
+    def hash_probe(self, join, name, table, columns, ranges):
+        """
+        Builds a hash table of the rows of a join's table and returns a function that joins a batch
+        of rows to it, along with a function that returns the rows of the table that no row joined
+        to, with nulls in place of the rows' columns, if it's a right join.
+        """
+        left = join.get("side") == "LEFT"
+        right = join.get("side") == "RIGHT"
+        source_key = self.pipeline(columns, ranges, projections=join["source_key"])
+        join_key = self.pipeline(
+            table.columns, {name: table.column_range}, projections=join["join_key"]
+        )
+
+        build: t.Dict[t.Tuple, t.List[t.Tuple]] = {}
+        for key, row in zip(join_key(table.rows), table.rows):
+            build.setdefault(key, []).append(row)
+
+        nulls = (None,) * len(table.columns)
+        matched = set()
+
+        def probe(rows):
+            sink = []
+            for key, row in zip(source_key(rows), rows):
+                group = build.get(key)
+                if group:
+                    if right:
+                        matched.add(key)
+                    sink.extend(row + b_row for b_row in group)
+                elif left:
+                    sink.append(row + nulls)
+            return sink
+
+        def unmatched():
+            if not right:
+                return []
+            source_nulls = (None,) * len(columns)
+            return [
+                source_nulls + b_row
+                for key, group in build.items()
+                if key not in matched
+                for b_row in group
+            ]
+
+        return probe, unmatched
+
+    def nested_loop_probe(self, table):
+        def probe(rows):
+            return [a_row + b_row for a_row in rows for b_row in table.rows]
+
+        return probe, list
+
+    def aggregate_stream(self, step: planner.Aggregate, streams: t.List[Stream]) -> Stream:
+        (stream,) = streams
+        group_columns = self.table(list(step.group) + step.aggregations).columns
+        group_ranges = {step.name: None, **{name: None for name in stream.ranges}}
+
+        def groups():
+            if self.requires_sort_aggregate(step):
+                # The groups are computed over the sorted input, which is materialized, and the
+                # projections and condition are applied to them as well
+                table = stream.table(None)
+                context = self.context(
+                    {name: Table(table.columns, table.rows, r) for name, r in stream.ranges.items()}
+                )
+                context = self.sort_aggregate(step, context)
+                yield from self.chunks(context.tables[step.name].rows)
+                return
+
+            # The batches are folded into the groups as they're pulled, so only the groups are held,
+            # unless there's a memory budget, in which case the rows are held until they exceed it
+            # and then split into partitions, see spilled_groups
+            expressions, accumulators, finalizers = self.aggregator(step)
+            inputs = self.pipeline(stream.columns, stream.ranges, projections=expressions)
+            rows: t.Iterable[t.Tuple] = (row for b in stream.batches for row in inputs(b))
+            rest = None
+
+            if self.memory_budget is not None and step.group:
+                rows, rest = spill.buffer(rows, self.memory_budget)
+
+            if rest is None:
+                hash_aggregate = HashAggregate(len(step.group), accumulators)
+                hash_aggregate.update(rows)
+                groups = self.aggregate_groups(step, hash_aggregate, finalizers)
+            else:
+                groups = self.spilled_groups(
+                    step, itertools.chain(rows, rest), accumulators, finalizers
+                )
+
+            pipeline = self.pipeline(group_columns, group_ranges, step.condition, step.projections)
+            yield from _limit(_batched(groups, self.batch_size), step.limit, pipeline)
+
+        columns = self.table(step.projections).columns if step.projections else group_columns
+        ranges = {step.name: None} if step.projections or step.condition else group_ranges
+        return Stream(columns, ranges, _limit(groups(), step.limit))
+
+    def spilled_groups(
+        self,
+        step: planner.Aggregate,
+        rows: t.Iterable[t.Tuple],
+        accumulators: t.List,
+        finalizers: t.List,
+    ) -> t.Iterator[t.Tuple]:
+        """
+        Yields the rows of the groups of an aggregation like `aggregate_groups`, but splits the rows
+        that are aggregated into partitions by their groups' keys first, whose groups are computed
+        and spilled one partition at a time, and then merged.
+        """
+        width = len(step.group)
+        partitions = spill.split(rows, key=lambda row: row[:width], budget=self.memory_budget)
+        groups: t.List[spill.SpillFile] = []
+
+        try:
+            for partition in partitions:
+                hash_aggregate = HashAggregate(width, accumulators)
+                hash_aggregate.update(partition)
+                partition.close()
+
+                # The merge reads a batch of each partition's groups at a time
+                groups.append(spill.SpillFile(max(1, spill.BATCH_SIZE // len(partitions))))
+                groups[-1].extend(self.aggregate_groups(step, hash_aggregate, finalizers))
+
+            # The groups of each partition are sorted by their keys, so merging them sorts them all
+            yield from heapq.merge(
+                *groups, key=lambda row: tuple((v is None, v) for v in row[:width])
+            )
+        finally:
+            spill.close(partitions)
+            spill.close(groups)
+
+    def sort_stream(self, step: planner.Sort, streams: t.List[Stream]) -> Stream:
+        (stream,) = streams
+        projection_columns = self.table(step.projections).columns
+        width = len(stream.columns)
+
+        def batches():
+            projections = self.pipeline(stream.columns, stream.ranges, projections=step.projections)
+            key = self.pipeline(
+                stream.columns + projection_columns,
+                {None: None, **{name: None for name in stream.ranges}},
+                projections=step.key,
+            )
+
+            def keyed_rows():
+                for batch in stream.batches:
+                    values = projections(batch) if step.projections else [()] * len(batch)
+                    sink = [row + projected for row, projected in zip(batch, values)]
+
+                    for row_key, row in zip(key(sink), sink):
+                        yield tuple((v is None, v) for v in row_key), row[width:]
+
+            # A LIMIT only keeps the top rows, otherwise they're spilled if there's a budget
+            if not math.isinf(step.limit):
+                rows = heapq.nsmallest(step.limit, keyed_rows(), key=operator.itemgetter(0))
+            elif self.memory_budget is not None:
+                rows = spill.external_sort(
+                    keyed_rows(), key=operator.itemgetter(0), budget=self.memory_budget
+                )
+            else:
+                rows = sorted(keyed_rows(), key=operator.itemgetter(0))
+
+            try:
+                for batch in _batched(rows, self.batch_size):
+                    yield [row for _, row in batch]
+            finally:
+                if inspect.isgenerator(rows):
+                    rows.close()
+
+        return Stream(projection_columns, {step.name: None}, batches())
+
+    def set_operation_stream(self, step: planner.SetOperation, streams: t.List[Stream]) -> Stream:
+        inputs = {name: stream for stream in streams for name in stream.ranges}
+        left = inputs[step.left]
+        right = inputs[step.right]
+
+        def combine(left_batches: Batches, right_batches: Batches) -> Batches:
+            # The rows that were already produced, or that mustn't be, are skipped. Only the right
+            # side of an INTERSECT or EXCEPT is held, the left side streams through it
+            skip: t.Set[t.Tuple] = set()
+            sides = [left_batches, right_batches]
+            keep = None
+
+            if not issubclass(step.op, exp.Union):
+                rows = {row for batch in sides.pop() for row in batch}
+
+                if issubclass(step.op, exp.Intersect):
+                    keep = rows
+                else:
+                    skip = rows
+
+            for side in sides:
+                for batch in side:
+                    sink = []
+                    for row in batch:
+                        if row not in skip and (keep is None or row in keep):
+                            skip.add(row)
+                            sink.append(row)
+                    yield sink
+
+        def batches():
+            if issubclass(step.op, exp.Union) and not step.distinct:
+                yield from left.batches
+                yield from right.batches
+                return
+
+            if self.memory_budget is None:
+                yield from combine(left.batches, right.batches)
+                return
+
+            # The rows of both sides are tagged with their side, and if they exceed the budget, they
+            # are split into partitions by row, so that equal rows are combined together
+            tagged = itertools.chain(
+                ((0, row) for batch in left.batches for row in batch),
+                ((1, row) for batch in right.batches for row in batch),
+            )
+            rows, rest = spill.buffer(tagged, self.memory_budget)
+            partitions: t.List[t.Iterable[t.Tuple[int, t.Tuple]]] = [rows]
+
+            try:
+                if rest is not None:
+                    partitions = spill.split(
+                        itertools.chain(rows, rest),
+                        key=operator.itemgetter(1),
+                        budget=self.memory_budget,
+                    )
+                    del rows
+
+                for partition in partitions:
+                    sides: t.Tuple[t.List, t.List] = ([], [])
+                    for side, row in partition:
+                        sides[side].append(row)
+                    yield from combine(self.chunks(sides[0]), self.chunks(sides[1]))
+            finally:
+                if rest is not None:
+                    spill.close(t.cast(t.List[spill.SpillFile], partitions))
+
+        return Stream(left.columns, {step.name: None}, _limit(batches(), step.limit))
+
+
+def _guard(step: planner.Step, batches: Batches) -> Batches:
+    try:
+        yield from batches
+    except ExecuteError:
+        raise
+    except Exception as e:
+        raise ExecuteError(f"Step '{step.id}' failed: {e}") from e
+
+
+def _limit(
+    batches: Batches,
+    limit: float,
+    pipeline: t.Optional[t.Callable[..., t.List[t.Tuple]]] = None,
+) -> Batches:
+    # No batch is pulled once the limit is reached, which stops the work of the upstream steps, and
+    # the pipeline is passed the number of rows that are left, so it doesn't project the others
+    remaining = limit
+
+    if remaining > 0:
+        for batch in batches:
+            if pipeline:
+                batch = pipeline(batch, remaining)
+            if len(batch) >= remaining:
+                yield batch[: int(remaining)]
+                return
+            if batch:
+                remaining -= len(batch)
+                yield batch
+
+
+def _keyed(batches: Batches, key: t.Callable[..., t.List[t.Tuple]]) -> t.Iterator[t.Tuple]:
+    for batch in batches:
+        yield from zip(key(batch), batch)
+
+
+def _batched(rows: t.Iterable[t.Tuple], size: int) -> Batches:
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _is_correlated(query: exp.Expression) -> bool:
+    scopes = traverse_scope(query)
+    sources = {name for scope in scopes for name in scope.sources}
+    return any(column.table not in sources for scope in scopes for column in scope.external_columns)
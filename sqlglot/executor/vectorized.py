@@ -0,0 +1,1064 @@
+"""
+## Vectorized execution
+
+`VectorizedExecutor` runs the same plans as `sqlglot.executor.python.PythonExecutor`, but it stores
+the columns of its tables as NumPy arrays and evaluates each step over whole columns: filters are
+computed as boolean masks, sorts with `numpy.lexsort` and aggregations by factorizing the group keys
+and reducing each group with `numpy.bincount` or `numpy.ufunc.reduceat`.
+
+Expressions that don't have a vectorized implementation, e.g. most scalar functions, are still
+evaluated with the code generated by the `Python` dialect, but it's applied to the arrays of their
+arguments instead of going through a `Context` for every row. Steps that can't be vectorized at all,
+e.g. because they contain lambdas or because a value would overflow, run as in `PythonExecutor`.
+The results of both executors are the same, including the order of the rows and the handling of
+NULLs, so the fallback is transparent.
+
+This module requires NumPy.
+
+Example:
+    >>> from sqlglot.executor import execute
+    >>> tables = {"x": [{"a": 1, "b": 2}, {"a": 1, "b": 3}, {"a": 2, "b": None}]}
+    >>> execute("SELECT a, SUM(b) AS s FROM x GROUP BY a", tables=tables, vectorized=True).rows
+    [(1, 5), (2, None)]
+"""
+
+from __future__ import annotations
+
+import math
+import typing as t
+
+import numpy as np
+
+from sqlglot import exp
+from sqlglot.executor.python import PythonExecutor
+from sqlglot.executor.table import Table
+
+# Integers are stored as int64, so arithmetic whose operands could overflow it is left to Python
+_INT_LIMIT = 2**63
+# Integers up to this magnitude are converted to floats exactly
+_FLOAT_INT_LIMIT = 2**53
+
+_NoneType = type(None)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+# The errors that make a step fall back to PythonExecutor, which raises them again if they're real
+_FALLBACK_ERRORS = (_Unsupported, ArithmeticError, KeyError, TypeError, ValueError)
+
+
+class Vector:
+    """
+    A column of values and the mask of its NULLs, if it has any.
+
+    The values of integer, float and boolean columns are stored in arrays of the corresponding
+    dtype, whereas the others are stored as Python objects. The slots of the NULLs hold another
+    value of the column, so that they can take part in vectorized operations without failing.
+    """
+
+    __slots__ = ("values", "nulls")
+
+    def __init__(self, values: np.ndarray, nulls: t.Optional[np.ndarray] = None) -> None:
+        self.values = values
+        self.nulls = nulls if nulls is not None and nulls.any() else None
+
+    @classmethod
+    def from_list(cls, values: t.Sequence) -> Vector:
+        types = set(map(type, values))
+        nulls = None
+
+        if _NoneType in types:
+            types.discard(_NoneType)
+            nulls = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+            filler = next((v for v in values if v is not None), None)
+            values = [filler if v is None else v for v in values]
+
+        if types == {int}:
+            try:
+                return cls(np.array(values, dtype=np.int64), nulls)
+            except OverflowError:
+                pass
+        elif types == {float}:
+            return cls(np.array(values, dtype=np.float64), nulls)
+        elif types == {bool}:
+            return cls(np.array(values, dtype=bool), nulls)
+
+        return cls(np.fromiter(values, dtype=object, count=len(values)), nulls)
+
+    @classmethod
+    def constant(cls, value: t.Any, length: int) -> Vector:
+        if value is None:
+            return cls.null(length)
+        if type(value) in (int, float, bool):
+            try:
+                return cls(np.full(length, value))
+            except OverflowError:
+                pass
+
+        values = np.empty(length, dtype=object)
+        values.fill(value)
+        return cls(values)
+
+    @classmethod
+    def null(cls, length: int) -> Vector:
+        return cls(np.full(length, None, dtype=object), np.ones(length, dtype=bool))
+
+    @classmethod
+    def concat(cls, vectors: t.Sequence[Vector]) -> Vector:
+        arrays = _same_dtype(*(vector.values for vector in vectors))
+        nulls = None
+
+        if any(vector.nulls is not None for vector in vectors):
+            nulls = np.concatenate([vector.null_mask() for vector in vectors])
+
+        return cls(np.concatenate(arrays), nulls)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def all_null(self) -> bool:
+        return self.nulls is not None and bool(self.nulls.all())
+
+    def null_mask(self) -> np.ndarray:
+        return np.zeros(len(self), dtype=bool) if self.nulls is None else self.nulls
+
+    def take(self, indices: np.ndarray) -> Vector:
+        """Selects the values at the given positions, where a negative position selects a NULL."""
+        missing = indices < 0
+
+        if not missing.any():
+            return Vector(self.values[indices], None if self.nulls is None else self.nulls[indices])
+        if not len(self):
+            return Vector.null(len(indices))
+
+        indices = np.where(missing, 0, indices)
+        nulls = missing if self.nulls is None else missing | self.nulls[indices]
+        return Vector(self.values[indices], nulls)
+
+    def truth(self) -> np.ndarray:
+        """Returns a mask of the values that are truthy in Python, where NULLs are falsy."""
+        values = self.values
+
+        if values.dtype == bool:
+            truth = values
+        elif values.dtype.kind in "iuf":
+            truth = values != 0
+        else:
+            truth = np.frompyfunc(bool, 1, 1)(values).astype(bool)
+
+        return truth if self.nulls is None else truth & ~self.nulls
+
+    def objects(self) -> np.ndarray:
+        """Returns the values as an array of Python objects, with None in the slots of the NULLs."""
+        values = self.values.astype(object)
+        if self.nulls is not None:
+            values[self.nulls] = None
+        return values
+
+    def to_list(self) -> t.List:
+        values = self.values.tolist()
+        if self.nulls is not None:
+            for i in np.flatnonzero(self.nulls).tolist():
+                values[i] = None
+        return values
+
+
+class _Storage:
+    __slots__ = ("vectors", "rows", "length")
+
+    def __init__(
+        self,
+        vectors: t.Optional[t.List[Vector]] = None,
+        rows: t.Optional[t.List] = None,
+        length: int = 0,
+    ) -> None:
+        self.vectors = vectors
+        self.rows = rows
+        self.length = length
+
+
+class ColumnarTable(Table):
+    """
+    A table whose columns are stored as `Vector`s.
+
+    Its rows are only built when they're accessed, e.g. by the steps that fall back to
+    `PythonExecutor`. Since they may then be modified, they replace the vectors until these are
+    needed again. Tables that are created with `ColumnarTable.view` share their columns and rows.
+    """
+
+    def __init__(
+        self,
+        columns: t.Iterable,
+        vectors: t.Optional[t.List[Vector]] = None,
+        length: int = 0,
+        column_range: t.Optional[range] = None,
+    ) -> None:
+        super().__init__(columns, column_range=column_range)
+        self._storage = _Storage(vectors=vectors or [], length=length)
+
+    @property  # type: ignore
+    def rows(self) -> t.List:
+        storage = self._storage
+
+        if storage.rows is None:
+            vectors = t.cast(t.List[Vector], storage.vectors)
+            columns = [vector.to_list() for vector in vectors]
+            storage.rows = list(zip(*columns)) if columns else [()] * storage.length
+
+        storage.vectors = None
+        return storage.rows
+
+    @rows.setter
+    def rows(self, rows: t.List) -> None:
+        self._storage = _Storage(rows=rows)
+
+    @property
+    def vectors(self) -> t.List[Vector]:
+        storage = self._storage
+
+        if storage.vectors is None:
+            rows = t.cast(t.List, storage.rows)
+            storage.vectors = _to_vectors(rows, len(self.columns))
+            storage.length = len(rows)
+
+        return storage.vectors
+
+    def view(self, column_range: t.Optional[range]) -> ColumnarTable:
+        """Returns a table that shares this table's data, but only exposes a range of columns."""
+        table = ColumnarTable(self.columns, column_range=column_range)
+        table._storage = self._storage
+        return table
+
+    def add_columns(self, *columns: str) -> None:
+        self.rows
+        super().add_columns(*columns)
+
+    def __len__(self) -> int:
+        storage = self._storage
+        return storage.length if storage.rows is None else len(storage.rows)
+
+
+class _Taken(dict):
+    """Selects the rows of the vectors of a scope the first time each of them is accessed."""
+
+    def __init__(self, vectors: t.Mapping, indices: np.ndarray) -> None:
+        super().__init__()
+        self.vectors = vectors
+        self.indices = indices
+
+    def __missing__(self, key: t.Tuple[t.Optional[str], str]) -> Vector:
+        vector = self[key] = self.vectors[key].take(self.indices)
+        return vector
+
+
+class _Groups:
+    """The group of each row, numbered in the order of the group keys."""
+
+    def __init__(self, codes: np.ndarray, count: int) -> None:
+        self.codes = codes
+        self.count = count
+        self.order = np.argsort(codes, kind="stable")
+        # The start of each group in `order`, followed by the number of rows
+        self.bounds = np.searchsorted(codes[self.order], np.arange(count + 1)).tolist()
+
+    def first(self) -> np.ndarray:
+        """Returns the position of the first row of each group."""
+        return self.order[self.bounds[:-1]]
+
+
+class _Scope:
+    """
+    The vectors an expression is evaluated against, keyed by their table and column names.
+
+    If the rows are grouped, the expressions are aggregations whose results have a value per group.
+    """
+
+    def __init__(
+        self,
+        executor: VectorizedExecutor,
+        vectors: t.Mapping[t.Tuple[t.Optional[str], str], Vector],
+        length: int,
+        groups: t.Optional[_Groups] = None,
+    ) -> None:
+        self.executor = executor
+        self.vectors = vectors
+        self.length = length
+        self.groups = groups
+
+    def take(self, indices: np.ndarray) -> _Scope:
+        return _Scope(self.executor, _Taken(self.vectors, indices), len(indices))
+
+    def rows(self) -> _Scope:
+        """Returns the scope of the rows of the groups."""
+        return _Scope(self.executor, self.vectors, len(t.cast(_Groups, self.groups).codes))
+
+    def evaluate(self, expression: exp.Expression) -> Vector:
+        if not expression.find(exp.Column, exp.AggFunc):
+            return Vector.constant(self.executor.constant(expression), self.length)
+
+        handler = _HANDLERS.get(type(expression))
+        vector = handler(self, expression) if handler else None
+        return self.elementwise(expression) if vector is None else vector
+
+    def elementwise(self, expression: exp.Expression) -> Vector:
+        """Applies the Python code of an expression to the vectors of its arguments."""
+        node, vectors = self.placeholders(expression, self)
+        function = self.executor.function(node, len(vectors))
+        values = np.frompyfunc(function, len(vectors), 1)(*(v.objects() for v in vectors))
+        return Vector.from_list(values.tolist())
+
+    def placeholders(
+        self, expression: exp.Expression, scope: _Scope
+    ) -> t.Tuple[exp.Expression, t.List[Vector]]:
+        """
+        Replaces the arguments of an expression that depend on the rows with variables, in order,
+        and evaluates them in the given scope.
+        """
+        if expression.find(exp.Lambda, exp.Query):
+            raise _Unsupported
+
+        node = expression.copy()
+        vectors: t.List[Vector] = []
+
+        for arg, copy in zip(list(expression.iter_expressions()), list(node.iter_expressions())):
+            if arg.find(exp.Column, exp.AggFunc):
+                copy.replace(exp.var(f"_v{len(vectors)}"))
+                vectors.append(scope.evaluate(arg))
+
+        return node, vectors
+
+
+class VectorizedExecutor(PythonExecutor):
+    """
+    An executor that evaluates the steps of a plan over NumPy arrays.
+
+    Scans, joins, aggregations and sorts are vectorized, whereas set operations run as in
+    `PythonExecutor`, since they're already computed with sets of rows.
+    """
+
+    def __init__(self, env=None, tables=None, codegen=False):
+        super().__init__(env=env, tables=tables, codegen=codegen)
+        self._functions = {}
+
+    def scan(self, step, context):
+        return self._vectorize(self._scan, super().scan, step, context)
+
+    def join(self, step, context):
+        return self._vectorize(self._join, super().join, step, context)
+
+    def aggregate(self, step, context):
+        return self._vectorize(self._aggregate, super().aggregate, step, context)
+
+    def sort(self, step, context):
+        return self._vectorize(self._sort, super().sort, step, context)
+
+    def constant(self, expression):
+        """Evaluates an expression that doesn't reference any column."""
+        try:
+            return eval(self.generate(expression), self.env)
+        except Exception as e:
+            raise _Unsupported from e
+
+    def function(self, expression, arity):
+        """Compiles an expression whose arguments are the variables `_v0`, `_v1`, etc."""
+        code = f"lambda {', '.join(f'_v{i}' for i in range(arity))}: "
+
+        try:
+            code += self.generator.generate(expression)
+            function = self._functions.get(code)
+
+            if function is None:
+                function = self._functions[code] = eval(code, self.env)
+        except Exception as e:
+            raise _Unsupported from e
+
+        return function
+
+    def _vectorize(self, vectorized, fallback, step, context):
+        try:
+            with np.errstate(all="ignore"):
+                return vectorized(step, context)
+        except _FALLBACK_ERRORS:
+            return fallback(step, context)
+
+    def _scope(self, tables):
+        vectors = {}
+        length = 0
+        # Tables that share their rows, e.g. the sides of a join, are only converted once
+        converted = {}
+
+        for name, table in tables.items():
+            length = len(table)
+
+            if isinstance(table, ColumnarTable):
+                columns = table.vectors
+            else:
+                columns = converted.get(id(table.rows))
+                if columns is None:
+                    columns = converted[id(table.rows)] = _table_vectors(table)
+
+            for i, column in enumerate(table.columns):
+                if not table.column_range or i in table.column_range:
+                    vectors[(name, column)] = columns[i]
+
+        return _Scope(self, vectors, length)
+
+    def _select(self, step, scope):
+        """Returns the scope of the rows that satisfy the step's condition, up to its limit."""
+        if step.condition:
+            indices = np.flatnonzero(scope.evaluate(step.condition).truth())
+        elif scope.length > step.limit:
+            indices = np.arange(scope.length)
+        else:
+            return scope
+
+        if not math.isinf(step.limit):
+            indices = indices[: step.limit]
+
+        return scope.take(indices)
+
+    def _project(self, step, scope):
+        return ColumnarTable(
+            (projection.alias_or_name for projection in step.projections),
+            [scope.evaluate(projection) for projection in step.projections],
+            scope.length,
+        )
+
+    def _scan(self, step, context):
+        source = step.source
+
+        if source and isinstance(source, exp.Expression):
+            source = source.name or source.alias
+
+        if source is None:
+            if not step.projections:
+                raise _Unsupported
+            scope = _Scope(self, {}, 1)
+        elif source in context:
+            if not step.projections and not step.condition:
+                return self.context({step.name: context.tables[source]})
+
+            table = context.tables[source]
+            scope = self._scope(
+                {name: other for name, other in context.tables.items() if other is table}
+            )
+        else:
+            table = _columnar(self.tables.find(step.source))
+            scope = self._scope({step.source.alias_or_name: table})
+
+        scope = self._select(step, scope)
+
+        if step.projections:
+            return self.context({step.name: self._project(step, scope)})
+
+        vectors = _table_vectors(table)
+        if isinstance(scope.vectors, _Taken):
+            vectors = [vector.take(scope.vectors.indices) for vector in vectors]
+
+        return self.context({step.name: ColumnarTable(table.columns, vectors, scope.length)})
+
+    def _join(self, step, context):
+        source = step.source_name
+        source_table = _columnar(context.tables[source])
+        columns = list(source_table.columns)
+        vectors = list(_table_vectors(source_table))
+        length = len(source_table)
+        column_ranges = {source: range(0, len(source_table.columns))}
+
+        def joined():
+            table = ColumnarTable(columns, vectors, length)
+            return {name: table.view(column_range) for name, column_range in column_ranges.items()}
+
+        for name, join in step.joins.items():
+            table = _columnar(context.tables[name])
+            start = max(r.stop for r in column_ranges.values())
+            join_vectors = _table_vectors(table)
+
+            if join.get("source_key"):
+                source_scope = self._scope(joined())
+                join_scope = self._scope({name: table})
+                source_index, join_index = _hash_join(
+                    [source_scope.evaluate(key) for key in join["source_key"]],
+                    [join_scope.evaluate(key) for key in join["join_key"]],
+                    join.get("side"),
+                )
+            else:
+                source_index = np.repeat(np.arange(length), len(table))
+                join_index = np.tile(np.arange(len(table)), length)
+
+            vectors = [vector.take(source_index) for vector in vectors] + [
+                vector.take(join_index) for vector in join_vectors
+            ]
+            columns += table.columns
+            length = len(source_index)
+            column_ranges[name] = range(start, len(table.columns) + start)
+
+            if join.get("condition"):
+                condition = self._scope(joined()).evaluate(join["condition"])
+                indices = np.flatnonzero(condition.truth())
+                vectors = [vector.take(indices) for vector in vectors]
+                length = len(indices)
+
+        tables = joined()
+
+        if not step.condition and not step.projections:
+            return self.context(tables)
+
+        scope = self._select(step, self._scope(tables))
+
+        if step.projections:
+            return self.context({step.name: self._project(step, scope)})
+
+        if isinstance(scope.vectors, _Taken):
+            indices = scope.vectors.indices
+            vectors = [vector.take(indices) for vector in vectors]
+            length = len(indices)
+
+        return self.context(joined())
+
+    def _aggregate(self, step, context):
+        scope = self._scope(context.tables)
+        vectors = t.cast(dict, scope.vectors)
+        names = list(context.tables)
+
+        if step.operands:
+            names.append(None)
+            for operand in step.operands:
+                vector = scope.evaluate(operand)
+                for name in names:
+                    vectors[(name, operand.alias_or_name)] = vector
+
+        length = scope.length
+        keys = [scope.evaluate(expression) for expression in step.group.values()]
+
+        if keys:
+            codes = _rank(*keys)
+            total = int(codes.max()) + 1 if length else 0
+        else:
+            codes = np.zeros(length, dtype=np.int64)
+            total = 1
+
+        count = min(total, step.limit)
+        columns = list(step.group) + [
+            aggregation.alias_or_name for aggregation in step.aggregations
+        ]
+
+        if count:
+            if count < total:
+                # The groups past the limit are dropped before computing the aggregations
+                indices = np.flatnonzero(codes < count)
+                scope = scope.take(indices)
+                codes = codes[indices]
+                keys = [key.take(indices) for key in keys]
+
+            groups = _Groups(codes, count)
+            group_scope = _Scope(self, scope.vectors, count, groups)
+            results = [key.take(groups.first()) for key in keys] + [
+                group_scope.evaluate(aggregation) for aggregation in step.aggregations
+            ]
+        else:
+            results = [Vector.from_list([]) for _ in columns]
+
+        table = ColumnarTable(columns, results, count)
+        context = self.context({step.name: table, **{name: table for name in names}})
+
+        if step.projections or step.condition:
+            return self.scan(step, context)
+        return context
+
+    def _sort(self, step, context):
+        scope = self._scope(context.tables)
+        projections = [scope.evaluate(projection) for projection in step.projections]
+        names = [projection.alias_or_name for projection in step.projections]
+
+        # The key can reference every column of the step's input, as well as the projections
+        table = next(iter(context.tables.values()))
+        columns = dict(zip((*table.columns, *names), (*_table_vectors(table), *projections)))
+        key_scope = _Scope(
+            self,
+            {
+                (name, column): vector
+                for name in (None, *context.tables)
+                for column, vector in columns.items()
+            },
+            scope.length,
+        )
+
+        ranks = []
+        for ordered in step.key:
+            desc = isinstance(ordered, exp.Ordered) and ordered.args.get("desc")
+            vector = key_scope.evaluate(
+                ordered.this if isinstance(ordered, exp.Ordered) else ordered
+            )
+
+            # PythonExecutor can't compare NULLs with other values in descending order
+            if desc and vector.nulls is not None and not vector.all_null:
+                raise _Unsupported
+
+            rank = _rank(vector)
+            ranks.append(-rank if desc else rank)
+
+        order = np.lexsort(ranks[::-1]) if ranks else np.arange(scope.length)
+
+        if not math.isinf(step.limit):
+            order = order[: step.limit]
+
+        return self.context(
+            {
+                step.name: ColumnarTable(
+                    names, [projection.take(order) for projection in projections], len(order)
+                )
+            }
+        )
+
+
+def _to_vectors(rows: t.List, width: int) -> t.List[Vector]:
+    if not rows:
+        return [Vector.from_list([]) for _ in range(width)]
+    return [Vector.from_list(column) for column in zip(*rows)]
+
+
+def _table_vectors(table: Table) -> t.List[Vector]:
+    if isinstance(table, ColumnarTable):
+        return table.vectors
+    return _to_vectors(table.rows, len(table.columns))
+
+
+def _columnar(table: Table) -> ColumnarTable:
+    if isinstance(table, ColumnarTable):
+        return table
+    return ColumnarTable(table.columns, _table_vectors(table), len(table), table.column_range)
+
+
+def _same_dtype(*arrays: np.ndarray) -> t.Tuple[np.ndarray, ...]:
+    # Values of different dtypes are combined as Python objects, which keeps their Python types
+    if len({array.dtype for array in arrays}) > 1:
+        return tuple(array.astype(object) for array in arrays)
+    return arrays
+
+
+def _numeric(*vectors: Vector) -> t.Optional[t.Tuple[np.ndarray, ...]]:
+    if not all(vector.values.dtype.kind in "biuf" for vector in vectors):
+        return None
+    return tuple(
+        vector.values.astype(np.int64) if vector.values.dtype == bool else vector.values
+        for vector in vectors
+    )
+
+
+def _nulls(*vectors: Vector) -> t.Optional[np.ndarray]:
+    nulls = None
+    for vector in vectors:
+        if vector.nulls is not None:
+            nulls = vector.nulls if nulls is None else nulls | vector.nulls
+    return nulls
+
+
+def _magnitude(values: np.ndarray) -> int:
+    return max(int(values.max()), -int(values.min())) if len(values) else 0
+
+
+def _where(condition: np.ndarray, true: Vector, false: Vector) -> Vector:
+    values = np.where(condition, *_same_dtype(true.values, false.values))
+    nulls = None
+
+    if true.nulls is not None or false.nulls is not None:
+        nulls = np.where(condition, true.null_mask(), false.null_mask())
+
+    return Vector(values, nulls)
+
+
+def _rank(*vectors: Vector) -> np.ndarray:
+    """
+    Numbers the distinct values of a set of vectors in the order of the rows, sorted by their values
+    in that order, where NULLs come last, like in `sqlglot.executor.context.Context.sort`.
+    """
+    ranks = []
+
+    for vector in vectors:
+        if vector.nulls is None:
+            rank = np.unique(vector.values, return_inverse=True)[1]
+        else:
+            valid = ~vector.nulls
+            uniques, inverse = np.unique(vector.values[valid], return_inverse=True)
+            rank = np.full(len(vector), len(uniques))
+            rank[valid] = inverse.reshape(-1)
+
+        ranks.append(rank.reshape(-1))
+
+    if len(ranks) == 1:
+        return ranks[0]
+    if not len(ranks[0]):
+        return ranks[0]
+    return np.unique(np.stack(ranks, axis=1), axis=0, return_inverse=True)[1].reshape(-1)
+
+
+def _hash_join(
+    source_keys: t.List[Vector], join_keys: t.List[Vector], side: t.Optional[str]
+) -> t.Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the positions of the rows of both sides of an equi-join, where -1 stands for the NULLs
+    of an outer join. The rows are produced in the same order as `PythonExecutor.hash_join`, i.e.
+    grouped by key in the order in which the keys first appear in the source and then the join.
+    """
+    source_length = len(source_keys[0])
+    codes = _rank(*(Vector.concat(keys) for keys in zip(source_keys, join_keys)))
+
+    # Renumber the keys in the order in which they first appear
+    uniques, first = np.unique(codes, return_index=True)
+    renumber = np.empty(len(uniques), dtype=np.int64)
+    renumber[np.argsort(first, kind="stable")] = np.arange(len(uniques))
+    codes = renumber[codes]
+
+    source_codes, join_codes = codes[:source_length], codes[source_length:]
+    source_order = np.argsort(source_codes, kind="stable")
+    join_order = np.argsort(join_codes, kind="stable")
+    source_counts = np.bincount(source_codes, minlength=len(uniques))
+    join_counts = np.bincount(join_codes, minlength=len(uniques))
+
+    # Every group produces the cartesian product of its rows on either side, in which the missing
+    # side of an outer join is a single row of NULLs
+    source_sizes = np.maximum(source_counts, 1) if side == "RIGHT" else source_counts
+    join_sizes = np.maximum(join_counts, 1) if side == "LEFT" else join_counts
+    sizes = source_sizes * join_sizes
+
+    group = np.repeat(np.arange(len(uniques)), sizes)
+    offset = np.arange(len(group)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    source_offset = offset // join_sizes[group]
+    join_offset = offset % join_sizes[group]
+
+    def positions(order, counts, group_offset):
+        starts = np.cumsum(counts) - counts
+        present = group_offset < counts[group]
+        result = np.full(len(group), -1, dtype=np.int64)
+        result[present] = order[starts[group[present]] + group_offset[present]]
+        return result
+
+    return (
+        positions(source_order, source_counts, source_offset),
+        positions(join_order, join_counts, join_offset),
+    )
+
+
+def _arithmetic(ufunc: np.ufunc, bound: t.Callable[[int, int], int]) -> t.Callable:
+    def handler(scope: _Scope, expression: exp.Binary) -> t.Optional[Vector]:
+        left = scope.evaluate(expression.this)
+        right = scope.evaluate(expression.expression)
+        nulls = _nulls(left, right)
+
+        if left.all_null or right.all_null:
+            return Vector.null(scope.length)
+
+        numeric = _numeric(left, right)
+
+        if numeric is None:
+            values = ufunc(*_same_dtype(left.values, right.values))
+            return Vector(values, nulls)
+
+        a, b = numeric
+        if a.dtype.kind in "iu" and b.dtype.kind in "iu":
+            if bound(_magnitude(a), _magnitude(b)) >= _INT_LIMIT:
+                raise _Unsupported
+
+        return Vector(ufunc(a, b), nulls)
+
+    return handler
+
+
+def _division(ufunc: np.ufunc) -> t.Callable:
+    def handler(scope: _Scope, expression: exp.Binary) -> t.Optional[Vector]:
+        if expression.args.get("typed"):
+            return None
+
+        left = scope.evaluate(expression.this)
+        right = scope.evaluate(expression.expression)
+        nulls = _nulls(left, right)
+
+        if left.all_null or right.all_null:
+            return Vector.null(scope.length)
+
+        numeric = _numeric(left, right)
+        if numeric is None:
+            return None
+
+        a, b = numeric
+        zero = b == 0
+        if nulls is not None:
+            zero &= ~nulls
+
+        if expression.args.get("safe"):
+            nulls = zero if nulls is None else nulls | zero
+        elif zero.any():
+            raise ZeroDivisionError
+
+        if nulls is not None:
+            b = np.where(nulls, 1, b)
+
+        return Vector(ufunc(a, b), nulls)
+
+    return handler
+
+
+def _comparison(ufunc: np.ufunc) -> t.Callable:
+    def handler(scope: _Scope, expression: exp.Binary) -> Vector:
+        left = scope.evaluate(expression.this)
+        right = scope.evaluate(expression.expression)
+
+        if left.all_null or right.all_null:
+            return Vector.null(scope.length)
+
+        values = ufunc(*_same_dtype(left.values, right.values))
+        return Vector(values.astype(bool), _nulls(left, right))
+
+    return handler
+
+
+def _column(scope: _Scope, expression: exp.Column) -> Vector:
+    # Columns can only be referenced by the arguments of the aggregate functions
+    if scope.groups:
+        raise _Unsupported
+    return scope.vectors[(expression.table or None, expression.name)]
+
+
+def _and(scope: _Scope, expression: exp.And) -> Vector:
+    left = scope.evaluate(expression.this)
+    return _where(left.truth(), scope.evaluate(expression.expression), left)
+
+
+def _or(scope: _Scope, expression: exp.Or) -> Vector:
+    left = scope.evaluate(expression.this)
+    return _where(left.truth(), left, scope.evaluate(expression.expression))
+
+
+def _not(scope: _Scope, expression: exp.Not) -> Vector:
+    return Vector(~scope.evaluate(expression.this).truth())
+
+
+def _is(scope: _Scope, expression: exp.Is) -> t.Optional[Vector]:
+    if not isinstance(expression.expression, exp.Null) or isinstance(expression.this, exp.Literal):
+        return None
+    return Vector(scope.evaluate(expression.this).null_mask().copy())
+
+
+def _in(scope: _Scope, expression: exp.In) -> t.Optional[Vector]:
+    items = expression.expressions
+
+    if (
+        not items
+        or any(item.find(exp.Column, exp.AggFunc) for item in items)
+        or any(expression.args.get(arg) for arg in ("query", "unnest", "field"))
+    ):
+        return None
+
+    values = {scope.executor.constant(item) for item in items}
+    vector = scope.evaluate(expression.this)
+
+    if vector.values.dtype.kind in "iuf" and all(type(v) in (int, float) for v in values):
+        result = np.isin(vector.values, list(values))
+        if vector.nulls is not None:
+            result = np.where(vector.nulls, None in values, result)
+    else:
+        result = np.frompyfunc(values.__contains__, 1, 1)(vector.objects()).astype(bool)
+
+    return Vector(result)
+
+
+def _between(scope: _Scope, expression: exp.Between) -> Vector:
+    this = scope.evaluate(expression.this)
+    low = scope.evaluate(expression.args["low"])
+    high = scope.evaluate(expression.args["high"])
+
+    if this.all_null or low.all_null or high.all_null:
+        return Vector.null(scope.length)
+
+    values = np.greater_equal(*_same_dtype(this.values, low.values)) & np.less_equal(
+        *_same_dtype(this.values, high.values)
+    )
+    return Vector(values.astype(bool), _nulls(this, low, high))
+
+
+def _case(scope: _Scope, expression: exp.Case) -> t.Optional[Vector]:
+    if expression.this:
+        return None
+
+    default = expression.args.get("default")
+    result = scope.evaluate(default) if default else Vector.null(scope.length)
+
+    for when in reversed(expression.args["ifs"]):
+        condition = scope.evaluate(when.this).truth()
+        result = _where(condition, scope.evaluate(when.args["true"]), result)
+
+    return result
+
+
+def _if(scope: _Scope, expression: exp.If) -> t.Optional[Vector]:
+    false = expression.args.get("false")
+    if not false:
+        return None
+
+    condition = scope.evaluate(expression.this).truth()
+    return _where(condition, scope.evaluate(expression.args["true"]), scope.evaluate(false))
+
+
+def _coalesce(scope: _Scope, expression: exp.Coalesce) -> Vector:
+    vectors = [scope.evaluate(arg) for arg in (expression.this, *expression.expressions)]
+    result = vectors[-1]
+
+    for vector in reversed(vectors[:-1]):
+        result = vector if vector.nulls is None else _where(~vector.nulls, vector, result)
+
+    return result
+
+
+def _cast(scope: _Scope, expression: exp.Cast) -> t.Optional[Vector]:
+    to = expression.to.this
+    vector = scope.evaluate(expression.this)
+    values = vector.values
+
+    if values.dtype.kind not in "biuf":
+        return None
+    if to == exp.DataType.Type.BOOLEAN:
+        return Vector(values != 0, vector.nulls)
+    if to in exp.DataType.TEXT_TYPES:
+        return None
+    if to in (exp.DataType.Type.FLOAT, exp.DataType.Type.DOUBLE):
+        return Vector(values.astype(np.float64), vector.nulls)
+    if to in exp.DataType.NUMERIC_TYPES:
+        if values.dtype.kind == "f" and not np.isfinite(values).all():
+            return None
+        return Vector(values.astype(np.int64), vector.nulls)
+
+    return None
+
+
+def _aggregate(scope: _Scope, expression: exp.AggFunc) -> Vector:
+    groups = scope.groups
+    if groups is None:
+        raise _Unsupported
+
+    rows = scope.rows()
+    native = _AGGREGATES.get(type(expression))
+
+    if native and not any(value for key, value in expression.args.items() if key != "this"):
+        vector = native(rows.evaluate(expression.this), groups)
+        if vector is not None:
+            return vector
+
+    # Otherwise, the aggregate function is called with the values of each group
+    node, vectors = scope.placeholders(expression, rows)
+    function = scope.executor.function(node, len(vectors))
+    columns = [vector.objects()[groups.order].tolist() for vector in vectors]
+    bounds = groups.bounds
+
+    return Vector.from_list(
+        [
+            function(*(column[start:end] for column in columns))
+            for start, end in zip(bounds, bounds[1:])
+        ]
+    )
+
+
+def _valid(vector: Vector, groups: _Groups) -> t.Tuple[np.ndarray, np.ndarray]:
+    if vector.nulls is None:
+        return vector.values, groups.codes
+    valid = ~vector.nulls
+    return vector.values[valid], groups.codes[valid]
+
+
+def _reduce(ufunc: np.ufunc, values: np.ndarray, codes: np.ndarray, count: int) -> Vector:
+    result = np.zeros(count, dtype=values.dtype)
+    present = np.zeros(count, dtype=bool)
+
+    if len(values):
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        starts = np.flatnonzero(np.concatenate(([True], codes[1:] != codes[:-1])))
+        result[codes[starts]] = ufunc.reduceat(values[order], starts)
+        present[codes[starts]] = True
+
+    return Vector(result, ~present)
+
+
+def _count(vector: Vector, groups: _Groups) -> Vector:
+    _, codes = _valid(vector, groups)
+    return Vector(np.bincount(codes, minlength=groups.count))
+
+
+def _sum(vector: Vector, groups: _Groups) -> t.Optional[Vector]:
+    values, codes = _valid(vector, groups)
+    kind = values.dtype.kind
+
+    if kind == "b":
+        values = values.astype(np.int64)
+    elif kind == "f":
+        # bincount adds the values in the order of the rows, like Python's sum
+        present = np.bincount(codes, minlength=groups.count) > 0
+        return Vector(np.bincount(codes, weights=values, minlength=groups.count), ~present)
+    elif kind not in "iu" or _magnitude(values) * len(values) >= _INT_LIMIT:
+        return None
+
+    return _reduce(np.add, values, codes, groups.count)
+
+
+def _extreme(ufunc: np.ufunc) -> t.Callable[[Vector, _Groups], t.Optional[Vector]]:
+    def aggregate(vector: Vector, groups: _Groups) -> t.Optional[Vector]:
+        values, codes = _valid(vector, groups)
+        if values.dtype.kind not in "biuf":
+            return None
+        return _reduce(ufunc, values, codes, groups.count)
+
+    return aggregate
+
+
+def _avg(vector: Vector, groups: _Groups) -> t.Optional[Vector]:
+    values, codes = _valid(vector, groups)
+
+    # The mean of floats is computed with math.fsum, so only integers are vectorized, as long as
+    # they and their sums are exact as floats
+    if values.dtype.kind not in "biu" or _magnitude(values) * len(values) >= _FLOAT_INT_LIMIT:
+        return None
+
+    sums = _reduce(np.add, values.astype(np.int64), codes, groups.count)
+    counts = np.bincount(codes, minlength=groups.count)
+    return Vector(sums.values / np.maximum(counts, 1), sums.nulls)
+
+
+_HANDLERS: t.Dict[t.Type[exp.Expression], t.Callable[[_Scope, t.Any], t.Optional[Vector]]] = {
+    exp.Add: _arithmetic(np.add, lambda a, b: a + b),
+    exp.Alias: lambda scope, e: scope.evaluate(e.this),
+    exp.And: _and,
+    exp.Between: _between,
+    exp.Case: _case,
+    exp.Cast: _cast,
+    exp.Coalesce: _coalesce,
+    exp.Column: _column,
+    exp.Div: _division(np.true_divide),
+    exp.EQ: _comparison(np.equal),
+    exp.GT: _comparison(np.greater),
+    exp.GTE: _comparison(np.greater_equal),
+    exp.If: _if,
+    exp.In: _in,
+    exp.IntDiv: _division(np.floor_divide),
+    exp.Is: _is,
+    exp.LT: _comparison(np.less),
+    exp.LTE: _comparison(np.less_equal),
+    exp.Mod: _division(np.remainder),
+    exp.Mul: _arithmetic(np.multiply, lambda a, b: a * b),
+    exp.NEQ: _comparison(np.not_equal),
+    exp.Not: _not,
+    exp.Or: _or,
+    exp.Paren: lambda scope, e: scope.evaluate(e.this),
+    exp.Sub: _arithmetic(np.subtract, lambda a, b: a + b),
+    **{agg: _aggregate for agg in exp.ALL_FUNCTIONS if issubclass(agg, exp.AggFunc)},
+}
+
+_AGGREGATES: t.Dict[t.Type[exp.AggFunc], t.Callable[[Vector, _Groups], t.Optional[Vector]]] = {
+    exp.Avg: _avg,
+    exp.Count: _count,
+    exp.Max: _extreme(np.maximum),
+    exp.Min: _extreme(np.minimum),
+    exp.Sum: _sum,
+}
@@ -18,8 +18,10 @@ import numbers
 import re
 import sys
 import textwrap
+import threading
 import typing as t
 from collections import deque
+from contextlib import contextmanager
 from copy import deepcopy
 from decimal import Decimal
 from enum import auto
@@ -70,6 +72,10 @@ COLUMN_PARTS = ("this", "table", "db", "catalog")
 POSITION_META_KEYS = ("line", "col", "start", "end")
 UNITTEST = "unittest" in sys.modules or "pytest" in sys.modules
 
+# Maps thread ids to the logs of the mutations made while an `undo_mutations` or a
+# `track_mutations` block is active in them
+_UNDO_LOGS: t.Dict[int, t.Dict[int, t.Tuple[t.Any, ...]]] = {}
+
 
 class Expression(metaclass=_Expression):
     """
@@ -162,10 +168,14 @@ class Expression(metaclass=_Expression):
         assert self._hash
         return self._hash
 
-    def __reduce__(self) -> t.Tuple[t.Callable, t.Tuple[t.List[t.Dict[str, t.Any]]]]:
-        from sqlglot.serde import dump, load
+    def __reduce__(self) -> t.Tuple[t.Callable, t.Tuple[t.Any]]:
+        from sqlglot.serde import dump, dumps, load, loads
 
-        return (load, (dump(self),))
+        try:
+            return (loads, (dumps(self),))
+        except ValueError:
+            # The meta may contain arbitrary values, which only the JSON-like format can hold
+            return (load, (dump(self),))
 
     @property
     def this(self) -> t.Any:
@@ -288,6 +298,8 @@ class Expression(metaclass=_Expression):
     def type(self, dtype: t.Optional[DataType | DataType.Type | str]) -> None:
         if dtype and not isinstance(dtype, DataType):
             dtype = DataType.build(dtype)
+        if _UNDO_LOGS:
+            _record(self)
         self._type = dtype  # type: ignore
 
     def is_type(self, *dtypes) -> bool:
@@ -298,6 +310,8 @@ class Expression(metaclass=_Expression):
 
     @property
     def meta(self) -> t.Dict[str, t.Any]:
+        if _UNDO_LOGS:
+            _record(self)
         if self._meta is None:
             self._meta = {}
         return self._meta
@@ -343,6 +357,8 @@ class Expression(metaclass=_Expression):
         return deepcopy(self)
 
     def add_comments(self, comments: t.Optional[t.List[str]] = None, prepend: bool = False) -> None:
+        if _UNDO_LOGS:
+            _record(self)
         if self.comments is None:
             self.comments = []
 
@@ -362,6 +378,8 @@ class Expression(metaclass=_Expression):
                 self.comments = comments + self.comments
 
     def pop_comments(self) -> t.List[str]:
+        if _UNDO_LOGS:
+            _record(self)
         comments = self.comments or []
         self.comments = None
         return comments
@@ -374,6 +392,8 @@ class Expression(metaclass=_Expression):
             arg_key (str): name of the list expression arg
             value (Any): value to append to the list
         """
+        if _UNDO_LOGS:
+            _record(self)
         if type(self.args.get(arg_key)) is not list:
             self.args[arg_key] = []
         self._set_parent(arg_key, value)
@@ -399,6 +419,9 @@ class Expression(metaclass=_Expression):
             overwrite: assuming an index is given, this determines whether to overwrite the
                 list entry instead of only inserting a new value (i.e., like list.insert).
         """
+        if _UNDO_LOGS:
+            _record(self)
+
         expression: t.Optional[Expression] = self
 
         while expression and expression._hash is not None:
@@ -413,6 +436,8 @@ class Expression(metaclass=_Expression):
             if value is None:
                 expressions.pop(index)
                 for v in expressions[index:]:
+                    if _UNDO_LOGS:
+                        _record(v)
                     v.index = v.index - 1
                 return
 
@@ -433,6 +458,11 @@ class Expression(metaclass=_Expression):
         self._set_parent(arg_key, value, index)
 
     def _set_parent(self, arg_key: str, value: t.Any, index: t.Optional[int] = None) -> None:
+        if _UNDO_LOGS:
+            for v in value if type(value) is list else (value,):
+                if hasattr(v, "parent"):
+                    _record(v)
+
         if hasattr(value, "parent"):
             value.parent = self
             value.arg_key = arg_key
@@ -727,6 +757,8 @@ class Expression(metaclass=_Expression):
             parent.set(key, expression, self.index)
 
         if expression is not self:
+            if _UNDO_LOGS:
+                _record(self)
             self.parent = None
             self.arg_key = None
             self.index = None
@@ -8568,6 +8600,127 @@ def maybe_copy(instance, copy=True):
     return instance.copy() if copy and instance else instance
 
 
+def _record(expression: Expression) -> None:
+    undo_log = _UNDO_LOGS.get(threading.get_ident())
+
+    if undo_log is None or id(expression) in undo_log:
+        return
+
+    if type(undo_log) is MutationLog:
+        # Nothing is restored, so there's no need to save the expression's state
+        undo_log[id(expression)] = (expression,)
+    else:
+        undo_log[id(expression)] = (
+            expression,
+            {k: v.copy() if type(v) is list else v for k, v in expression.args.items()},
+            expression.parent,
+            expression.arg_key,
+            expression.index,
+            None if expression.comments is None else expression.comments.copy(),
+            expression._type,
+            None if expression._meta is None else expression._meta.copy(),
+            expression._hash,
+        )
+
+
+@contextmanager
+def undo_mutations() -> t.Iterator[None]:
+    """
+    Restores every expression that is mutated within the block to its original state upon exit.
+
+    This is a cheaper alternative to copying a tree before applying in-place transformations to it,
+    when only their result is needed and the tree must stay untouched: the state of an expression is
+    saved right before its first mutation, so the overhead is proportional to what actually changed,
+    rather than to the size of the tree.
+
+    Only mutations that go through the `Expression` API (e.g. `set`, `append`, `replace`, `pop`)
+    are tracked and they're tracked per thread, so the block must not be used to guard a tree that
+    is concurrently accessed by other threads.
+
+    Example:
+        >>> tree = select("a").from_("x")
+        >>> with undo_mutations():
+        ...     _ = tree.find(Column).replace(column("b"))
+        ...     tree.sql()
+        'SELECT b FROM x'
+        >>> tree.sql()
+        'SELECT a FROM x'
+    """
+    thread_id = threading.get_ident()
+    outer_log = _UNDO_LOGS.get(thread_id)
+
+    if outer_log is not None and not isinstance(outer_log, MutationLog):
+        # Nested blocks are no-ops, the outermost one undoes everything
+        yield
+        return
+
+    undo_log: t.Dict[int, t.Tuple[t.Any, ...]] = {}
+    _UNDO_LOGS[thread_id] = undo_log
+
+    try:
+        yield
+    finally:
+        # The mutations are undone, so there's nothing to report to an enclosing tracking block
+        if outer_log is None:
+            del _UNDO_LOGS[thread_id]
+        else:
+            _UNDO_LOGS[thread_id] = outer_log
+
+        for entry in undo_log.values():
+            expression, args, parent, arg_key, index, comments, type_, meta, hash_ = entry
+            expression.args = args
+            expression.parent = parent
+            expression.arg_key = arg_key
+            expression.index = index
+            expression.comments = comments
+            expression._type = type_
+            expression._meta = meta
+            expression._hash = hash_
+
+
+class MutationLog(t.Dict[int, t.Tuple[t.Any, ...]]):
+    """
+    The log of a `track_mutations` block, which maps the ids of the mutated expressions to
+    1-tuples that hold them, mirroring the layout of the undo logs.
+    """
+
+    @property
+    def expressions(self) -> t.List[Expression]:
+        return [state[0] for state in self.values()]
+
+
+@contextmanager
+def track_mutations() -> t.Iterator[t.Optional[MutationLog]]:
+    """
+    Records every expression that is mutated within the block, without undoing anything.
+
+    The log can be cleared at any point to only track the mutations that follow. The same caveats
+    as in `undo_mutations` apply and, since blocks of either kind can't be nested within an
+    `undo_mutations` block or another `track_mutations` block, `None` is produced instead of a
+    log in that case.
+
+    Example:
+        >>> tree = select("a").from_("x")
+        >>> with track_mutations() as log:
+        ...     _ = tree.find(Column).replace(column("b"))
+        >>> [e.sql() for e in log.expressions]
+        ['b', 'SELECT b FROM x', 'b', 'a']
+    """
+    thread_id = threading.get_ident()
+
+    if thread_id in _UNDO_LOGS:
+        yield None
+        return
+
+    log = MutationLog()
+    _UNDO_LOGS[thread_id] = log
+
+    try:
+        yield log
+    finally:
+        del _UNDO_LOGS[thread_id]
+
+
 def _to_s(node: t.Any, verbose: bool = False, level: int = 0, repr_str: bool = False) -> str:
     """Generate a textual representation of an Expression tree"""
     indent = "\n" + ("  " * (level + 1))
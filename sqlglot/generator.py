@@ -4,6 +4,7 @@ import logging
 import re
 import typing as t
 from collections import defaultdict
+from contextlib import nullcontext
 from functools import reduce, wraps
 
 from sqlglot import exp
@@ -68,6 +69,9 @@ class _Generator(type):
         for part in ALL_JSON_PATH_PARTS - klass.SUPPORTED_JSON_PATH_PARTS:
             klass.TRANSFORMS.pop(part, None)
 
+        # Each class gets its own dispatch table, since handlers are resolved against its attributes
+        klass._DISPATCH = {}
+
         return klass
 
 
@@ -724,6 +728,9 @@ class Generator(metaclass=_Generator):
 
     SENTINEL_LINE_BREAK = "__SQLGLOT__LB__"
 
+    # Autofilled: maps expression types to the function that generates them, see `_resolve_handler`
+    _DISPATCH: t.Dict[t.Type[exp.Expression], t.Callable[..., str]] = {}
+
     __slots__ = (
         "pretty",
         "identify",
@@ -800,7 +807,9 @@ class Generator(metaclass=_Generator):
 
         self._quote_json_path_key_using_brackets = True
 
-    def generate(self, expression: exp.Expression, copy: bool = True) -> str:
+    def generate(
+        self, expression: exp.Expression, copy: bool = True, copy_on_write: bool = False
+    ) -> str:
         """
         Generates the SQL string corresponding to the given syntax tree.
 
@@ -808,17 +817,22 @@ class Generator(metaclass=_Generator):
             expression: The syntax tree.
             copy: Whether to copy the expression. The generator performs mutations so
                 it is safer to copy.
+            copy_on_write: Whether to leave the expression unchanged without copying it upfront.
+                The mutations performed during generation are undone afterwards instead, so the
+                overhead is proportional to what the dialect's transforms rewrite, rather than to
+                the size of the tree. Takes precedence over `copy`.
 
         Returns:
             The SQL string corresponding to `expression`.
         """
-        if copy:
-            expression = expression.copy()
+        with exp.undo_mutations() if copy_on_write else nullcontext():
+            if copy and not copy_on_write:
+                expression = expression.copy()
 
-        expression = self.preprocess(expression)
+            expression = self.preprocess(expression)
 
-        self.unsupported_messages = []
-        sql = self.sql(expression).strip()
+            self.unsupported_messages = []
+            sql = self.sql(expression).strip()
 
         if self.pretty:
             sql = sql.replace(self.SENTINEL_LINE_BREAK, "\n")
@@ -978,25 +992,43 @@ class Generator(metaclass=_Generator):
                 return self.sql(value)
             return ""
 
-        transform = self.TRANSFORMS.get(expression.__class__)
+        handler = self._DISPATCH.get(expression.__class__)
+
+        if handler is None:
+            if not isinstance(expression, exp.Expression):
+                raise ValueError(
+                    f"Expected an Expression. Received {type(expression)}: {expression}"
+                )
+            handler = self._resolve_handler(expression.__class__)
+
+        sql = handler(self, expression)
+        return self.maybe_comment(sql, expression) if self.comments and comment else sql
+
+    @classmethod
+    def _resolve_handler(cls, expression_type: t.Type[exp.Expression]) -> t.Callable[..., str]:
+        """
+        Resolves the function that generates SQL for `expression_type` and memoizes it in the class'
+        dispatch table, so that subsequent lookups cost a single dict access. Resolution happens on
+        first use rather than eagerly, so that loading a dialect doesn't pay for every expression type.
+        """
+        transform = cls.TRANSFORMS.get(expression_type)
+        handler: t.Optional[t.Callable[..., str]]
 
         if callable(transform):
-            sql = transform(self, expression)
-        elif isinstance(expression, exp.Expression):
-            exp_handler_name = f"{expression.key}_sql"
-
-            if hasattr(self, exp_handler_name):
-                sql = getattr(self, exp_handler_name)(expression)
-            elif isinstance(expression, exp.Func):
-                sql = self.function_fallback_sql(expression)
-            elif isinstance(expression, exp.Property):
-                sql = self.property_sql(expression)
-            else:
-                raise ValueError(f"Unsupported expression type {expression.__class__.__name__}")
+            handler = transform
         else:
-            raise ValueError(f"Expected an Expression. Received {type(expression)}: {expression}")
+            handler = getattr(cls, f"{expression_type.key}_sql", None)
 
-        return self.maybe_comment(sql, expression) if self.comments and comment else sql
+            if handler is None:
+                if issubclass(expression_type, exp.Func):
+                    handler = cls.function_fallback_sql
+                elif issubclass(expression_type, exp.Property):
+                    handler = cls.property_sql
+                else:
+                    raise ValueError(f"Unsupported expression type {expression_type.__name__}")
+
+        cls._DISPATCH[expression_type] = handler
+        return handler
 
     def uncache_sql(self, expression: exp.Uncache) -> str:
         table = self.sql(expression, "this")
@@ -5,7 +5,10 @@ import inspect
 import logging
 import re
 import sys
+import threading
+import time
 import typing as t
+from collections import OrderedDict
 from collections.abc import Collection, Set
 from copy import copy
 from difflib import get_close_matches
@@ -214,19 +217,26 @@ def camel_to_snake_case(name: str) -> str:
     return CAMEL_CASE_PATTERN.sub("_", name).upper()
 
 
-def while_changing(expression: Expression, func: t.Callable[[Expression], E]) -> E:
+def while_changing(
+    expression: Expression, func: t.Callable[[Expression], E], budget: t.Optional[Budget] = None
+) -> E:
     """
     Applies a transformation to a given expression until a fix point is reached.
 
     Args:
         expression: The expression to be transformed.
         func: The transformation to be applied.
+        budget: An optional budget. If it's exhausted, the transformation isn't applied again,
+            even though a fix point may not have been reached yet.
 
     Returns:
         The transformed expression.
     """
 
     while True:
+        if budget and budget.exhausted:
+            return t.cast("E", expression)
+
         start_hash = hash(expression)
         expression = func(expression)
         end_hash = hash(expression)
@@ -520,3 +530,123 @@ class SingleValuedMapping(t.Mapping[K, V]):
 
     def __iter__(self) -> t.Iterator[K]:
         return iter(self._keys)
+
+
+class Budget:
+    """
+    Limits the amount of work done by the optimizer, by wall time and/or by number of operations.
+
+    What counts as an operation depends on the rule that spends it, e.g. visiting a node or trying
+    to simplify a pair of operands. Once the budget is exhausted, the rules that support it stop
+    rewriting and return the tree they've reached, which is valid but may be less optimized.
+
+    Budgets are meant to be used once, since the time limit starts counting when they're created.
+
+    Example:
+        >>> budget = Budget(operations=2)
+        >>> budget.spend(), budget.exhausted, budget.spend(), budget.exhausted, budget.spend()
+        (False, False, False, True, True)
+
+    Args:
+        seconds: the maximum wall time, in seconds.
+        operations: the maximum number of operations.
+    """
+
+    def __init__(
+        self, seconds: t.Optional[float] = None, operations: t.Optional[int] = None
+    ) -> None:
+        self.seconds = seconds
+        self.operations = operations
+        self.spent = 0
+        self._deadline = None if seconds is None else time.perf_counter() + seconds
+        self._exhausted = False
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the time or the operations have run out."""
+        if not self._exhausted:
+            self._exhausted = (self.operations is not None and self.spent >= self.operations) or (
+                self._deadline is not None and time.perf_counter() >= self._deadline
+            )
+        return self._exhausted
+
+    def spend(self, operations: int = 1) -> bool:
+        """
+        Records a number of operations that are about to be performed.
+
+        Returns:
+            Whether the budget was already exhausted, in which case they should be skipped.
+        """
+        exhausted = self.exhausted
+        self.spent += operations
+        return exhausted
+
+
+class CacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(t.Generic[K, V]):
+    """
+    A thread-safe, bounded mapping that evicts its least recently used entry when it's full.
+
+    Unlike `functools.lru_cache`, the cache is decoupled from any particular function, so that
+    callers are free to build the keys themselves and to decide which results are cacheable.
+
+    Args:
+        maxsize: the maximum number of entries to retain.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"Expected a positive maxsize, got {maxsize}")
+
+        self.maxsize = maxsize
+        self._data: t.OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> t.Optional[V]:
+        """Returns the value stored under `key`, or `None` if it isn't cached."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        """Stores `value` under `key`, evicting the least recently used entry if needed."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the hit, miss and eviction counters, along with the cache's current size."""
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions, self.maxsize, len(self._data)
+            )
+
+    def __contains__(self, key: t.Any) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,445 @@
+"""
+Incremental parsing, for editors and language servers that need an up-to-date syntax tree of a
+script after each edit without re-parsing all of it.
+
+Example:
+    >>> from sqlglot.incremental import IncrementalParser
+    >>> script = IncrementalParser("SELECT a FROM x; SELECT * FROM (SELECT b FROM y) AS z")
+    >>> first, second = script.expressions
+    >>> _ = script.edit(45, 46, "c")
+    >>> script.sql
+    'SELECT a FROM x; SELECT * FROM (SELECT b FROM c) AS z'
+    >>> script.expressions[0] is first, script.expressions[1] is second
+    (True, True)
+    >>> second.sql()
+    'SELECT * FROM (SELECT b FROM c) AS z'
+
+----
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+from sqlglot import expressions as exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ParseError, TokenError
+from sqlglot.tokens import Token, TokenType
+
+if t.TYPE_CHECKING:
+    from sqlglot.dialects.dialect import DialectType
+
+
+QUERY_START_TOKENS = {TokenType.SELECT, TokenType.WITH}
+
+
+class _Unit:
+    """The tokens of a statement, up to and including the semicolon that terminates it."""
+
+    __slots__ = ("end", "count", "ok", "positions")
+
+    def __init__(self, end: int, count: int, ok: bool = True) -> None:
+        # Index of the statement's last token
+        self.end = end
+        # Number of expressions the parser produces for it: a semicolon with comments is a
+        # statement of its own
+        self.count = count
+        # Whether it was parsed successfully
+        self.ok = ok
+        # The position metadata of the nodes in its syntax trees
+        self.positions: t.List[t.Dict[str, t.Any]] = []
+
+
+class _Shift:
+    """Maps the positions that follow an edit to their new values."""
+
+    def __init__(self, old_sql: str, new_sql: str, start: int, end: int, text: str) -> None:
+        self.end = end
+        self.delta = len(text) - (end - start)
+        self.line = old_sql.count("\n", 0, end) + 1
+        self.line_delta = text.count("\n") - old_sql.count("\n", start, end)
+        self.col_delta = (end + self.delta - new_sql.rfind("\n", 0, end + self.delta)) - (
+            end - old_sql.rfind("\n", 0, end)
+        )
+
+    def tokens(self, tokens: t.List[Token]) -> None:
+        for token in tokens:
+            if token.line == self.line:
+                token.col += self.col_delta
+            token.line += self.line_delta
+            token.start += self.delta
+            token.end += self.delta
+
+    def positions(self, positions: t.List[t.Dict[str, t.Any]]) -> None:
+        for meta in positions:
+            if meta["start"] >= self.end:
+                if meta["line"] == self.line:
+                    meta["col"] += self.col_delta
+                meta["line"] += self.line_delta
+                meta["start"] += self.delta
+                meta["end"] += self.delta
+
+
+class IncrementalParser:
+    """
+    Keeps the tokens and the syntax trees of a SQL script up to date as it's edited.
+
+    An edit only re-tokenizes the statements it touches and re-parses them, or, when it's confined
+    to a parenthesized subquery, only that subquery, which is then spliced into the statement's
+    existing syntax tree. The syntax trees of the remaining statements are reused as is, with the
+    position metadata (`line`, `col`, `start`, `end`) of their nodes shifted to match the new text.
+
+    If an edit results in a parse error, the error is raised once the script's state is updated, so
+    that the following edits can still be applied to it. The statements that failed to parse are
+    then retried as part of every subsequent edit, until they're fixed.
+
+    Args:
+        sql: the SQL code of the script.
+        read: the SQL dialect to apply during parsing (eg. "spark", "hive", "presto", "mysql").
+        dialect: the SQL dialect (alias for read).
+        **opts: other `sqlglot.parser.Parser` options.
+
+    Attributes:
+        sql: the current SQL code of the script.
+        tokens: the tokens of the script.
+        expressions: the syntax trees of the script's statements, in the same shape as what
+            `sqlglot.parse` returns for it.
+    """
+
+    def __init__(
+        self, sql: str = "", read: DialectType = None, dialect: DialectType = None, **opts
+    ) -> None:
+        self.dialect = Dialect.get_or_raise(read or dialect)
+        self.parser = self.dialect.parser(**opts)
+        self.sql = ""
+        self.tokens: t.List[Token] = []
+        self.expressions: t.List[t.Optional[exp.Expression]] = []
+        self._units: t.List[_Unit] = []
+        # Whether the text that follows the last unit still needs to be tokenized
+        self._truncated = True
+
+        self.edit(0, 0, sql)
+
+    def edit(self, start: int, end: int, text: str) -> t.List[t.Optional[exp.Expression]]:
+        """
+        Replaces the characters in the range [start, end) with `text` and updates the script.
+
+        Args:
+            start: the index of the first character to replace.
+            end: the index that follows the last character to replace.
+            text: the replacement text.
+
+        Returns:
+            The syntax trees of the script's statements.
+        """
+        old_sql = self.sql
+        sql = old_sql[:start] + text + old_sql[end:]
+        shift = _Shift(old_sql, sql, start, end, text)
+        tokens = self.tokens
+        units = self._units
+        last = len(units) if self._truncated else len(units) - 1
+
+        # Find the range of units that are affected by the edit, along with those that failed to
+        # parse. A unit spans from the semicolon that precedes it, since editing that semicolon
+        # affects it too, and the last one spans until the end of the script.
+        first_unit: t.Optional[int] = None
+        last_unit = 0
+
+        for k, unit in enumerate(units):
+            span_start = tokens[units[k - 1].end].start if k else 0
+            span_end = tokens[unit.end].end if k < last else len(old_sql)
+
+            if not unit.ok or (span_start <= end and span_end >= start - 1):
+                first_unit = k if first_unit is None else first_unit
+                last_unit = k
+
+        if first_unit is None:
+            ka = kb = last
+        else:
+            ka = first_unit
+            kb = last if self._truncated else last_unit
+
+        step = 1
+
+        while True:
+            # The semicolon that precedes the range must not have comments, since they may belong
+            # to the previous unit, in which case that semicolon is parsed as a separate statement
+            while ka and tokens[units[ka - 1].end].comments:
+                ka -= 1
+
+            # Same goes for the one that terminates it, as it may have trailing comments
+            while kb < last and tokens[units[kb].end].comments:
+                kb += 1
+
+            lo = units[ka - 1].end if ka else 0
+            region_start = tokens[lo].start if ka else 0
+            closed = kb < last
+            hi = units[kb].end if closed else len(tokens) - 1
+            region_end = tokens[hi].end + shift.delta + 1 if closed else len(sql)
+
+            try:
+                region_tokens = self.dialect.tokenize(sql[region_start:region_end])
+            except TokenError:
+                if closed:
+                    kb = min(kb + step, last)
+                    step *= 2
+                    continue
+
+                # The rest of the script can't be tokenized, so it's left aside until it can
+                self.sql = sql
+                self.tokens = tokens[: lo + 1] if ka else []
+                self.expressions = self.expressions[: sum(unit.count for unit in units[:ka])]
+                self._units = units[:ka]
+                self._truncated = True
+                raise
+
+            if ka and (
+                not region_tokens
+                or region_tokens[0].token_type != TokenType.SEMICOLON
+                or region_tokens[0].comments
+            ):
+                ka -= 1
+                continue
+
+            if closed and (
+                not region_tokens
+                or region_tokens[-1].token_type != TokenType.SEMICOLON
+                or region_tokens[-1].end != region_end - region_start - 1
+            ):
+                # The edit leaks past the unit, e.g. it opened a string or a comment
+                kb = min(kb + step, last)
+                step *= 2
+                continue
+
+            break
+
+        line_offset = sql.count("\n", 0, region_start)
+        col_offset = region_start - sql.rfind("\n", 0, region_start) - 1
+        region_tokens = [
+            Token(
+                token.token_type,
+                token.text,
+                line=token.line + line_offset,
+                col=token.col + col_offset if token.line == 1 else token.col,
+                start=token.start + region_start,
+                end=token.end + region_start,
+                comments=token.comments,
+            )
+            for token in region_tokens
+        ]
+
+        # Split the new tokens into units, the same way the parser splits them into statements
+        new_units = []
+        unit_start = 1 if ka else 0
+
+        for i in range(unit_start, len(region_tokens)):
+            token = region_tokens[i]
+            if token.token_type == TokenType.SEMICOLON:
+                new_units.append(_Unit(i, 2 if token.comments else 1))
+
+        if (new_units[-1].end if new_units else unit_start - 1) < len(region_tokens) - 1 or (
+            not new_units and not ka
+        ):
+            new_units.append(_Unit(len(region_tokens) - 1, 1))
+
+        first_expression = sum(unit.count for unit in units[:ka])
+        last_expression = (
+            sum(unit.count for unit in units[: kb + 1]) if closed else len(self.expressions)
+        )
+        error: t.Optional[ParseError] = None
+        expressions: t.List[t.Optional[exp.Expression]] = []
+
+        if (
+            ka == kb
+            and kb < len(units)
+            and units[ka].ok
+            and units[ka].count == 1
+            and len(new_units) == 1
+            and new_units[0].count == 1
+        ):
+            statement = self.expressions[first_expression]
+            if statement and self._patch(
+                statement,
+                tokens[lo + 1 if ka else 0 : hi + 1],
+                region_tokens[unit_start:],
+                sql,
+                shift,
+                units[ka].positions,
+            ):
+                expressions.append(statement)
+                new_units[0].positions = _positions(expressions)
+
+        if not expressions:
+            for unit in new_units:
+                try:
+                    parsed = self.parser.parse(region_tokens[unit_start : unit.end + 1], sql)
+                    unit.positions = _positions(parsed)
+                    expressions.extend(parsed)
+                except ParseError as e:
+                    error = error or e
+                    unit.ok = False
+                    expressions.extend([None] * unit.count)
+
+                unit_start = unit.end + 1
+
+        offset = lo - (hi + 1) + len(region_tokens)
+        for unit in new_units:
+            unit.end += lo
+        for unit in units[kb + 1 :]:
+            unit.end += offset
+            shift.positions(unit.positions)
+
+        following = tokens[hi + 1 :]
+        shift.tokens(following)
+
+        self.sql = sql
+        self.tokens = tokens[:lo] + region_tokens + following
+        self.expressions = (
+            self.expressions[:first_expression] + expressions + self.expressions[last_expression:]
+        )
+        self._units = units[:ka] + new_units + units[kb + 1 :]
+        self._truncated = False
+
+        if error:
+            raise error
+
+        return self.expressions
+
+    def _patch(
+        self,
+        statement: exp.Expression,
+        old_tokens: t.List[Token],
+        new_tokens: t.List[Token],
+        sql: str,
+        shift: _Shift,
+        positions: t.List[t.Dict[str, t.Any]],
+    ) -> bool:
+        """
+        Updates a statement's syntax tree in place, if the edit only changed its whitespace or the
+        contents of one of its parenthesized subqueries.
+
+        Returns:
+            Whether the statement could be updated in place.
+        """
+        old_size = len(old_tokens)
+        new_size = len(new_tokens)
+        size = min(old_size, new_size)
+
+        prefix = 0
+        while prefix < size and _same(old_tokens[prefix], new_tokens[prefix], 0):
+            prefix += 1
+
+        suffix = 0
+        while suffix < size - prefix and _same(
+            old_tokens[-1 - suffix], new_tokens[-1 - suffix], shift.delta
+        ):
+            suffix += 1
+
+        if prefix + suffix == old_size == new_size:
+            shift.positions(positions)
+            return True
+
+        old_pairs = _match_parens(old_tokens)
+        new_pairs = _match_parens(new_tokens)
+
+        # Find the innermost subquery that encloses the tokens that changed
+        for i in range(prefix - 1, -1, -1):
+            j = new_pairs.get(i)
+
+            if (
+                j is None
+                or j < new_size - suffix
+                or new_tokens[i + 1].token_type not in QUERY_START_TOKENS
+            ):
+                continue
+
+            if old_pairs.get(i) != j - new_size + old_size:
+                return False
+
+            query = _find_query(
+                statement, old_tokens[i].start, old_tokens[j - new_size + old_size].start
+            )
+            if not query:
+                return False
+
+            try:
+                new_queries = self.parser.parse(new_tokens[i + 1 : j], sql)
+            except ParseError:
+                return False
+
+            new_query = new_queries[0] if len(new_queries) == 1 else None
+            if not isinstance(new_query, exp.Query):
+                return False
+
+            shift.positions(positions)
+            query.replace(new_query)
+            return True
+
+        return False
+
+
+def _same(old: Token, new: Token, delta: int) -> bool:
+    return (
+        old.token_type == new.token_type
+        and old.start + delta == new.start
+        and old.text == new.text
+        and old.comments == new.comments
+    )
+
+
+def _match_parens(tokens: t.List[Token]) -> t.Dict[int, int]:
+    pairs = {}
+    stack = []
+
+    for i, token in enumerate(tokens):
+        if token.token_type == TokenType.L_PAREN:
+            stack.append(i)
+        elif token.token_type == TokenType.R_PAREN and stack:
+            pairs[stack.pop()] = i
+
+    return pairs
+
+
+def _positions(expressions: t.List[t.Optional[exp.Expression]]) -> t.List[t.Dict[str, t.Any]]:
+    return [
+        node.meta
+        for expression in expressions
+        if expression
+        for node in expression.walk()
+        if _position(node) is not None
+    ]
+
+
+def _position(node: exp.Expression) -> t.Optional[int]:
+    start = node._meta and node._meta.get("start")
+    return start if isinstance(start, int) else None
+
+
+def _find_query(statement: exp.Expression, start: int, end: int) -> t.Optional[exp.Query]:
+    """Finds the query of the subquery whose parentheses are at positions `start` and `end`."""
+    inside = []
+
+    for node in statement.walk():
+        position = _position(node)
+        if position is not None and start < position < end:
+            inside.append(node)
+
+    if not inside:
+        return None
+
+    ancestor = inside[0].parent
+
+    while ancestor:
+        query = ancestor.this
+
+        if isinstance(ancestor, exp.Subquery) and isinstance(query, exp.Query):
+            positions = [p for p in map(_position, query.walk()) if p is not None]
+
+            if any(p <= start or p >= end for p in positions):
+                return None
+            if len(positions) == len(inside):
+                return query
+
+        ancestor = ancestor.parent
+
+    return None
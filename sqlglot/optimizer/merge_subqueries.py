@@ -5,7 +5,7 @@ import typing as t
 from collections import defaultdict
 
 from sqlglot import expressions as exp
-from sqlglot.helper import find_new_name, seq_get
+from sqlglot.helper import Budget, find_new_name, seq_get
 from sqlglot.optimizer.scope import Scope, traverse_scope
 
 if t.TYPE_CHECKING:
@@ -14,7 +14,9 @@ if t.TYPE_CHECKING:
     FromOrJoin = t.Union[exp.From, exp.Join]
 
 
-def merge_subqueries(expression: E, leave_tables_isolated: bool = False) -> E:
+def merge_subqueries(
+    expression: E, leave_tables_isolated: bool = False, budget: t.Optional[Budget] = None
+) -> E:
     """
     Rewrite sqlglot AST to merge derived tables into the outer query.
 
@@ -37,11 +39,12 @@ def merge_subqueries(expression: E, leave_tables_isolated: bool = False) -> E:
     Args:
         expression (sqlglot.Expression): expression to optimize
         leave_tables_isolated (bool):
+        budget: an optional `sqlglot.helper.Budget`. Once it's exhausted, nothing else is merged.
     Returns:
         sqlglot.Expression: optimized expression
     """
-    expression = merge_ctes(expression, leave_tables_isolated)
-    expression = merge_derived_tables(expression, leave_tables_isolated)
+    expression = merge_ctes(expression, leave_tables_isolated, budget)
+    expression = merge_derived_tables(expression, leave_tables_isolated, budget)
     return expression
 
 
@@ -67,7 +70,12 @@ SAFE_TO_REPLACE_UNWRAPPED = (
 )
 
 
-def merge_ctes(expression: E, leave_tables_isolated: bool = False) -> E:
+def merge_ctes(
+    expression: E, leave_tables_isolated: bool = False, budget: t.Optional[Budget] = None
+) -> E:
+    if budget and budget.exhausted:
+        return expression
+
     scopes = traverse_scope(expression)
 
     # All places where we select from CTEs.
@@ -86,6 +94,9 @@ def merge_ctes(expression: E, leave_tables_isolated: bool = False) -> E:
 
     singular_cte_selections = [v[0] for k, v in cte_selections.items() if len(v) == 1]
     for outer_scope, inner_scope, table in singular_cte_selections:
+        if budget and budget.spend():
+            break
+
         from_or_join = table.find_ancestor(exp.From, exp.Join)
         if _mergeable(outer_scope, inner_scope, leave_tables_isolated, from_or_join):
             alias = table.alias_or_name
@@ -101,9 +112,17 @@ def merge_ctes(expression: E, leave_tables_isolated: bool = False) -> E:
     return expression
 
 
-def merge_derived_tables(expression: E, leave_tables_isolated: bool = False) -> E:
+def merge_derived_tables(
+    expression: E, leave_tables_isolated: bool = False, budget: t.Optional[Budget] = None
+) -> E:
+    if budget and budget.exhausted:
+        return expression
+
     for outer_scope in traverse_scope(expression):
         for subquery in outer_scope.derived_tables:
+            if budget and budget.spend():
+                return expression
+
             from_or_join = subquery.find_ancestor(exp.From, exp.Join)
             alias = subquery.alias_or_name
             inner_scope = outer_scope.sources[alias]
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 import logging
+import typing as t
 
 from sqlglot import exp
 from sqlglot.errors import OptimizeError
-from sqlglot.helper import while_changing
+from sqlglot.helper import Budget, while_changing
 from sqlglot.optimizer.scope import find_all_in_scope
 from sqlglot.optimizer.simplify import Simplifier, flatten
 
 logger = logging.getLogger("sqlglot")
 
 
-def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int = 128):
+def normalize(
+    expression: exp.Expression,
+    dnf: bool = False,
+    max_distance: int = 128,
+    budget: t.Optional[Budget] = None,
+    factor: bool = False,
+):
     """
     Rewrite sqlglot AST into conjunctive normal form or disjunctive normal form.
 
@@ -20,11 +27,21 @@ def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int =
         >>> expression = sqlglot.parse_one("(x AND y) OR z")
         >>> normalize(expression, dnf=False).sql()
         '(x OR z) AND (y OR z)'
+        >>> expression = sqlglot.parse_one("(x AND y) OR (x AND z)")
+        >>> normalize(expression, factor=True).sql()
+        'x AND (y OR z)'
 
     Args:
         expression: expression to normalize
         dnf: rewrite in disjunctive normal form instead.
         max_distance (int): the maximal estimated distance from cnf/dnf to attempt conversion
+        budget: an optional `sqlglot.helper.Budget`. Once it's exhausted, the connector that's
+            being normalized is restored and the remaining ones are left as they are.
+        factor: whether to pull the factors that are common to all operands out of each connector
+            first, e.g. `(x AND y) OR (x AND z) -> x AND (y OR z)`, and only apply the distributive
+            law to the resulting operands whose distance doesn't exceed `max_distance`. This takes
+            near-linear time and never grows the expression beyond that distance, but the operands
+            that are too far from the normal form are left as they are.
     Returns:
         sqlglot.Expression: normalized expression
     """
@@ -32,9 +49,22 @@ def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int =
 
     for node in tuple(expression.walk(prune=lambda e: isinstance(e, exp.Connector))):
         if isinstance(node, exp.Connector):
+            if budget and budget.exhausted:
+                logger.info("Skipping normalization because the budget is exhausted")
+                return expression
             if normalized(node, dnf=dnf):
                 continue
             root = node is expression
+
+            if factor:
+                node.transform(simplifier.rewrite_between, copy=False)
+                factored = _factorize(node, dnf, max_distance, budget)
+                if factored is not node:
+                    node = node.replace(factored)
+                if root:
+                    expression = node
+                continue
+
             original = node.copy()
 
             node.transform(simplifier.rewrite_between, copy=False)
@@ -50,7 +80,9 @@ def normalize(expression: exp.Expression, dnf: bool = False, max_distance: int =
                 node = node.replace(
                     while_changing(
                         node,
-                        lambda e: distributive_law(e, dnf, max_distance, simplifier=simplifier),
+                        lambda e: distributive_law(
+                            e, dnf, max_distance, simplifier=simplifier, budget=budget
+                        ),
                     )
                 )
             except OptimizeError as e:
@@ -151,11 +183,14 @@ def _predicate_lengths(expression, dnf, max_=float("inf"), depth=0):
         yield from _predicate_lengths(right, dnf, max_, depth)
 
 
-def distributive_law(expression, dnf, max_distance, simplifier=None):
+def distributive_law(expression, dnf, max_distance, simplifier=None, budget=None):
     """
     x OR (y AND z) -> (x OR y) AND (x OR z)
     (x AND y) OR (y AND z) -> (x OR y) AND (x OR z) AND (y OR y) AND (y OR z)
     """
+    if budget and budget.spend():
+        raise OptimizeError("Normalization budget exhausted")
+
     if normalized(expression, dnf=dnf):
         return expression
 
@@ -164,7 +199,9 @@ def distributive_law(expression, dnf, max_distance, simplifier=None):
     if distance > max_distance:
         raise OptimizeError(f"Normalization distance {distance} exceeds max {max_distance}")
 
-    exp.replace_children(expression, lambda e: distributive_law(e, dnf, max_distance))
+    exp.replace_children(
+        expression, lambda e: distributive_law(e, dnf, max_distance, budget=budget)
+    )
     to_exp, from_exp = (exp.Or, exp.And) if dnf else (exp.And, exp.Or)
 
     if isinstance(expression, from_exp):
@@ -205,3 +242,129 @@ def _distribute(a, b, from_func, to_func, simplifier):
         )
 
     return a
+
+
+def _factorize(expression, dnf, max_distance, budget):
+    """
+    Pulls the common factors out of every connector and then distributes the resulting operands of
+    the normal form's outer connector separately, skipping those that are too far from it.
+
+    (x AND y) OR (x AND z) -> x AND (y OR z)
+    """
+    outer, inner = (exp.Or, exp.And) if dnf else (exp.And, exp.Or)
+    factored = _extract_factors(expression, outer, inner)
+    changed = factored is not expression.unnest()
+    operands = []
+
+    for operand in _flatten(factored, outer):
+        if (
+            not normalized(operand, dnf=dnf)
+            and normalization_distance(operand, dnf=dnf, max_=max_distance) <= max_distance
+            and not (budget and budget.spend())
+        ):
+            # The predicates may appear in several clauses, so they're copied
+            operands.extend(
+                _connect(inner, clause, copy=True)
+                for clause in _distribute_factors(operand, outer, inner)
+            )
+            changed = True
+        else:
+            operands.append(operand)
+
+    if not changed:
+        return expression
+
+    return _connect(outer, operands)
+
+
+def _distribute_factors(expression, outer, inner):
+    """
+    Returns the operands of the outer connector of an expression's normal form, i.e. its clauses,
+    as tuples of predicates without duplicates.
+
+    (x AND y) OR z -> [(x, z), (y, z)]
+    """
+    expression = expression.unnest()
+
+    if isinstance(expression, outer):
+        clauses = (
+            clause
+            for operand in _flatten(expression, outer)
+            for clause in _distribute_factors(operand, outer, inner)
+        )
+    elif isinstance(expression, inner):
+        clauses = [()]
+
+        for operand in _flatten(expression, inner):
+            operand_clauses = _distribute_factors(operand, outer, inner)
+            clauses = [tuple(dict.fromkeys((*a, *b))) for a in clauses for b in operand_clauses]
+    else:
+        return [(expression,)]
+
+    return list(dict.fromkeys(clauses))
+
+
+def _extract_factors(expression, outer, inner):
+    expression = expression.unnest()
+
+    if not isinstance(expression, (outer, inner)):
+        return expression
+
+    operands = _flatten(expression, expression.__class__)
+    extracted = [_extract_factors(operand, outer, inner) for operand in operands]
+    changed = any(e is not operand for e, operand in zip(extracted, operands))
+
+    if isinstance(expression, outer):
+        if not changed:
+            return expression
+        return _connect(outer, [factor for e in extracted for factor in _flatten(e, outer)])
+
+    # Duplicates are removed and the terms that consist of a single factor absorb the rest:
+    # x OR x OR (x AND y AND y) -> x OR (x AND y) -> x
+    factorized = [_flatten(e, outer) for e in extracted]
+    terms = list(dict.fromkeys(tuple(dict.fromkeys(factors)) for factors in factorized))
+    singletons = {term[0] for term in terms if len(term) == 1}
+    if singletons:
+        terms = [term for term in terms if len(term) == 1 or singletons.isdisjoint(term)]
+
+    changed = changed or sum(map(len, terms)) < sum(map(len, factorized))
+
+    common = set(terms[0]).intersection(*terms[1:])
+
+    if not common:
+        if not changed:
+            return expression
+        return _connect(inner, [_connect(outer, term) for term in terms])
+
+    factors = [factor for factor in terms[0] if factor in common]
+    residuals = [[factor for factor in term if factor not in common] for term in terms]
+
+    # (x AND y) OR (x AND y AND z) -> x AND y
+    if not all(residuals):
+        return _connect(outer, factors)
+
+    return _connect(
+        outer, [*factors, _connect(inner, [_connect(outer, residual) for residual in residuals])]
+    )
+
+
+def _connect(connector, operands, copy=False):
+    func = exp.and_ if connector is exp.And else exp.or_
+    return func(*operands, copy=copy)
+
+
+def _flatten(expression, connector):
+    """Returns the operands of a chain of connectors, looking through parentheses."""
+    operands = []
+    stack = [expression]
+
+    while stack:
+        node = stack.pop().unnest()
+
+        if isinstance(node, connector):
+            stack.append(node.right)
+            stack.append(node.left)
+        else:
+            operands.append(node)
+
+    return operands
@@ -4,18 +4,43 @@ import typing as t
 
 from sqlglot import exp
 from sqlglot.helper import tsort
+from sqlglot.optimizer.statistics import DEFAULT_ROWS, Statistics, TableStats, selectivity
 
 JOIN_ATTRS = ("on", "side", "kind", "using", "method")
 
+# The clauses that make a derived table more than a filtered scan of its table
+_NON_SCAN_ARGS = (
+    "joins",
+    "laterals",
+    "group",
+    "having",
+    "qualify",
+    "windows",
+    "limit",
+    "offset",
+    "distinct",
+    "with_",
+)
 
-def optimize_joins(expression):
+# Joins with up to this many tables are ordered with dynamic programming, larger ones greedily
+DP_MAX_TABLES = 10
+
+
+def optimize_joins(expression, stats: t.Optional[Statistics] = None):
     """
     Removes cross joins if possible and reorder joins based on predicate dependencies.
 
+    If statistics are given, the inner joins of qualified queries are ordered by their estimated
+    cost instead, see `reorder_joins`.
+
     Example:
         >>> from sqlglot import parse_one
         >>> optimize_joins(parse_one("SELECT * FROM x CROSS JOIN y JOIN z ON x.a = z.a AND y.a = z.a")).sql()
         'SELECT * FROM x JOIN z ON x.a = z.a AND TRUE JOIN y ON y.a = z.a'
+
+    Args:
+        expression: the expression to optimize.
+        stats: the statistics of the tables, which enable the cost-based ordering of joins.
     """
 
     for select in expression.find_all(exp.Select):
@@ -24,7 +49,7 @@ def optimize_joins(expression):
         if not _is_reorderable(joins):
             continue
 
-        references = {}
+        references: t.Dict[str, t.List[exp.Join]] = {}
         cross_joins = []
 
         for join in joins:
@@ -53,14 +78,30 @@ def optimize_joins(expression):
                             )
                             join.on(predicate, append=False, copy=False)
 
-    expression = reorder_joins(expression)
+    expression = reorder_joins(expression, stats=stats)
     expression = normalize(expression)
     return expression
 
 
-def reorder_joins(expression):
+def reorder_joins(expression, stats: t.Optional[Statistics] = None):
     """
     Reorder joins by topological sort order based on predicate references.
+
+    If statistics are given, the joins of the queries whose tables are all joined with inner or
+    cross joins, and whose columns are qualified, are ordered so that the sum of the estimated
+    sizes of the intermediate results is minimal. Joins with up to `DP_MAX_TABLES` tables are
+    ordered optimally with dynamic programming, whereas larger ones are ordered greedily. Only
+    left-deep orders are considered, since they're the ones that a list of joins can express,
+    and tables that share no predicate with the tables before them are avoided when possible.
+    The join conditions are then attached to the first join where all their tables are available.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> from sqlglot.optimizer.statistics import TableStats
+        >>> stats = Statistics({"x": TableStats(1000), "y": TableStats(1_000_000), "z": TableStats(10)})
+        >>> sql = "SELECT x.a FROM x JOIN y ON x.a = y.a JOIN z ON y.b = z.b"
+        >>> reorder_joins(parse_one(sql), stats=stats).sql()
+        'SELECT x.a FROM y JOIN z ON y.b = z.b JOIN x ON x.a = y.a'
     """
     for from_ in expression.find_all(exp.From):
         parent = from_.parent
@@ -69,6 +110,9 @@ def reorder_joins(expression):
         if not _is_reorderable(joins):
             continue
 
+        if stats is not None and isinstance(parent, exp.Select) and _reorder_by_cost(parent, stats):
+            continue
+
         joins_by_name = {join.alias_or_name: join for join in joins}
         dag = {name: other_table_names(join) for name, join in joins_by_name.items()}
         parent.set(
@@ -101,6 +145,239 @@ def normalize(expression):
     return expression
 
 
+def _reorder_by_cost(select: exp.Select, stats: Statistics) -> bool:
+    """Orders the joins of a query by cost and returns whether the query could be ordered."""
+    from_ = select.args["from_"]
+    joins = select.args.get("joins")
+
+    if not joins:
+        return True
+    if select.is_star or any(
+        join.kind not in ("", "INNER", "CROSS")
+        or any(value for key, value in join.args.items() if key not in ("this", "on", "kind"))
+        for join in joins
+    ):
+        return False
+
+    nodes = [from_.this, *(join.this for join in joins)]
+    names = [node.alias_or_name for node in nodes]
+    bits = {name: 1 << i for i, name in enumerate(names)}
+
+    if len(bits) != len(nodes) or not all(
+        name and isinstance(node, (exp.Table, exp.Subquery)) for name, node in zip(names, nodes)
+    ):
+        return False
+
+    scans = [_scan(node) for node in nodes]
+    tables = [stats.find(table) if table else None for table, _, _ in scans]
+    if not any(tables):
+        return False
+
+    where = select.args.get("where")
+    on = [predicate for join in joins for predicate in _conjuncts(join.args.get("on"))]
+    predicates = []
+
+    for predicate in [*on, *_conjuncts(where and where.this)]:
+        mask = 0
+        for column in predicate.find_all(exp.Column):
+            if not column.table:
+                return False
+            mask |= bits.get(column.table, 0)
+        predicates.append((predicate, mask))
+
+    def ndv(column: exp.Column, unique: bool = False) -> t.Optional[float]:
+        bit = bits.get(column.table)
+        if not bit:
+            return None
+
+        i = bit.bit_length() - 1
+        table, columns, _ = scans[i]
+        name = column.name if columns is None else columns.get(column.name)
+        count = stats.ndv(table, name) if table and name else None
+
+        # Join keys without statistics are assumed to be unique, i.e. foreign key joins
+        if not count and unique and tables[i]:
+            return t.cast(TableStats, tables[i]).rows
+        return count
+
+    rows = []
+    for (table, _, condition), table_stats in zip(scans, tables):
+        size = table_stats.rows if table_stats else DEFAULT_ROWS
+        if table and table_stats and condition:
+            size *= selectivity(condition, lambda column: stats.ndv(table, column.name))
+        rows.append(size)
+
+    edges = []
+    for predicate, mask in predicates:
+        if mask & (mask - 1):
+            edges.append((mask, selectivity(predicate, lambda column: ndv(column, unique=True))))
+        elif mask:
+            rows[mask.bit_length() - 1] *= selectivity(predicate, ndv)
+
+    graph = _JoinGraph(rows, edges)
+    order = graph.dp_order() if len(nodes) <= DP_MAX_TABLES else graph.greedy_order()
+
+    if order == list(range(len(nodes))):
+        return True
+
+    placed = 0
+    pending = predicates[: len(on)]
+    new_joins = []
+
+    for position, i in enumerate(order):
+        placed |= 1 << i
+        if not position:
+            continue
+
+        ready = [predicate for predicate, mask in pending if not mask & ~placed]
+        pending = [(predicate, mask) for predicate, mask in pending if mask & ~placed]
+        # A join without a condition must be an explicit cross join, since a comma join binds more
+        # loosely than the joins after it in some dialects, which hides its tables from their ONs
+        if ready:
+            new_joins.append(exp.Join(this=nodes[i], on=exp.and_(*ready, copy=False)))
+        else:
+            new_joins.append(exp.Join(this=nodes[i], kind="CROSS"))
+
+    from_.set("this", nodes[order[0]])
+    select.set("joins", new_joins)
+    return True
+
+
+class _JoinGraph:
+    """
+    The tables of a query, with their estimated sizes, and the predicates that join them, with
+    their selectivities. Sets of tables are represented as bit masks of their positions.
+    """
+
+    def __init__(self, rows: t.List[float], edges: t.List[t.Tuple[int, float]]) -> None:
+        self.rows = rows
+        self.edges = edges
+        self._sizes: t.Dict[int, float] = {1 << i: size for i, size in enumerate(rows)}
+
+    def size(self, tables: int) -> float:
+        """Estimates the number of rows of the join of a set of tables."""
+        size = self._sizes.get(tables)
+
+        if size is None:
+            last = tables & -tables
+            others = tables ^ last
+            size = self.size(others) * self.size(last)
+
+            for mask, selectivity in self.edges:
+                if mask & last and not mask & ~tables:
+                    size *= selectivity
+
+            self._sizes[tables] = size
+
+        return size
+
+    def connected(self, table: int, tables: int) -> bool:
+        """Returns whether a table shares a predicate with a set of tables, and only them."""
+        joined = table | tables
+        return any(mask & table and mask & tables and not mask & ~joined for mask, _ in self.edges)
+
+    def dp_order(self) -> t.List[int]:
+        """
+        Returns the left-deep order with the lowest cost, using dynamic programming. Orders with
+        cross products are only considered if the tables can't be joined otherwise.
+        """
+        full = (1 << len(self.rows)) - 1
+        plans = self._plans(cross_products=False)
+        if full not in plans:
+            plans = self._plans(cross_products=True)
+        return plans[full][1]
+
+    def _plans(self, cross_products: bool) -> t.Dict[int, t.Tuple[float, t.List[int]]]:
+        n = len(self.rows)
+        plans: t.Dict[int, t.Tuple[float, t.List[int]]] = {1 << i: (0.0, [i]) for i in range(n)}
+
+        # Subsets are numerically smaller than their supersets, so they're planned before them
+        for tables in range(1, 1 << n):
+            if not tables & (tables - 1):
+                continue
+
+            best = None
+            for i in range(n):
+                table = 1 << i
+                plan = plans.get(tables ^ table) if tables & table else None
+
+                if plan and (cross_products or self.connected(table, tables ^ table)):
+                    # Ties are broken by the tables' original order, which is then preserved
+                    candidate = (plan[0], plan[1] + [i])
+                    if best is None or candidate < best:
+                        best = candidate
+
+            if best:
+                plans[tables] = (best[0] + self.size(tables), best[1])
+
+        return plans
+
+    def greedy_order(self) -> t.List[int]:
+        """
+        Returns a left-deep order that starts with the smallest join of two tables and then
+        repeatedly joins the table that yields the smallest result.
+        """
+        n = len(self.rows)
+        order = list(
+            min(
+                (not self.connected(1 << i, 1 << j), self.size(1 << i | 1 << j), i, j)
+                for i in range(n)
+                for j in range(i + 1, n)
+            )[2:]
+        )
+        tables = 1 << order[0] | 1 << order[1]
+
+        while len(order) < n:
+            _, _, i = min(
+                (not self.connected(1 << i, tables), self.size(tables | 1 << i), i)
+                for i in range(n)
+                if not tables & 1 << i
+            )
+            order.append(i)
+            tables |= 1 << i
+
+        return order
+
+
+def _scan(
+    node: exp.Expression,
+) -> t.Tuple[t.Optional[exp.Table], t.Optional[t.Dict[str, str]], t.Optional[exp.Expression]]:
+    """
+    Returns the table a source reads and the condition it's filtered with. Derived tables that
+    only filter and project a single table, e.g. after `pushdown_predicates`, are scans of that
+    table, in which case their columns are also mapped to those of the table.
+    """
+    if isinstance(node, exp.Table):
+        return node, None, None
+
+    query = node.this
+    from_ = query.args.get("from_") if isinstance(query, exp.Select) else None
+
+    if (
+        not from_
+        or not isinstance(from_.this, exp.Table)
+        or not isinstance(from_.this.this, exp.Identifier)
+        or any(query.args.get(arg) for arg in _NON_SCAN_ARGS)
+    ):
+        return None, None, None
+
+    columns = {
+        projection.alias_or_name: projection.unalias().name
+        for projection in query.expressions
+        if isinstance(projection.unalias(), exp.Column)
+    }
+    where = query.args.get("where")
+    return from_.this, columns, where and where.this
+
+
+def _conjuncts(condition: t.Optional[exp.Expression]) -> t.List[exp.Expression]:
+    if condition is None:
+        return []
+    if isinstance(condition, exp.And):
+        return list(condition.flatten())
+    return [condition]
+
+
 def other_table_names(join: exp.Join) -> t.Set[str]:
     on = join.args.get("on")
     return exp.column_table_names(on, join.alias_or_name) if on else set()
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import inspect
 import typing as t
+from contextlib import nullcontext
 
 from sqlglot import Schema, exp
-from sqlglot.dialects.dialect import DialectType
+from sqlglot.dialects.dialect import Dialect, DialectType
+from sqlglot.helper import Budget, LRUCache
 from sqlglot.optimizer.annotate_types import annotate_types
 from sqlglot.optimizer.canonicalize import canonicalize
 from sqlglot.optimizer.eliminate_ctes import eliminate_ctes
@@ -17,9 +19,11 @@ from sqlglot.optimizer.pushdown_predicates import pushdown_predicates
 from sqlglot.optimizer.pushdown_projections import pushdown_projections
 from sqlglot.optimizer.qualify import qualify
 from sqlglot.optimizer.qualify_columns import quote_identifiers
+from sqlglot.optimizer.scope import cached_scopes, uncached_scopes
 from sqlglot.optimizer.simplify import simplify
+from sqlglot.optimizer.trace import Tracer
 from sqlglot.optimizer.unnest_subqueries import unnest_subqueries
-from sqlglot.schema import ensure_schema
+from sqlglot.schema import MappingSchema, ensure_schema
 
 RULES = (
     qualify,
@@ -47,6 +51,10 @@ def optimize(
     dialect: DialectType = None,
     rules: t.Sequence[t.Callable] = RULES,
     sql: t.Optional[str] = None,
+    cache: t.Optional[LRUCache] = None,
+    tracer: t.Optional[Tracer] = None,
+    budget: t.Optional[Budget] = None,
+    reuse_scopes: bool = True,
     **kwargs,
 ) -> exp.Expression:
     """
@@ -69,6 +77,25 @@ def optimize(
             Do not remove `qualify` from the sequence of rules unless you know what you're doing!
         sql: Original SQL string for error highlighting. If not provided, errors will not include
             highlighting. Requires that the expression has position metadata from parsing.
+        cache: an optional LRU cache that memoizes the optimized trees of queries which only differ
+            in their literal values. It's keyed by the query's `fingerprint`, the schema's contents,
+            the rules and the remaining arguments. A hit returns a copy of the cached tree, where
+            the literals are replaced with those of the query being optimized. Trees are only
+            cached if they don't depend on the literals' values, so hits are equivalent to the
+            result of optimizing the query directly, although they may be simplified less. Only
+            queries against a `sqlglot.schema.MappingSchema` are cached, since the contents of
+            other schemas can't be fingerprinted.
+        tracer: an optional `sqlglot.optimizer.trace.Tracer`, which measures each rule, the steps
+            of the rules that support it, such as `qualify`, as well as the whole optimization.
+        budget: an optional `sqlglot.helper.Budget` that limits the time and/or the number of
+            operations spent. Once it's exhausted, the expensive rewrites, i.e. `normalize`'s
+            distributive law, `simplify`'s fix point iteration and `merge_subqueries`, stop and
+            the tree reached so far is returned, after the remaining, cheaper rules are applied.
+        reuse_scopes: whether to share the scopes across the rules, so that each rule only rebuilds
+            the scopes that are affected by the changes of the previous ones. This relies on the
+            rules changing the tree through the `Expression` API, e.g. `set` and `replace`, rather
+            than by modifying `args` directly. Rules other than the ones in `RULES` are assumed not
+            to, so the scopes are built from scratch for them and for the rule that follows them.
         **kwargs: If a rule has a keyword argument with a same name in **kwargs, it will be passed in.
 
     Returns:
@@ -83,16 +110,206 @@ def optimize(
         "sql": sql,
         "isolate_tables": True,  # needed for other optimizations to perform well
         "quote_identifiers": False,
+        "tracer": tracer,
+        "budget": budget,
+        "reuse_scopes": reuse_scopes,
         **kwargs,
     }
 
-    optimized = exp.maybe_parse(expression, dialect=dialect, copy=True)
+    # Only the schemas that have a fingerprint can be part of the key, since the contents of
+    # the others, e.g. a `LazySchema` whose tables expire, may change without notice
+    if cache is None or not isinstance(schema, MappingSchema):
+        optimized = exp.maybe_parse(expression, dialect=dialect, copy=True)
+        return _optimize(optimized, rules, possible_kwargs)
+
+    # The expression is only copied if it has to be optimized, since `_parameterize` copies it too
+    expression = exp.maybe_parse(expression, dialect=dialect)
+    dialect = Dialect.get_or_raise(dialect)
+    template, literals = _parameterize(expression)
+    key: t.Any = (
+        hash(template),
+        schema.fingerprint(),
+        tuple(rules),
+        type(dialect),
+        dialect.version,
+        dialect.normalization_strategy,
+        tuple(sorted(dialect.settings.items())),
+        tuple(
+            sorted(
+                (name, value)
+                for name, value in possible_kwargs.items()
+                if name not in ("schema", "dialect", "sql", "tracer", "budget", "reuse_scopes")
+            )
+        ),
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        # Some of the rules' arguments can't be part of the key, so the result isn't cacheable
+        return _optimize(expression.copy(), rules, possible_kwargs)
+
+    entry = cache.get(key)
+    if entry is not None:
+        cached, slots = entry
+        if cached is None:
+            return _optimize(expression.copy(), rules, possible_kwargs)
+
+        result = cached.copy()
+        nodes = list(result.dfs())
+        for index, slot in slots:
+            nodes[index].set("this", literals[slot].this)
+        return result
+
+    optimized = _optimize(expression.copy(), rules, possible_kwargs)
+
+    # Budgeted results may be incomplete, so they're not cached
+    if budget is not None:
+        return optimized
+
+    # The query is also optimized with its literals replaced by placeholders. If binding them
+    # yields the same tree, then none of the rules depended on the literals' values (e.g. by
+    # folding constants), so the result is valid for any other literals with the same fingerprint
+    generic: t.Optional[exp.Expression]
+    try:
+        generic = _optimize(template, rules, {**possible_kwargs, "tracer": None})
+    except Exception:
+        # Placeholders aren't valid everywhere a literal is, in which case we just don't cache
+        generic = None
+
+    slots = []
+    if generic is not None:
+        placeholders = []
+        for index, (_, node) in enumerate(zip(optimized.dfs(), generic.dfs())):
+            if type(node) is exp.Placeholder and "literal" in node.meta:
+                placeholders.append(node)
+                slots.append((index, node.meta["literal"]))
+
+        bound = {
+            id(node.replace(literals[slot].copy())) for node, (_, slot) in zip(placeholders, slots)
+        }
+
+        # Equality ignores the types and the metadata, which may depend on the literals' values too.
+        # The bound literals are skipped, since they're taken from the query on a hit, as are the
+        # types that are unknown because they're derived from placeholders
+        if generic != optimized or any(
+            id(node) not in bound
+            and (
+                node._meta != other._meta
+                or (node.type != other.type and not node.is_type(exp.DataType.Type.UNKNOWN))
+            )
+            for node, other in zip(generic.dfs(), optimized.dfs())
+        ):
+            generic = None
+
+    cache.put(key, (optimized.copy() if generic is not None else None, slots))
+    return optimized
+
+
+def fingerprint(expression: exp.Expression) -> int:
+    """
+    Computes a hash of an expression that doesn't depend on the values of its literals, but only on
+    their kinds and on which of them are equal to each other. Literals that are part of constant
+    expressions, as well as positional references and date parts or units, are considered part of
+    the query's structure.
+
+    Like `Expression.__hash__`, the result is only stable within a single process.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> a = fingerprint(parse_one("SELECT * FROM x WHERE a = 1 AND b = 'x'"))
+        >>> a == fingerprint(parse_one("SELECT * FROM x WHERE a = 2 AND b = 'y'"))
+        True
+        >>> a == fingerprint(parse_one("SELECT * FROM x WHERE a = 1 AND b = 1"))
+        False
+
+    Args:
+        expression: the expression to fingerprint.
+
+    Returns:
+        The fingerprint.
+    """
+    return hash(_parameterize(expression)[0])
+
+
+def _optimize(
+    expression: exp.Expression, rules: t.Sequence[t.Callable], possible_kwargs: t.Dict[str, t.Any]
+) -> exp.Expression:
+    tracer = possible_kwargs["tracer"]
+
+    # The scopes are shared across rules and only rebuilt where the tree changed in between
+    with cached_scopes() if possible_kwargs["reuse_scopes"] else nullcontext():
+        if tracer:
+            return tracer.run("optimize", _apply_rules, expression, rules, possible_kwargs)
+        return _apply_rules(expression, rules, possible_kwargs)
+
+
+def _apply_rules(
+    expression: exp.Expression, rules: t.Sequence[t.Callable], possible_kwargs: t.Dict[str, t.Any]
+) -> exp.Expression:
+    tracer = possible_kwargs["tracer"]
+
     for rule in rules:
         # Find any additional rule parameters, beyond `expression`
         rule_params = inspect.getfullargspec(rule).args
         rule_kwargs = {
             param: possible_kwargs[param] for param in rule_params if param in possible_kwargs
         }
-        optimized = rule(optimized, **rule_kwargs)
 
-    return optimized
+        # Other rules may change the tree in ways that the scope cache can't track
+        with nullcontext() if rule in RULES else uncached_scopes():
+            if tracer:
+                expression = tracer.run(rule.__name__, rule, expression, **rule_kwargs)
+            else:
+                expression = rule(expression, **rule_kwargs)
+
+    return expression
+
+
+def _parameterize(
+    expression: exp.Expression,
+) -> t.Tuple[exp.Expression, t.List[exp.Literal]]:
+    """
+    Returns a copy of the expression where the literals are replaced with placeholders, along with
+    the distinct literals. Equal literals share a placeholder, which refers to them by index.
+    """
+    expression = expression.copy()
+    literals: t.List[exp.Literal] = []
+    slots: t.Dict[t.Tuple[str, bool], int] = {}
+
+    for node in list(expression.walk()):
+        if type(node) is not exp.Literal or _is_structural(node):
+            continue
+
+        value = (node.this, node.is_string)
+        slot = slots.get(value)
+        if slot is None:
+            slot = slots[value] = len(literals)
+            literals.append(node)
+
+        kind = "string" if node.is_string else "int" if node.is_int else "number"
+        placeholder = exp.Placeholder(this=str(slot), kind=kind)
+        placeholder.meta["literal"] = slot
+        node.replace(placeholder)
+
+    return expression, literals
+
+
+def _is_structural(literal: exp.Literal) -> bool:
+    parent = literal.parent
+    if isinstance(parent, (exp.Ordered, exp.Group, exp.DataTypeParam)):
+        return True
+
+    # Date parts and units, e.g. `EXTRACT('YEAR' FROM x)`, determine what the function computes
+    if literal.arg_key == "unit" or (isinstance(parent, exp.Extract) and literal.arg_key == "this"):
+        return True
+
+    while isinstance(parent, (exp.Cast, exp.Interval, exp.Neg, exp.Paren)):
+        parent = parent.parent
+
+    # Constants like `1 + 1` or `CAST('2020-01-01' AS DATE) + INTERVAL '1' DAY` are usually folded
+    return (
+        isinstance(parent, (exp.Binary, exp.Func))
+        and not isinstance(parent, (exp.Predicate, exp.Connector))
+        and not parent.find(exp.Column)
+    )
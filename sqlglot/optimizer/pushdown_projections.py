@@ -166,7 +166,9 @@ def _remove_unused_selections(scope, parent_selections, schema, alias_count):
     if not new_selections:
         new_selections.append(default_selection(is_agg))
 
-    scope.expression.select(*new_selections, append=False, copy=False)
+    # The selections are left untouched if they didn't change, so that the scope stays valid
+    if removed or not scope.expression.selects:
+        scope.expression.select(*new_selections, append=False, copy=False)
 
     if removed:
         scope.clear_cache()
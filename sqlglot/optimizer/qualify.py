@@ -12,7 +12,8 @@ from sqlglot.optimizer.qualify_columns import (
     validate_qualify_columns as validate_qualify_columns_func,
 )
 from sqlglot.optimizer.qualify_tables import qualify_tables
-from sqlglot.schema import Schema, ensure_schema
+from sqlglot.optimizer.trace import Tracer, trace
+from sqlglot.schema import LazySchema, Schema, ensure_schema
 
 
 def qualify(
@@ -33,6 +34,7 @@ def qualify(
     canonicalize_table_aliases: bool = False,
     on_qualify: t.Optional[t.Callable[[exp.Expression], None]] = None,
     sql: t.Optional[str] = None,
+    tracer: t.Optional[Tracer] = None,
 ) -> exp.Expression:
     """
     Rewrite sqlglot AST to have normalized and qualified tables and columns.
@@ -50,7 +52,8 @@ def qualify(
         expression: Expression to qualify.
         db: Default database name for tables.
         catalog: Default catalog name for tables.
-        schema: Schema to infer column names and types.
+        schema: Schema to infer column names and types. If it's a `sqlglot.schema.LazySchema`,
+            the tables of the query are fetched at once, after they've been qualified.
         expand_alias_refs: Whether to expand references to aliases.
         expand_stars: Whether to expand star queries. This is a necessary step
             for most of the optimizer's rules to work; do not set to False unless you
@@ -69,6 +72,7 @@ def qualify(
         on_qualify: Callback after a table has been qualified.
         sql: Original SQL string for error highlighting. If not provided, errors will not include
             highlighting. Requires that the expression has position metadata from parsing.
+        tracer: an optional `sqlglot.optimizer.trace.Tracer`, which measures each step.
 
     Returns:
         The qualified expression.
@@ -76,12 +80,30 @@ def qualify(
     schema = ensure_schema(schema, dialect=dialect)
     dialect = Dialect.get_or_raise(dialect)
 
-    expression = normalize_identifiers(
+    expression = trace(
+        tracer,
+        normalize_identifiers,
         expression,
         dialect=dialect,
         store_original_column_identifiers=True,
     )
-    expression = qualify_tables(
+
+    if isinstance(schema, LazySchema):
+        # The tables are collected as they're qualified, so that they're all fetched at once
+        tables: t.List[exp.Table] = []
+        callback = on_qualify
+
+        def collect(table: exp.Expression) -> None:
+            if isinstance(table, exp.Table) and isinstance(table.this, exp.Identifier):
+                tables.append(table)
+            if callback:
+                callback(table)
+
+        on_qualify = collect
+
+    expression = trace(
+        tracer,
+        qualify_tables,
         expression,
         db=db,
         catalog=catalog,
@@ -90,11 +112,16 @@ def qualify(
         canonicalize_table_aliases=canonicalize_table_aliases,
     )
 
+    if isinstance(schema, LazySchema):
+        schema.prefetch(tables, dialect=dialect)
+
     if isolate_tables:
-        expression = isolate_table_selects(expression, schema=schema)
+        expression = trace(tracer, isolate_table_selects, expression, schema=schema)
 
     if qualify_columns:
-        expression = qualify_columns_func(
+        expression = trace(
+            tracer,
+            qualify_columns_func,
             expression,
             schema,
             expand_alias_refs=expand_alias_refs,
@@ -104,9 +131,11 @@ def qualify(
         )
 
     if quote_identifiers:
-        expression = quote_identifiers_func(expression, dialect=dialect, identify=identify)
+        expression = trace(
+            tracer, quote_identifiers_func, expression, dialect=dialect, identify=identify
+        )
 
     if validate_qualify_columns:
-        validate_qualify_columns_func(expression, sql=sql)
+        trace(tracer, validate_qualify_columns_func, expression, sql=sql)
 
     return expression
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import itertools
 import logging
+import threading
 import typing as t
 from collections import defaultdict
+from contextlib import contextmanager
 from enum import Enum, auto
 
 from sqlglot import exp
@@ -14,6 +16,9 @@ logger = logging.getLogger("sqlglot")
 
 TRAVERSABLES = (exp.Query, exp.DDL, exp.DML)
 
+# Maps thread ids to the caches of the `cached_scopes` blocks that are active in them
+_SCOPE_CACHES: t.Dict[int, ScopeCache] = {}
+
 
 class ScopeType(Enum):
     ROOT = auto()
@@ -85,7 +90,17 @@ class Scope:
         self.can_be_correlated = can_be_correlated
         self.clear_cache()
 
+        # The sources this scope was created with, i.e. the ones it inherits from its ancestors
+        self._inherited_sources = (self.cte_sources.copy(), self.lateral_sources.copy())
+        # The FROM/JOIN sources the scope was built with, along with their names at the time
+        self._source_names: t.List[t.Tuple[exp.Expression, str]] = []
+        # Whether the scope has been changed since it was built, as opposed to the tree itself
+        self._modified = False
+        # The scopes of a previous traversal that can be reused when traversing this one
+        self._reusable = None
+
     def clear_cache(self):
+        self._modified = True
         self._collected = False
         self._raw_columns = None
         self._table_columns = None
@@ -108,7 +123,7 @@ class Scope:
         self, expression, scope_type, sources=None, cte_sources=None, lateral_sources=None, **kwargs
     ):
         """Branch from the current scope to a new, inner scope"""
-        return Scope(
+        scope = Scope(
             expression=expression.unnest(),
             sources=sources.copy() if sources else None,
             parent=self,
@@ -119,6 +134,8 @@ class Scope:
             or scope_type in (ScopeType.SUBQUERY, ScopeType.UDTF),
             **kwargs,
         )
+        scope._reusable = self._reusable
+        return scope
 
     def _collect(self):
         self._tables = []
@@ -488,6 +505,7 @@ class Scope:
         old_name = old_name or ""
         if old_name in self.sources:
             self.sources[new_name] = self.sources.pop(old_name)
+            self._modified = True
 
     def add_source(self, name, source):
         """Add a source to this scope"""
@@ -574,6 +592,9 @@ def traverse_scope(expression: exp.Expression) -> t.List[Scope]:
         A list of the created scope instances
     """
     if isinstance(expression, TRAVERSABLES):
+        cache = _SCOPE_CACHES.get(threading.get_ident())
+        if cache is not None:
+            return cache.traverse(expression)
         return list(_traverse_scope(Scope(expression)))
     return []
 
@@ -591,9 +612,192 @@ def build_scope(expression: exp.Expression) -> t.Optional[Scope]:
     return seq_get(traverse_scope(expression), -1)
 
 
+class ScopeCache:
+    """
+    Keeps the scopes of the last tree traversed by `traverse_scope` within a `cached_scopes` block,
+    along with the log of the mutations that have been made since.
+
+    When the same tree is traversed again, only the scopes that contain mutated expressions, or
+    that were changed themselves, are rebuilt. The rest are reused, provided that they inherit the
+    same sources from their ancestors as before and that none of their ancestors' sources have been
+    renamed since.
+
+    Args:
+        log: the log of the block's `sqlglot.expressions.track_mutations` block.
+    """
+
+    def __init__(self, log: exp.MutationLog) -> None:
+        self.log = log
+        self.scopes: t.List[Scope] = []
+        self.builds = 0
+        self.reused = 0
+
+    def traverse(self, expression: exp.Expression) -> t.List[Scope]:
+        previous = self.scopes
+        root = Scope(expression)
+
+        if previous and previous[-1].expression is expression:
+            if not self.log and not any(scope._modified for scope in previous):
+                self.reused += len(previous)
+                return list(previous)
+
+            root._reusable = self._reusable()
+
+        self.log.clear()
+        self.scopes = list(_traverse_scope(root))
+        self.builds += 1
+
+        previous_ids = {id(scope) for scope in previous}
+        for scope in self.scopes:
+            scope._reusable = None
+            if id(scope) in previous_ids:
+                self.reused += 1
+
+        return list(self.scopes)
+
+    def clear(self) -> None:
+        """Forgets the scopes, so that the next traversal builds them from scratch."""
+        self.scopes = []
+        self.log.clear()
+
+    def _reusable(self) -> t.Dict[int, t.List[Scope]]:
+        # The ids of the mutated expressions and their ancestors, i.e. the ones whose subtree changed
+        dirty = set()
+        for expression in self.log.expressions:
+            node: t.Optional[exp.Expression] = expression
+            while node and id(node) not in dirty:
+                dirty.add(id(node))
+                node = node.parent
+
+        # Each scope is yielded right after the scopes in its subtree, which precede it contiguously
+        reusable = {}
+        sizes: t.Dict[int, int] = {}
+        subtrees: t.List[t.List[Scope]] = []
+
+        # The scopes below a scope whose sources were renamed, which they may refer to by name
+        stale: t.Set[int] = set()
+
+        for i, scope in enumerate(self.scopes):
+            size = sizes[id(scope)] = 1 + sum(
+                sizes.get(id(child), 0)
+                for child in itertools.chain(
+                    scope.cte_scopes, scope.union_scopes, scope.table_scopes, scope.subquery_scopes
+                )
+            )
+            subtree = self.scopes[max(i - size + 1, 0) : i + 1]
+            subtrees.append(subtree)
+
+            if any(_source_name(source) != name for source, name in scope._source_names):
+                stale.update(id(s) for s in subtree[:-1])
+
+        for scope, subtree in zip(self.scopes, subtrees):
+            members = {id(s) for s in subtree}
+
+            if (
+                id(scope.expression) not in dirty
+                and id(scope) not in stale
+                and len(subtree) == sizes[id(scope)]
+                and all(s is scope or id(s.parent) in members for s in subtree)
+                and not any(s._modified for s in subtree)
+            ):
+                reusable[id(scope.expression)] = subtree
+
+        return reusable
+
+
+@contextmanager
+def cached_scopes() -> t.Iterator[t.Optional[ScopeCache]]:
+    """
+    Shares scopes across the `traverse_scope` and `build_scope` calls made within the block.
+
+    Optimizer rules build the scopes of the tree they transform from scratch. Within the block, the
+    scopes built by a rule are kept and the mutations made to the tree are tracked, so that the
+    next rule that traverses the same tree only rebuilds the scopes that are affected by them.
+
+    Like `sqlglot.expressions.track_mutations`, the cache is per thread and it only sees changes
+    made through the `Expression` API, so code that changes trees otherwise must be run within an
+    `uncached_scopes` block. If mutations can't be tracked, e.g. because the block is nested within
+    another one, the scopes are built from scratch as usual.
+
+    Yields:
+        The cache, or `None` if the scopes are not cached.
+    """
+    thread_id = threading.get_ident()
+
+    if thread_id in _SCOPE_CACHES:
+        yield None
+        return
+
+    with exp.track_mutations() as log:
+        if log is None:
+            yield None
+            return
+
+        cache = ScopeCache(log)
+        _SCOPE_CACHES[thread_id] = cache
+
+        try:
+            yield cache
+        finally:
+            del _SCOPE_CACHES[thread_id]
+
+
+@contextmanager
+def uncached_scopes() -> t.Iterator[None]:
+    """
+    Builds the scopes from scratch within the block, even if it's nested within a `cached_scopes`
+    block, whose cache is cleared afterwards.
+
+    This is meant for code that may change trees without going through the `Expression` API, e.g.
+    by modifying their `args` directly, since the cache can't tell which scopes are affected then.
+    """
+    thread_id = threading.get_ident()
+    cache = _SCOPE_CACHES.pop(thread_id, None)
+
+    try:
+        yield
+    finally:
+        if cache is not None:
+            cache.clear()
+            _SCOPE_CACHES[thread_id] = cache
+
+
+def _can_reuse(scope: Scope, previous: Scope) -> bool:
+    cte_sources, lateral_sources = previous._inherited_sources
+    new_cte_sources, new_lateral_sources = scope._inherited_sources
+
+    return (
+        scope.scope_type == previous.scope_type
+        and scope.outer_columns == previous.outer_columns
+        and scope.can_be_correlated == previous.can_be_correlated
+        and _same_sources(new_cte_sources, cte_sources)
+        and _same_sources(new_lateral_sources, lateral_sources)
+    )
+
+
+def _same_sources(sources: t.Dict[str, t.Any], other: t.Dict[str, t.Any]) -> bool:
+    return sources.keys() == other.keys() and all(v is other[k] for k, v in sources.items())
+
+
 def _traverse_scope(scope):
     expression = scope.expression
 
+    if scope._reusable:
+        subtree = scope._reusable.get(id(expression))
+        if subtree and _can_reuse(scope, subtree[-1]):
+            subtree[-1].parent = scope.parent
+            for reused in subtree:
+                # Properties like the external columns may have been computed before later changes
+                # within the subtree, e.g. the qualification of its columns, so the scope is reset
+                # to the state it would be in had it been built by this traversal
+                collected = reused._collected
+                reused.clear_cache()
+                reused._modified = False
+                if collected:
+                    reused._collect()
+            yield from subtree
+            return
+
     if isinstance(expression, exp.Select):
         yield from _traverse_select(scope)
     elif isinstance(expression, exp.SetOperation):
@@ -814,6 +1018,11 @@ def _traverse_tables(scope):
             scope.table_scopes.append(child_scope)
 
     scope.sources.update(sources)
+    scope._source_names = [
+        (expression, _source_name(expression))
+        for expression in expressions
+        if isinstance(expression, (exp.Table, exp.DerivedTable))
+    ]
 
 
 def _traverse_subqueries(scope):
@@ -935,6 +1144,12 @@ def find_in_scope(expression, expression_types, bfs=True):
     return next(find_all_in_scope(expression, expression_types, bfs=bfs), None)
 
 
+def _source_name(expression: exp.Expression) -> str:
+    if isinstance(expression, exp.Table):
+        return expression.alias_or_name
+    return _get_source_alias(expression)
+
+
 def _get_source_alias(expression):
     alias_arg = expression.args.get("alias")
     alias_name = expression.alias
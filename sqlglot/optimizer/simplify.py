@@ -10,7 +10,7 @@ from functools import reduce, wraps
 
 import sqlglot
 from sqlglot import Dialect, exp
-from sqlglot.helper import first, merge_ranges, while_changing
+from sqlglot.helper import Budget, first, merge_ranges, while_changing
 from sqlglot.optimizer.annotate_types import TypeAnnotator
 from sqlglot.optimizer.scope import find_all_in_scope, walk_in_scope
 from sqlglot.schema import ensure_schema
@@ -23,6 +23,9 @@ if t.TYPE_CHECKING:
         [exp.Expression, datetime.date, str, Dialect, exp.DataType], t.Optional[exp.Expression]
     ]
 
+    # Maps the id of a settled node to the node, its hash, its parent's type and its root flag
+    Settled = t.Dict[int, t.Tuple[exp.Expression, int, t.Type, bool]]
+
 
 logger = logging.getLogger("sqlglot")
 
@@ -44,6 +47,7 @@ def simplify(
     constant_propagation: bool = False,
     coalesce_simplification: bool = False,
     dialect: DialectType = None,
+    budget: t.Optional[Budget] = None,
 ):
     """
     Rewrite sqlglot AST to simplify expressions.
@@ -60,10 +64,12 @@ def simplify(
         coalesce_simplification: whether the simplify coalesce rule should be used.
             This rule tries to remove coalesce functions, which can be useful in certain analyses but
             can leave the query more verbose.
+        budget: an optional `sqlglot.helper.Budget`. Once it's exhausted, the expressions that
+            haven't been simplified yet are left as they are.
     Returns:
         sqlglot.Expression: simplified expression
     """
-    return Simplifier(dialect=dialect).simplify(
+    return Simplifier(dialect=dialect, budget=budget).simplify(
         expression,
         constant_propagation=constant_propagation,
         coalesce_simplification=coalesce_simplification,
@@ -470,9 +476,15 @@ def boolean_literal(condition):
 
 
 class Simplifier:
-    def __init__(self, dialect: DialectType = None, annotate_new_expressions: bool = True):
+    def __init__(
+        self,
+        dialect: DialectType = None,
+        annotate_new_expressions: bool = True,
+        budget: t.Optional[Budget] = None,
+    ):
         self.dialect = Dialect.get_or_raise(dialect)
         self.annotate_new_expressions = annotate_new_expressions
+        self.budget = budget
 
         self._annotator: TypeAnnotator = TypeAnnotator(
             schema=ensure_schema(None, dialect=self.dialect), overwrite_types=False
@@ -551,6 +563,8 @@ class Simplifier:
 
     SAFE_CONNECTOR_ELIMINATION_RESULT = (exp.Connector, exp.Boolean)
 
+    CONNECTOR_CONSTANTS = (exp.Boolean, exp.Literal, exp.Null)
+
     # CROSS joins result in an empty table if the right table is empty.
     # So we can only simplify certain types of joins to CROSS.
     # Or in other words, LEFT JOIN x ON TRUE != CROSS JOIN x
@@ -600,8 +614,8 @@ class Simplifier:
                             break
 
             if isinstance(node, exp.Condition):
-                simplified = while_changing(
-                    node, lambda e: self._simplify(e, constant_propagation, coalesce_simplification)
+                simplified = self._simplify_until_fixpoint(
+                    node, constant_propagation, coalesce_simplification
                 )
 
                 if node is expression:
@@ -631,13 +645,42 @@ class Simplifier:
 
         return expression
 
-    def _simplify(
+    def _simplify_until_fixpoint(
         self, expression: exp.Expression, constant_propagation: bool, coalesce_simplification: bool
+    ) -> exp.Expression:
+        """
+        Simplifies a condition until its hash doesn't change anymore.
+
+        Every pass records the subtrees that it left untouched, so that the next passes skip them
+        unless they've changed since. The rewrites only depend on a node's subtree, the type of its
+        parent and whether it's the root, so applying them again to such a subtree would just
+        reproduce it. Hashes are cached on the nodes and are invalidated along the parent chain when
+        they change, so checking whether a subtree is settled is cheap.
+        """
+        settled: Settled = {}
+
+        return while_changing(
+            expression,
+            lambda e: self._simplify(e, constant_propagation, coalesce_simplification, settled),
+            self.budget,
+        )
+
+    def _simplify(
+        self,
+        expression: exp.Expression,
+        constant_propagation: bool,
+        coalesce_simplification: bool,
+        settled: t.Optional[Settled] = None,
     ):
+        budget = self.budget
         pre_transformation_stack = [expression]
         post_transformation_stack = []
 
         while pre_transformation_stack:
+            # The subtrees that haven't been visited yet are left as they are
+            if budget and budget.spend():
+                break
+
             original = pre_transformation_stack.pop()
             node = original
 
@@ -648,6 +691,21 @@ class Simplifier:
 
             parent = node.parent
             root = node is expression
+            start_hash = None
+
+            if settled is not None:
+                start_hash = hash(node)
+                entry = settled.get(id(node))
+
+                # The subtree was left as it is by a previous pass and its context is the same
+                if (
+                    entry
+                    and entry[1] == start_hash
+                    and entry[2] is type(parent)
+                    and entry[3] is root
+                    and not (isinstance(node, exp.Paren) and isinstance(parent, exp.Dot))
+                ):
+                    continue
 
             node = self.rewrite_between(node)
             node = self.uniq_sort(node, root)
@@ -667,10 +725,12 @@ class Simplifier:
             pre_transformation_stack.extend(
                 n for n in node.iter_expressions(reverse=True) if not n.meta.get(FINAL)
             )
-            post_transformation_stack.append((node, parent))
+            post_transformation_stack.append(
+                (node, parent, start_hash if node is original else None)
+            )
 
         while post_transformation_stack:
-            original, parent = post_transformation_stack.pop()
+            original, parent, start_hash = post_transformation_stack.pop()
             root = original is expression
 
             # Resets parent, arg_key, index pointers– this is needed because some of the
@@ -678,6 +738,10 @@ class Simplifier:
             for k, v in tuple(original.args.items()):
                 original.set(k, v)
 
+            if budget and budget.exhausted:
+                node = original
+                continue
+
             # Post-order transformations
             node = self.simplify_not(original)
             node = flatten(node)
@@ -697,6 +761,8 @@ class Simplifier:
 
             if node is not original:
                 original.replace(node)
+            elif settled is not None and start_hash is not None and hash(node) == start_hash:
+                settled[id(node)] = (node, start_hash, type(parent), root)
 
         return node
 
@@ -812,7 +878,9 @@ class Simplifier:
 
         if isinstance(expression, exp.Connector):
             original_parent = expression.parent
-            expression = self._flat_simplify(expression, _simplify_connectors, root)
+            expression = self._flat_simplify(
+                expression, _simplify_connectors, root, self._connector_operands_can_simplify
+            )
 
             # If we reduced a connector to, e.g., a column (t1 AND ... AND tn -> Tk), then we need
             # to ensure that the resulting type is boolean. We know this is true only for connectors,
@@ -834,6 +902,22 @@ class Simplifier:
 
         return expression
 
+    def _connector_operands_can_simplify(self, operands):
+        # Two operands of a connector can only be simplified together if one of them is a constant
+        # or if they're both comparisons. This is checked upfront, because otherwise long chains of
+        # conjunctions and disjunctions, e.g. ORs of ANDs, would take quadratic time to simplify.
+        comparisons = 0
+
+        for operand in operands:
+            if isinstance(operand, self.CONNECTOR_CONSTANTS):
+                return True
+            if isinstance(operand, self.COMPARISONS):
+                comparisons += 1
+                if comparisons > 1:
+                    return True
+
+        return False
+
     @annotate_types_on_change
     def _simplify_comparison(self, expression, left, right, or_=False):
         if isinstance(left, self.COMPARISONS) and isinstance(right, self.COMPARISONS):
@@ -1426,16 +1510,31 @@ class Simplifier:
                 )
         return expression
 
-    def _flat_simplify(self, expression, simplifier, root=True):
+    def _flat_simplify(self, expression, simplifier, root=True, can_simplify=None):
         if root or not expression.same_parent:
             operands = []
             queue = deque(expression.flatten(unnest=False))
             size = len(queue)
 
+            # Every pair of operands is checked, so this is skipped if none of them can be simplified
+            if can_simplify and not can_simplify(queue):
+                return expression
+
+            budget = self.budget
+
             while queue:
                 a = queue.popleft()
 
+                # The remaining operands are kept as they are
+                if budget and budget.exhausted:
+                    operands.append(a)
+                    continue
+
                 for b in queue:
+                    if budget and budget.spend():
+                        operands.append(a)
+                        break
+
                     result = simplifier(expression, a, b)
 
                     if result and result is not expression:
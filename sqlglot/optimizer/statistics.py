@@ -0,0 +1,204 @@
+"""
+## Statistics
+
+`Statistics` holds the row counts of tables and the number of distinct values (NDV) of their
+columns, which `sqlglot.optimizer.optimize_joins.optimize_joins` uses to estimate the size of
+joins and order them by cost.
+
+Example:
+    >>> from sqlglot import parse_one
+    >>> stats = Statistics({"x": TableStats(rows=1000, ndv={"a": 10})})
+    >>> stats.find(exp.to_table("x")).rows
+    1000
+    >>> selectivity(parse_one("x.a = 1"), lambda column: stats.ndv(exp.to_table("x"), column.name))
+    0.1
+
+The selectivities of the predicates that can't be estimated from the statistics are PostgreSQL's
+defaults, and predicates are assumed to be independent of each other.
+"""
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass, field
+
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect, DialectType
+from sqlglot.schema import normalize_name
+
+DEFAULT_ROWS = 1000.0
+"""The row count of the tables without statistics, e.g. derived tables."""
+DEFAULT_EQ_SELECTIVITY = 0.005
+"""The selectivity of an equality with an unknown number of distinct values."""
+DEFAULT_INEQ_SELECTIVITY = 1 / 3
+"""The selectivity of an inequality, e.g. `a > 1`."""
+DEFAULT_RANGE_SELECTIVITY = 0.005
+"""The selectivity of a range, e.g. `a BETWEEN 1 AND 2`."""
+DEFAULT_MATCH_SELECTIVITY = 0.005
+"""The selectivity of a pattern match, e.g. `a LIKE 'x%'`."""
+DEFAULT_NULL_SELECTIVITY = 0.005
+"""The selectivity of a null check, e.g. `a IS NULL`."""
+DEFAULT_SELECTIVITY = 0.5
+"""The selectivity of the predicates that aren't recognized."""
+
+
+@dataclass
+class TableStats:
+    """The statistics of a table."""
+
+    rows: float
+    """The number of rows."""
+    ndv: t.Dict[str, float] = field(default_factory=dict)
+    """The number of distinct values of the columns, if they're known."""
+
+
+class Statistics:
+    """
+    The statistics of a set of tables.
+
+    Tables are matched by their qualified names, e.g. `db.x`. Tables that are referenced with
+    fewer qualifiers than their statistics, or vice versa, are matched if that's unambiguous.
+
+    Args:
+        tables: a mapping from the names of the tables to their statistics.
+        dialect: the dialect used to parse and normalize the names of tables and columns.
+        normalize: whether to normalize the names according to the dialect.
+    """
+
+    def __init__(
+        self,
+        tables: t.Optional[t.Dict[str, TableStats]] = None,
+        dialect: DialectType = None,
+        normalize: bool = True,
+    ) -> None:
+        self.dialect = Dialect.get_or_raise(dialect)
+        self.normalize = normalize
+        self._tables: t.Dict[t.Tuple[str, ...], TableStats] = {}
+        # Maps the suffixes of the tables' paths, e.g. (table,) for (db, table), to their full
+        # path, or to None if several tables share the suffix
+        self._suffixes: t.Dict[t.Tuple[str, ...], t.Optional[t.Tuple[str, ...]]] = {}
+
+        for table, stats in (tables or {}).items():
+            self.add_table(table, stats.rows, stats.ndv)
+
+    def add_table(
+        self, table: exp.Table | str, rows: float, ndv: t.Optional[t.Dict[str, float]] = None
+    ) -> None:
+        """
+        Registers or replaces the statistics of a table.
+
+        Args:
+            table: the table.
+            rows: its number of rows.
+            ndv: the number of distinct values of its columns.
+        """
+        path = self._path(table)
+
+        if path not in self._tables:
+            for i in range(1, len(path)):
+                suffix = path[i:]
+                self._suffixes[suffix] = None if suffix in self._suffixes else path
+
+        self._tables[path] = TableStats(
+            rows=rows,
+            ndv={self._name(column): value for column, value in (ndv or {}).items()},
+        )
+
+    def find(self, table: exp.Table | str) -> t.Optional[TableStats]:
+        """Returns the statistics of a table, or None if they're unknown or ambiguous."""
+        path = self._path(table)
+        stats = self._tables.get(path)
+
+        if stats is None:
+            full_path = self._suffixes.get(path)
+            if full_path:
+                return self._tables[full_path]
+
+            for i in range(1, len(path)):
+                stats = self._tables.get(path[i:])
+                if stats is not None:
+                    break
+
+        return stats
+
+    def ndv(self, table: exp.Table | str, column: str) -> t.Optional[float]:
+        """Returns the number of distinct values of a column, or None if it's unknown."""
+        stats = self.find(table)
+        if stats is None:
+            return None
+
+        ndv = stats.ndv.get(self._name(column))
+        return None if ndv is None else min(ndv, stats.rows)
+
+    def _path(self, table: exp.Table | str) -> t.Tuple[str, ...]:
+        table = exp.maybe_parse(table, into=exp.Table, dialect=self.dialect)
+        return tuple(
+            self._name(part, is_table=True) if isinstance(part, exp.Identifier) else part.name
+            for part in table.parts
+        )
+
+    def _name(self, name: str | exp.Identifier, is_table: bool = False) -> str:
+        return normalize_name(
+            name.copy() if isinstance(name, exp.Identifier) else name,
+            dialect=self.dialect,
+            is_table=is_table,
+            normalize=self.normalize,
+        ).name
+
+
+def selectivity(
+    predicate: exp.Expression, ndv: t.Callable[[exp.Column], t.Optional[float]]
+) -> float:
+    """
+    Estimates the fraction of rows that satisfy a predicate.
+
+    Args:
+        predicate: the predicate.
+        ndv: a function that returns the number of distinct values of a column, if it's known.
+
+    Returns:
+        The selectivity, between 0 and 1.
+    """
+    if isinstance(predicate, exp.Paren):
+        return selectivity(predicate.this, ndv)
+    if isinstance(predicate, exp.And):
+        return selectivity(predicate.left, ndv) * selectivity(predicate.right, ndv)
+    if isinstance(predicate, exp.Or):
+        left = selectivity(predicate.left, ndv)
+        right = selectivity(predicate.right, ndv)
+        return left + right - left * right
+    if isinstance(predicate, exp.Not):
+        return 1 - selectivity(predicate.this, ndv)
+    if isinstance(predicate, exp.Boolean):
+        return 1.0 if predicate.this else 0.0
+    if isinstance(predicate, (exp.EQ, exp.NullSafeEQ)):
+        return _eq_selectivity(predicate.left, predicate.right, ndv)
+    if isinstance(predicate, (exp.NEQ, exp.NullSafeNEQ)):
+        return 1 - _eq_selectivity(predicate.left, predicate.right, ndv)
+    if isinstance(predicate, (exp.GT, exp.GTE, exp.LT, exp.LTE)):
+        return DEFAULT_INEQ_SELECTIVITY
+    if isinstance(predicate, exp.Between):
+        return DEFAULT_RANGE_SELECTIVITY
+    if isinstance(predicate, (exp.Like, exp.ILike, exp.RegexpLike, exp.SimilarTo)):
+        return DEFAULT_MATCH_SELECTIVITY
+    if isinstance(predicate, exp.Is):
+        return DEFAULT_NULL_SELECTIVITY
+    if isinstance(predicate, exp.In) and predicate.expressions:
+        return min(1.0, len(predicate.expressions) * _eq_selectivity(predicate.this, None, ndv))
+
+    return DEFAULT_SELECTIVITY
+
+
+def _eq_selectivity(
+    left: exp.Expression,
+    right: t.Optional[exp.Expression],
+    ndv: t.Callable[[exp.Column], t.Optional[float]],
+) -> float:
+    # An equality matches one of the distinct values of its operands, or, if both of them are
+    # columns, the values of the one with the fewest distinct values among those of the other
+    counts = [
+        count
+        for operand in (left, right)
+        if isinstance(operand, exp.Column) and (count := ndv(operand))
+    ]
+    return 1 / max(counts) if counts else DEFAULT_EQ_SELECTIVITY
@@ -0,0 +1,290 @@
+"""
+## Tracing
+
+A `Tracer` can be passed to `sqlglot.optimizer.optimize` and `sqlglot.optimizer.qualify.qualify` in
+order to measure each of the rules they apply, as well as the steps of `qualify`. It receives a
+`RuleTrace` for every rule, after it has been applied.
+
+Example:
+    >>> from sqlglot import parse_one
+    >>> from sqlglot.optimizer import optimize
+    >>> traces = []
+    >>> optimized = optimize(parse_one("SELECT a FROM x"), tracer=Tracer(traces.append))
+    >>> [trace.name for trace in traces][:2]
+    ['optimize.qualify.normalize_identifiers', 'optimize.qualify.qualify_tables']
+    >>> traces[-1].name
+    'optimize'
+
+The `Profiler` aggregates the traces of many calls, which helps with finding the rules that are
+the most expensive overall, as well as the queries that take the longest to optimize.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+import tracemalloc
+import typing as t
+from dataclasses import dataclass
+
+from sqlglot import exp
+from sqlglot.optimizer.scope import _SCOPE_CACHES
+
+E = t.TypeVar("E")
+
+
+@dataclass(frozen=True)
+class RuleTrace:
+    """The measurements of a single application of a rule."""
+
+    name: str
+    """The rule's name, prefixed by those of the enclosing rules, e.g. `qualify.qualify_tables`."""
+    seconds: float
+    """The wall time spent in the rule."""
+    nodes_before: int
+    """The number of nodes in the tree before the rule was applied."""
+    nodes_after: int
+    """The number of nodes in the tree after the rule was applied."""
+    memory_peak: t.Optional[int]
+    """The peak number of bytes allocated by the rule, if the tracer measures memory."""
+    scope_builds: t.Optional[int]
+    """The number of times the rule built the scopes of the tree, if they're shared across rules."""
+    scopes_reused: t.Optional[int]
+    """The number of scopes the rule reused instead of rebuilding them, if they're shared."""
+    expression: t.Any
+    """The rule's result."""
+
+
+class _Frame:
+    __slots__ = ("memory_start", "memory_peak")
+
+    def __init__(self, memory_start: int) -> None:
+        self.memory_start = memory_start
+        self.memory_peak = memory_start
+
+
+class Tracer:
+    """
+    Measures the rules applied by the optimizer and passes a `RuleTrace` to a callback for each.
+
+    Args:
+        callback: the function that's called with each trace.
+        memory: whether to measure the peak memory allocated by each rule using `tracemalloc`.
+            It's started and stopped as needed, unless it's already tracing. Note that this slows
+            down the rules considerably.
+    """
+
+    def __init__(
+        self,
+        callback: t.Optional[t.Callable[[RuleTrace], t.Any]] = None,
+        memory: bool = False,
+    ) -> None:
+        self.callback = callback
+        self.memory = memory
+        self._local = threading.local()
+
+    def trace(self, trace: RuleTrace) -> None:
+        """Handles a trace. By default, it's passed to the callback."""
+        if self.callback:
+            self.callback(trace)
+
+    def run(
+        self, name: str, rule: t.Callable[..., E], expression: exp.Expression, *args, **kwargs
+    ) -> E:
+        """
+        Applies a rule to an expression and traces it.
+
+        Args:
+            name: the name of the rule.
+            rule: the rule, which is called with the expression and the remaining arguments.
+            expression: the expression to apply the rule to.
+
+        Returns:
+            The result of the rule.
+        """
+        names = self._stack("names")
+        frames = self._stack("frames")
+        memory = self.memory
+
+        if memory and not frames and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._local.started = True
+
+        if memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if frames:
+                frames[-1].memory_peak = max(frames[-1].memory_peak, peak)
+            tracemalloc.reset_peak()
+            frames.append(_Frame(current))
+
+        cache = _SCOPE_CACHES.get(threading.get_ident())
+        builds, reused = (cache.builds, cache.reused) if cache else (0, 0)
+        nodes_before = _count(expression)
+        names.append(name)
+
+        start = time.perf_counter()
+        try:
+            result = rule(expression, *args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            names.pop()
+
+            memory_peak = None
+            if memory:
+                frame = frames.pop()
+                memory_peak = max(frame.memory_peak, tracemalloc.get_traced_memory()[1])
+                if frames:
+                    frames[-1].memory_peak = max(frames[-1].memory_peak, memory_peak)
+                elif getattr(self._local, "started", False):
+                    tracemalloc.stop()
+                    self._local.started = False
+                memory_peak -= frame.memory_start
+
+        self.trace(
+            RuleTrace(
+                name=".".join(names + [name]),
+                seconds=seconds,
+                nodes_before=nodes_before,
+                nodes_after=_count(result) if isinstance(result, exp.Expression) else nodes_before,
+                memory_peak=memory_peak,
+                scope_builds=cache.builds - builds if cache else None,
+                scopes_reused=cache.reused - reused if cache else None,
+                expression=result,
+            )
+        )
+
+        return result
+
+    def _stack(self, name: str) -> t.List[t.Any]:
+        stack = getattr(self._local, name, None)
+        if stack is None:
+            stack = []
+            setattr(self._local, name, stack)
+        return stack
+
+
+class RuleStats:
+    """The aggregated traces of a rule."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.nodes_before = 0
+        self.nodes_after = 0
+        self.memory_peak: t.Optional[int] = None
+        self.scope_builds = 0
+        self.scopes_reused = 0
+
+    def add(self, trace: RuleTrace) -> None:
+        self.calls += 1
+        self.seconds += trace.seconds
+        self.max_seconds = max(self.max_seconds, trace.seconds)
+        self.nodes_before += trace.nodes_before
+        self.nodes_after += trace.nodes_after
+        self.scope_builds += trace.scope_builds or 0
+        self.scopes_reused += trace.scopes_reused or 0
+
+        if trace.memory_peak is not None:
+            self.memory_peak = max(self.memory_peak or 0, trace.memory_peak)
+
+
+class Profiler(Tracer):
+    """
+    A tracer that aggregates the traces of many calls per rule and keeps the slowest calls.
+
+    Example:
+        >>> from sqlglot.optimizer import optimize
+        >>> profiler = Profiler()
+        >>> for sql in ("SELECT a FROM x", "SELECT b FROM y"):
+        ...     optimized = optimize(sql, tracer=profiler)
+        >>> profiler.stats["optimize.simplify"].calls
+        2
+        >>> len(profiler.slowest)
+        2
+
+    Args:
+        slowest: the number of slowest calls to keep, i.e. the slowest traces of the outermost
+            rules, such as `optimize` itself.
+        memory: whether to measure the peak memory allocated by each rule.
+    """
+
+    def __init__(self, slowest: int = 10, memory: bool = False) -> None:
+        super().__init__(memory=memory)
+        self.stats: t.Dict[str, RuleStats] = {}
+        self._slowest = slowest
+        self._heap: t.List[t.Tuple[float, int, RuleTrace]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def slowest(self) -> t.List[RuleTrace]:
+        """Returns the slowest traces of the outermost rules, slowest first."""
+        with self._lock:
+            return [trace for *_, trace in sorted(self._heap, reverse=True)]
+
+    def trace(self, trace: RuleTrace) -> None:
+        with self._lock:
+            stats = self.stats.get(trace.name)
+            if stats is None:
+                stats = self.stats[trace.name] = RuleStats()
+            stats.add(trace)
+
+            if "." not in trace.name and self._slowest > 0:
+                item = (trace.seconds, next(self._counter), trace)
+                if len(self._heap) < self._slowest:
+                    heapq.heappush(self._heap, item)
+                else:
+                    heapq.heappushpop(self._heap, item)
+
+    def report(self) -> str:
+        """Returns a table with the statistics of each rule, sorted by their total time."""
+        with self._lock:
+            rows = sorted(self.stats.items(), key=lambda item: -item[1].seconds)
+
+        header = (
+            "rule",
+            "calls",
+            "total (s)",
+            "max (s)",
+            "nodes",
+            "peak memory (B)",
+            "scope builds",
+        )
+        lines = [header] + [
+            (
+                name,
+                str(stats.calls),
+                f"{stats.seconds:.4f}",
+                f"{stats.max_seconds:.4f}",
+                f"{stats.nodes_before} -> {stats.nodes_after}",
+                "" if stats.memory_peak is None else str(stats.memory_peak),
+                f"{stats.scope_builds} ({stats.scopes_reused} reused)",
+            )
+            for name, stats in rows
+        ]
+
+        widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(value.ljust(width) for value, width in zip(line, widths)).rstrip()
+            for line in lines
+        )
+
+
+def trace(
+    tracer: t.Optional[Tracer],
+    rule: t.Callable[..., E],
+    expression: exp.Expression,
+    *args,
+    **kwargs,
+) -> E:
+    """Applies a rule to an expression, tracing it if a tracer is given."""
+    if tracer is None:
+        return rule(expression, *args, **kwargs)
+    return tracer.run(rule.__name__, rule, expression, *args, **kwargs)
+
+
+def _count(expression: exp.Expression) -> int:
+    return sum(1 for _ in expression.walk())
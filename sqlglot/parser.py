@@ -17,7 +17,7 @@ from sqlglot.errors import (
 )
 from sqlglot.helper import apply_index_offset, ensure_list, seq_get
 from sqlglot.time import format_time
-from sqlglot.tokens import Token, Tokenizer, TokenType
+from sqlglot.tokens import Token, Tokenizer, TokenStream, TokenType
 from sqlglot.trie import TrieResult, in_trie, new_trie
 
 if t.TYPE_CHECKING:
@@ -1653,28 +1653,37 @@ class Parser(metaclass=_Parser):
         self._pipe_cte_counter = 0
 
     def parse(
-        self, raw_tokens: t.List[Token], sql: t.Optional[str] = None
+        self,
+        raw_tokens: t.Sequence[Token],
+        sql: t.Optional[str] = None,
+        semicolons: t.Optional[t.List[int]] = None,
     ) -> t.List[t.Optional[exp.Expression]]:
         """
         Parses a list of tokens and returns a list of syntax trees, one tree
         per parsed SQL statement.
 
         Args:
-            raw_tokens: The list of tokens.
+            raw_tokens: The list of tokens, or a compact `TokenStream`.
             sql: The original SQL string, used to produce helpful debug messages.
+            semicolons: The indices of the semicolon tokens in `raw_tokens`, if they're already
+                known (e.g. because the tokenizer computed them), to avoid rescanning the tokens.
 
         Returns:
             The list of the produced syntax trees.
         """
         return self._parse(
-            parse_method=self.__class__._parse_statement, raw_tokens=raw_tokens, sql=sql
+            parse_method=self.__class__._parse_statement,
+            raw_tokens=raw_tokens,
+            sql=sql,
+            semicolons=semicolons,
         )
 
     def parse_into(
         self,
         expression_types: exp.IntoType,
-        raw_tokens: t.List[Token],
+        raw_tokens: t.Sequence[Token],
         sql: t.Optional[str] = None,
+        semicolons: t.Optional[t.List[int]] = None,
     ) -> t.List[t.Optional[exp.Expression]]:
         """
         Parses a list of tokens into a given Expression type. If a collection of Expression
@@ -1685,6 +1694,7 @@ class Parser(metaclass=_Parser):
             expression_types: The expression type(s) to try and parse the token list into.
             raw_tokens: The list of tokens.
             sql: The original SQL string, used to produce helpful debug messages.
+            semicolons: The indices of the semicolon tokens in `raw_tokens`, if they're already known.
 
         Returns:
             The target Expression.
@@ -1696,7 +1706,7 @@ class Parser(metaclass=_Parser):
                 raise TypeError(f"No parser registered for {expression_type}")
 
             try:
-                return self._parse(parser, raw_tokens, sql)
+                return self._parse(parser, raw_tokens, sql, semicolons)
             except ParseError as e:
                 e.errors[0]["into_expression"] = expression_type
                 errors.append(e)
@@ -1709,30 +1719,45 @@ class Parser(metaclass=_Parser):
     def _parse(
         self,
         parse_method: t.Callable[[Parser], t.Optional[exp.Expression]],
-        raw_tokens: t.List[Token],
+        raw_tokens: t.Sequence[Token],
         sql: t.Optional[str] = None,
+        semicolons: t.Optional[t.List[int]] = None,
     ) -> t.List[t.Optional[exp.Expression]]:
         self.reset()
         self.sql = sql or ""
 
+        if semicolons is None:
+            if isinstance(raw_tokens, TokenStream):
+                semicolons = raw_tokens.semicolons()
+            else:
+                semicolons = [
+                    i
+                    for i, token in enumerate(raw_tokens)
+                    if token.token_type == TokenType.SEMICOLON
+                ]
+
         total = len(raw_tokens)
-        chunks: t.List[t.List[Token]] = [[]]
+        # The token ranges of the statements, which are only sliced when they're parsed, so that
+        # the tokens of a TokenStream are materialized one statement at a time
+        chunks: t.List[t.Tuple[int, int]] = []
+        start = 0
 
-        for i, token in enumerate(raw_tokens):
-            if token.token_type == TokenType.SEMICOLON:
-                if token.comments:
-                    chunks.append([token])
+        for i in semicolons:
+            chunks.append((start, i))
 
-                if i < total - 1:
-                    chunks.append([])
-            else:
-                chunks[-1].append(token)
+            if raw_tokens[i].comments:
+                chunks.append((i, i + 1))
+
+            start = i + 1
+
+        if start < total or not chunks:
+            chunks.append((start, total))
 
         expressions = []
 
-        for tokens in chunks:
+        for start, end in chunks:
             self._index = -1
-            self._tokens = tokens
+            self._tokens = raw_tokens[start:end]
             self._advance()
 
             expressions.append(parse_method(self))
@@ -2084,7 +2109,7 @@ class Parser(metaclass=_Parser):
         def extend_props(temp_props: t.Optional[exp.Properties]) -> None:
             nonlocal properties
             if properties and temp_props:
-                properties.expressions.extend(temp_props.expressions)
+                properties.set("expressions", properties.expressions + temp_props.expressions)
             elif temp_props:
                 properties = temp_props
 
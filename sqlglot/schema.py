@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 import abc
+import hashlib
+import json
+import threading
+import time
 import typing as t
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 
 from sqlglot import expressions as exp
 from sqlglot.dialects.dialect import Dialect
 from sqlglot.errors import SchemaError
-from sqlglot.helper import dict_depth, first
+from sqlglot.helper import CacheInfo, LRUCache, dict_depth, first
 from sqlglot.trie import TrieResult, in_trie, new_trie
 
 if t.TYPE_CHECKING:
     from sqlglot.dialects.dialect import DialectType
 
     ColumnMapping = t.Union[t.Dict, str, t.List]
+    TablePath = t.Tuple[str, ...]
 
 
 class Schema(abc.ABC):
@@ -233,6 +239,8 @@ class MappingSchema(AbstractMappingSchema, Schema):
         self._dialect = Dialect.get_or_raise(dialect)
         self._type_mapping_cache: t.Dict[str, exp.DataType] = {}
         self._depth = 0
+        self._version = 0
+        self._fingerprint: t.Optional[t.Tuple[int, str]] = None
         schema = {} if schema is None else schema
 
         super().__init__(self._normalize(schema) if self.normalize else schema)
@@ -242,6 +250,37 @@ class MappingSchema(AbstractMappingSchema, Schema):
         """Returns the dialect for this mapping schema."""
         return self._dialect
 
+    @property
+    def version(self) -> int:
+        """Returns the number of times the schema has been modified through `add_table`."""
+        return self._version
+
+    def fingerprint(self) -> str:
+        """
+        Returns a digest of the schema's contents, i.e. its mapping, visible columns, dialect and
+        normalization setting. It's only recomputed after the schema's version changes.
+        """
+        if self._fingerprint is None or self._fingerprint[0] != self._version:
+            dialect = self.dialect
+            contents = json.dumps(
+                [
+                    self.mapping,
+                    self.visible,
+                    type(dialect).__name__,
+                    str(dialect.version),
+                    str(dialect.normalization_strategy),
+                    sorted(dialect.settings.items()),
+                    self.normalize,
+                ],
+                sort_keys=True,
+                default=lambda value: (
+                    sorted(value) if isinstance(value, (set, frozenset)) else repr(value)
+                ),
+            )
+            self._fingerprint = (self._version, hashlib.sha256(contents.encode()).hexdigest())
+
+        return self._fingerprint[1]
+
     @classmethod
     def from_mapping_schema(cls, mapping_schema: MappingSchema) -> MappingSchema:
         return MappingSchema(
@@ -316,6 +355,7 @@ class MappingSchema(AbstractMappingSchema, Schema):
 
         nested_set(self.mapping, tuple(reversed(parts)), normalized_column_mapping)
         new_trie([parts], self.mapping_trie)
+        self._version += 1
 
     def column_names(
         self,
@@ -465,19 +505,579 @@ class MappingSchema(AbstractMappingSchema, Schema):
         Returns:
             The resulting expression type.
         """
-        if schema_type not in self._type_mapping_cache:
-            dialect = Dialect.get_or_raise(dialect) if dialect else self.dialect
-            udt = dialect.SUPPORTS_USER_DEFINED_TYPES
+        return _to_data_type(schema_type, dialect or self.dialect, self._type_mapping_cache)
+
+
+class IndexedSchema(MappingSchema):
+    """
+    A `MappingSchema` that's meant for very large catalogs, e.g. with millions of columns.
+
+    Constructing a `MappingSchema` normalizes every identifier in the mapping up front, whereas
+    this schema only normalizes the table names, which it indexes by their full and partial
+    paths in flat dictionaries. The columns of a table are normalized the first time it's
+    accessed and their types are parsed the first time they're requested, so that equal type
+    strings share a single `sqlglot.exp.DataType`. This keeps `find`, `column_names`,
+    `get_column_type` and `has_column` constant-time regardless of the number of tables.
+
+    The nested `mapping` is only built if it's accessed, at which point every table is normalized.
+
+    Args:
+        schema: Mapping in one of the forms supported by `MappingSchema`. It's not copied, so it
+            shouldn't be modified after the schema is constructed.
+        visible: Optional mapping of which columns in the schema are visible, as in `MappingSchema`.
+        dialect: The dialect to be used for custom type mappings & parsing string arguments.
+        normalize: Whether to normalize identifier names according to the given dialect or not.
+    """
+
+    def __init__(
+        self,
+        schema: t.Optional[t.Dict] = None,
+        visible: t.Optional[t.Dict] = None,
+        dialect: DialectType = None,
+        normalize: bool = True,
+    ) -> None:
+        self.visible = {} if visible is None else visible
+        self.normalize = normalize
+        self._dialect = Dialect.get_or_raise(dialect)
+        self._type_mapping_cache: t.Dict[str, exp.DataType] = {}
+        self._depth = 0
+        self._version = 0
+        self._fingerprint: t.Optional[t.Tuple[int, str]] = None
+        self._supported_table_args: t.Tuple[str, ...] = tuple()
+        self._keywords = self._dialect.tokenizer_class.KEYWORDS
+        self._names: t.Dict[t.Tuple[str, bool], str] = {}
+        self._table_names: t.Dict[str, exp.Table] = {}
+
+        # Maps the path of each table, e.g. (catalog, db, table), to its columns as they were given
+        # and, once it's been accessed, its normalized columns
+        self._tables: t.Dict[t.Tuple[str, ...], t.List[t.Optional[t.Dict]]] = {}
+        # Maps the partial paths of the tables, e.g. (db, table) and (table,), to their full paths
+        self._partial_paths: t.Dict[t.Tuple[str, ...], t.List[t.Tuple[str, ...]]] = {}
+
+        schema = {} if schema is None else schema
+        flattened_schema = flatten_schema(schema)
+        error_msg = "Table {} must match the schema's nesting level: {}."
+
+        for keys in flattened_schema:
+            columns = nested_get(schema, *zip(keys, keys))
+
+            if normalize:
+                if not isinstance(columns, dict):
+                    raise SchemaError(
+                        error_msg.format(".".join(keys[:-1]), len(flattened_schema[0]))
+                    )
+                if not columns:
+                    raise SchemaError(f"Table {'.'.join(keys[:-1])} must have at least one column")
+                if isinstance(first(columns.values()), dict):
+                    raise SchemaError(
+                        error_msg.format(
+                            ".".join(keys + flatten_schema(columns)[0]), len(flattened_schema[0])
+                        ),
+                    )
+
+                path = tuple(self._normalize_key(key, is_table=True) for key in keys)
+            else:
+                columns = t.cast(t.Dict, columns)
+                path = tuple(keys)
+
+            # Like in MappingSchema, the columns of tables whose names normalize to the same path
+            # are merged, with the later ones taking precedence
+            if path in self._tables:
+                columns = {**t.cast(t.Dict, self._tables[path][0]), **columns}
+
+            self._add(path, columns, None if normalize else columns)
+
+    @property
+    def mapping(self) -> t.Dict:  # type: ignore
+        """The normalized nested mapping. Building it requires normalizing every table."""
+        mapping: t.Dict = {}
+        for path in self._tables:
+            nested_set(mapping, path, self._columns(path))
+        return mapping
+
+    @property
+    def empty(self) -> bool:
+        return not self._tables
+
+    @property
+    def supported_table_args(self) -> t.Tuple[str, ...]:
+        if not self._supported_table_args and self._tables:
+            depth = self.depth()
+
+            if not depth:
+                self._supported_table_args = tuple()
+            elif 1 <= depth <= 3:
+                self._supported_table_args = exp.TABLE_PARTS[:depth]
+            else:
+                raise SchemaError(f"Invalid mapping shape. Depth: {depth}")
+
+        return self._supported_table_args
+
+    def depth(self) -> int:
+        if not self._depth and self._tables:
+            self._depth = len(first(self._tables))
+        return self._depth
+
+    def fingerprint(self) -> str:
+        """
+        Returns a digest of the schema's contents. Unlike `MappingSchema.fingerprint`, it's based on
+        the columns as they were given, so that the tables don't need to be normalized.
+        """
+        if self._fingerprint is None or self._fingerprint[0] != self._version:
+            dialect = self.dialect
+            contents = json.dumps(
+                [
+                    sorted([list(path), columns] for path, (columns, _) in self._tables.items()),
+                    self.visible,
+                    type(dialect).__name__,
+                    str(dialect.version),
+                    str(dialect.normalization_strategy),
+                    sorted(dialect.settings.items()),
+                    self.normalize,
+                ],
+                sort_keys=True,
+                default=lambda value: (
+                    sorted(value) if isinstance(value, (set, frozenset)) else repr(value)
+                ),
+            )
+            self._fingerprint = (self._version, hashlib.sha256(contents.encode()).hexdigest())
+
+        return self._fingerprint[1]
+
+    def copy(self, **kwargs) -> IndexedSchema:
+        schema: t.Dict = {}
+        for path, (columns, _) in self._tables.items():
+            nested_set(schema, path, columns)
+
+        return IndexedSchema(
+            **{  # type: ignore
+                "schema": schema,
+                "visible": self.visible.copy(),
+                "dialect": self.dialect,
+                "normalize": self.normalize,
+                **kwargs,
+            }
+        )
+
+    def find(
+        self, table: exp.Table, raise_on_missing: bool = True, ensure_data_types: bool = False
+    ) -> t.Optional[t.Any]:
+        parts = self.table_parts(table)[0 : len(self.supported_table_args)]
+        path = tuple(reversed(parts))
+
+        if path not in self._tables:
+            paths = self._partial_paths.get(path)
+
+            if not paths:
+                return None
+            if len(paths) > 1:
+                if raise_on_missing:
+                    trie = new_trie(tuple(reversed(full_path[: -len(path)])) for full_path in paths)
+                    message = ", ".join(".".join(parts) for parts in flatten_schema(trie))
+                    raise SchemaError(f"Ambiguous mapping for {table}: {message}.")
+                return None
+
+            path = paths[0]
+
+        schema = self._columns(path)
+        if ensure_data_types:
+            schema = {
+                col: self._to_data_type(dtype) if isinstance(dtype, str) else dtype
+                for col, dtype in schema.items()
+            }
+
+        return schema
+
+    def add_table(
+        self,
+        table: exp.Table | str,
+        column_mapping: t.Optional[ColumnMapping] = None,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+        match_depth: bool = True,
+    ) -> None:
+        normalized_table = self._normalize_table(table, dialect=dialect, normalize=normalize)
+
+        if match_depth and not self.empty and len(normalized_table.parts) != self.depth():
+            raise SchemaError(
+                f"Table {normalized_table.sql(dialect=self.dialect)} must match the "
+                f"schema's nesting level: {self.depth()}."
+            )
+
+        normalized_column_mapping = {
+            self._normalize_name(key, dialect=dialect, normalize=normalize): value
+            for key, value in ensure_column_mapping(column_mapping).items()
+        }
+
+        schema = self.find(normalized_table, raise_on_missing=False)
+        if schema and not normalized_column_mapping:
+            return
+
+        path = tuple(reversed(self.table_parts(normalized_table)))
+        self._add(path, normalized_column_mapping, normalized_column_mapping)
+        self._version += 1
+
+    def _add(
+        self, path: t.Tuple[str, ...], columns: t.Dict, normalized: t.Optional[t.Dict] = None
+    ) -> None:
+        if path not in self._tables:
+            for i in range(1, len(path)):
+                self._partial_paths.setdefault(path[i:], []).append(path)
+
+        self._tables[path] = [columns, normalized]
+
+    def _columns(self, path: t.Tuple[str, ...]) -> t.Dict:
+        entry = self._tables[path]
+        normalized = entry[1]
+
+        if normalized is None:
+            normalized = entry[1] = {
+                self._normalize_key(name): column_type
+                for name, column_type in t.cast(t.Dict, entry[0]).items()
+            }
+
+        return normalized
+
+    def _normalize_table(
+        self,
+        table: exp.Table | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> exp.Table:
+        if not isinstance(table, str) or dialect is not None or normalize is not None:
+            return super()._normalize_table(table, dialect=dialect, normalize=normalize)
+
+        # The tables that are looked up by name are only parsed once. They're not exposed to
+        # the callers, who only get their columns, so they can be shared
+        normalized_table = self._table_names.get(table)
+        if normalized_table is None:
+            normalized_table = self._table_names[table] = super()._normalize_table(table)
+
+        return normalized_table
+
+    def _normalize_name(
+        self,
+        name: str | exp.Identifier,
+        dialect: DialectType = None,
+        is_table: bool = False,
+        normalize: t.Optional[bool] = None,
+    ) -> str:
+        if isinstance(name, str) and dialect is None and normalize is None:
+            return self._normalize_key(name, is_table=is_table)
+        return super()._normalize_name(
+            name, dialect=dialect, is_table=is_table, normalize=normalize
+        )
+
+    def _normalize_key(self, name: str, is_table: bool = False) -> str:
+        key = (name, is_table)
+        normalized = self._names.get(key)
+
+        if normalized is None:
+            # Parsing is only needed for names that aren't plain, unquoted identifiers
+            if exp.SAFE_IDENTIFIER_RE.match(name) and name.upper() not in self._keywords:
+                if self.normalize:
+                    identifier = exp.Identifier(this=name, quoted=False)
+                    identifier.meta["is_table"] = is_table
+                    normalized = self.dialect.normalize_identifier(identifier).name
+                else:
+                    normalized = name
+            else:
+                normalized = super()._normalize_name(name, is_table=is_table)
+
+            self._names[key] = normalized
+
+        return normalized
+
+
+class LazySchema(Schema):
+    """
+    A schema that resolves tables on demand through a callback, e.g. one that queries a metastore,
+    instead of loading the whole catalog up front.
+
+    The callback is called with a list of table paths, i.e. tuples with the normalized names of
+    the parts of each table as they're referenced, such as `("db", "tbl")` for `db.tbl`. It returns
+    a mapping from these paths to the column mappings of the tables, in one of the forms accepted by
+    `MappingSchema.add_table`. Tables that don't exist can be mapped to `None` or omitted.
+
+    The results, including missing tables, are kept in an LRU cache and are fetched again once
+    they expire. `sqlglot.optimizer.qualify.qualify` calls `prefetch` with all the tables of a
+    query once they've been qualified, so that they're fetched with a single call.
+
+    Since its tables can change whenever they're fetched again, the schema has no fingerprint and
+    the queries that are optimized against it aren't kept in the optimizer's result cache.
+
+    Example:
+        >>> def fetch(paths):
+        ...     print(paths)
+        ...     return {("db", "x"): {"a": "INT"}}
+        >>> schema = LazySchema(fetch)
+        >>> schema.prefetch(["db.x", "db.y"])
+        [('db', 'x'), ('db', 'y')]
+        >>> schema.column_names("db.x"), schema.column_names("db.y")
+        (['a'], [])
+
+    Args:
+        fetch: the callback that returns the columns of the given tables.
+        dialect: The dialect to be used for custom type mappings & parsing string arguments.
+        normalize: Whether to normalize identifier names according to the given dialect or not.
+        maxsize: the maximum number of tables to cache.
+        ttl: the number of seconds after which a cached table is fetched again, or `None` if the
+            tables never expire.
+        executor: the executor that's used by `prefetch` to fetch tables in the background. By
+            default, a single thread is started the first time it's needed.
+    """
+
+    def __init__(
+        self,
+        fetch: t.Callable[[t.List[TablePath]], t.Mapping[TablePath, t.Optional[ColumnMapping]]],
+        dialect: DialectType = None,
+        normalize: bool = True,
+        maxsize: int = 1024,
+        ttl: t.Optional[float] = None,
+        executor: t.Optional[Executor] = None,
+    ) -> None:
+        self.fetch = fetch
+        self.normalize = normalize
+        self.ttl = ttl
+        self._dialect = Dialect.get_or_raise(dialect)
+        self._type_mapping_cache: t.Dict[str, exp.DataType] = {}
+        self._cache: LRUCache[TablePath, t.Tuple[t.Optional[float], t.Optional[t.Dict]]] = LRUCache(
+            maxsize
+        )
+        self._executor = executor
+        self._lock = threading.Lock()
+        # The tables that are being fetched, which are mapped to the future of their fetch
+        self._pending: t.Dict[TablePath, Future] = {}
+
+    @property
+    def dialect(self) -> Dialect:
+        return self._dialect
+
+    @property
+    def empty(self) -> bool:
+        # The catalog's contents are unknown until they're fetched, so it's assumed to exist
+        return False
+
+    @property
+    def supported_table_args(self) -> t.Tuple[str, ...]:
+        return exp.TABLE_PARTS
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the statistics of the table cache."""
+        return self._cache.info()
+
+    def clear(self) -> None:
+        """Removes all the cached tables, so that they're fetched again."""
+        self._cache.clear()
+
+    def prefetch(
+        self,
+        tables: t.Iterable[exp.Table | str],
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+        wait: bool = True,
+    ) -> t.Optional[Future]:
+        """
+        Fetches the tables that aren't cached yet with a single call to the callback.
 
-            try:
-                expression = exp.DataType.build(schema_type, dialect=dialect, udt=udt)
-                expression.transform(dialect.normalize_identifier, copy=False)
-                self._type_mapping_cache[schema_type] = expression
-            except AttributeError:
-                in_dialect = f" in dialect {dialect}" if dialect else ""
-                raise SchemaError(f"Failed to build type '{schema_type}'{in_dialect}.")
+        Args:
+            tables: the tables that are about to be looked up.
+            dialect: the SQL dialect that will be used to parse the tables that are strings.
+            normalize: whether to normalize identifiers according to the dialect of interest.
+            wait: whether to wait for the tables to be fetched. If False, they're fetched by the
+                executor and lookups of these tables block until the fetch completes.
 
-        return self._type_mapping_cache[schema_type]
+        Returns:
+            The future of the last fetch the tables depend on, or `None` if they're all cached or
+            `wait` is True.
+        """
+        paths = [self._path(table, dialect=dialect, normalize=normalize) for table in tables]
+        futures = self._request(paths, background=not wait)
+
+        if wait:
+            for future in futures:
+                future.result()
+            return None
+
+        return futures[-1] if futures else None
+
+    def add_table(
+        self,
+        table: exp.Table | str,
+        column_mapping: t.Optional[ColumnMapping] = None,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+        match_depth: bool = True,
+    ) -> None:
+        """
+        Caches the columns of a table, as if it had been fetched. Tables can be looked up under
+        several paths, so only the given one is affected.
+
+        Args:
+            table: the `Table` expression instance or string representing the table.
+            column_mapping: a column mapping that describes the structure of the table.
+            dialect: the SQL dialect that will be used to parse `table` if it's a string.
+            normalize: whether to normalize identifiers according to the dialect of interest.
+            match_depth: unused, since the tables can be referenced with any number of parts.
+        """
+        columns = self._normalize_columns(column_mapping, dialect=dialect, normalize=normalize)
+        if columns:
+            self._cache.put(
+                self._path(table, dialect=dialect, normalize=normalize), (None, columns)
+            )
+
+    def column_names(
+        self,
+        table: exp.Table | str,
+        only_visible: bool = False,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> t.List[str]:
+        columns = self._columns(self._path(table, dialect=dialect, normalize=normalize))
+        return list(columns) if columns else []
+
+    def get_column_type(
+        self,
+        table: exp.Table | str,
+        column: exp.Column | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> exp.DataType:
+        columns = self._columns(self._path(table, dialect=dialect, normalize=normalize))
+
+        if columns:
+            column_type = columns.get(self._column_name(column, dialect, normalize))
+
+            if isinstance(column_type, exp.DataType):
+                return column_type
+            if isinstance(column_type, str):
+                return _to_data_type(column_type, dialect or self.dialect, self._type_mapping_cache)
+
+        return exp.DataType.build("unknown")
+
+    def has_column(
+        self,
+        table: exp.Table | str,
+        column: exp.Column | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> bool:
+        columns = self._columns(self._path(table, dialect=dialect, normalize=normalize))
+        return self._column_name(column, dialect, normalize) in columns if columns else False
+
+    def _path(
+        self,
+        table: exp.Table | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> TablePath:
+        dialect = dialect or self.dialect
+        normalize = self.normalize if normalize is None else normalize
+        table = exp.maybe_parse(table, into=exp.Table, dialect=dialect)
+
+        return tuple(
+            normalize_name(part.copy(), dialect=dialect, is_table=True, normalize=normalize).name
+            if isinstance(part, exp.Identifier)
+            else part.name
+            for part in table.parts
+        )
+
+    def _column_name(
+        self,
+        column: exp.Column | str,
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> str:
+        return normalize_name(
+            column if isinstance(column, str) else column.this.copy(),
+            dialect=dialect or self.dialect,
+            normalize=self.normalize if normalize is None else normalize,
+        ).name
+
+    def _normalize_columns(
+        self,
+        column_mapping: t.Optional[ColumnMapping],
+        dialect: DialectType = None,
+        normalize: t.Optional[bool] = None,
+    ) -> t.Dict:
+        return {
+            self._column_name(name, dialect, normalize): column_type
+            for name, column_type in ensure_column_mapping(column_mapping).items()
+        }
+
+    def _columns(self, path: TablePath) -> t.Optional[t.Dict]:
+        entry = self._cache.get(path)
+        if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+            return entry[1]
+
+        for future in self._request([path]):
+            return future.result().get(path)
+
+        # The table was fetched concurrently in the meantime
+        return self._columns(path)
+
+    def _request(self, paths: t.Iterable[TablePath], background: bool = False) -> t.List[Future]:
+        """
+        Starts a single fetch for the tables that are neither cached nor being fetched.
+
+        Returns:
+            The futures of the fetches the tables depend on. The new fetch, if any, comes last.
+        """
+        now = time.monotonic()
+        futures: t.Dict[int, Future] = {}
+        missing = []
+
+        with self._lock:
+            for path in dict.fromkeys(paths):
+                entry = self._cache.get(path)
+                if entry is not None and (entry[0] is None or entry[0] > now):
+                    continue
+
+                future = self._pending.get(path)
+                if future is None:
+                    missing.append(path)
+                else:
+                    futures[id(future)] = future
+
+            if not missing:
+                return list(futures.values())
+
+            future = Future()
+            futures[id(future)] = future
+            for path in missing:
+                self._pending[path] = future
+
+        if background:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._executor.submit(self._fetch, missing, future)
+        else:
+            self._fetch(missing, future)
+
+        return list(futures.values())
+
+    def _fetch(self, paths: t.List[TablePath], future: Future) -> None:
+        try:
+            fetched = self.fetch(paths)
+            tables = {}
+            for path in paths:
+                columns = fetched.get(path)
+                tables[path] = None if columns is None else self._normalize_columns(columns)
+        except BaseException as e:
+            with self._lock:
+                for path in paths:
+                    self._pending.pop(path, None)
+            future.set_exception(e)
+            return
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            for path, columns in tables.items():
+                self._cache.put(path, (expires, columns))
+                self._pending.pop(path, None)
+
+        future.set_result(tables)
 
 
 def normalize_name(
@@ -497,6 +1097,26 @@ def normalize_name(
     return Dialect.get_or_raise(dialect).normalize_identifier(identifier)
 
 
+def _to_data_type(
+    schema_type: str, dialect: DialectType, cache: t.Dict[str, exp.DataType]
+) -> exp.DataType:
+    data_type = cache.get(schema_type)
+
+    if data_type is None:
+        dialect = Dialect.get_or_raise(dialect)
+        udt = dialect.SUPPORTS_USER_DEFINED_TYPES
+
+        try:
+            data_type = exp.DataType.build(schema_type, dialect=dialect, udt=udt)
+            data_type.transform(dialect.normalize_identifier, copy=False)
+            cache[schema_type] = data_type
+        except AttributeError:
+            in_dialect = f" in dialect {dialect}" if dialect else ""
+            raise SchemaError(f"Failed to build type '{schema_type}'{in_dialect}.")
+
+    return data_type
+
+
 def ensure_schema(schema: Schema | t.Optional[t.Dict], **kwargs: t.Any) -> Schema:
     if isinstance(schema, Schema):
         return schema
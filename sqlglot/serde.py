@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 import typing as t
 
 from sqlglot import expressions as exp
@@ -113,14 +114,466 @@ def _load(payload: t.Dict[str, t.Any]) -> exp.Expression | exp.DataType.Type:
     if class_name == DATA_TYPE:
         return exp.DataType.Type(payload[VALUE])
 
-    if "." in class_name:
-        module_path, class_name = class_name.rsplit(".", maxsplit=1)
-        module = __import__(module_path, fromlist=[class_name])
-    else:
-        module = exp
-
-    expression = getattr(module, class_name)()
+    expression = _load_class(class_name)()
     expression.type = load(payload.get(TYPE))
     expression.comments = payload.get(COMMENTS)
     expression._meta = payload.get(META)
     return expression
+
+
+# The binary format starts with a header, followed by three tables and the nodes of the tree in
+# depth-first order. The tables hold the strings, the expression classes and the "shapes" of the
+# `meta` dicts, i.e. their keys, which are shared by the many dicts that only map keys to integers,
+# like the token positions added by the parser. Integers are encoded as unsigned LEB128 varints,
+# strings, classes and shapes are referenced by their position in the corresponding table and
+# every node but the root refers to its parent by its distance from it.
+MAGIC = b"SQLG"
+VERSION = 1
+
+# Tags of the values that can be encoded
+_NONE = 0
+_TRUE = 1
+_FALSE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_DICT = 7
+_DATA_TYPE = 8
+_EXPRESSION = 9
+_INT_DICT = 10
+
+# Flags of the optional attributes of an expression
+_COMMENTS = 1
+_META = 2
+
+# The arg key that is used to attach a data type to the expression it annotates
+_TYPE_KEY = 0
+
+_DOUBLE = struct.Struct("<d")
+
+
+def dumps(expression: exp.Expression) -> bytes:
+    """
+    Dump an Expression into a compact binary representation.
+
+    The result is several times smaller than the pickled output of `dump`, which makes it cheaper
+    to send to other processes or store on disk. It preserves the same information, i.e. the tree,
+    as well as the `type`, `comments` and `meta` of each node.
+
+    Example:
+        >>> from sqlglot import parse_one
+        >>> expression = parse_one("SELECT a FROM x")
+        >>> loads(dumps(expression)) == expression
+        True
+
+    Args:
+        expression: the expression to dump.
+
+    Returns:
+        The binary representation of the expression.
+    """
+    strings: t.Dict[str, int] = {}
+    classes: t.Dict[t.Type[exp.Expression], int] = {}
+    shapes: t.Dict[t.Tuple[str, ...], int] = {}
+    buf = bytearray()
+    write = buf.append
+    count = 0
+
+    def write_value(value: t.Any) -> None:
+        kind = type(value)
+
+        if kind is str:
+            write(_STR)
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            _write_varint(buf, index)
+        elif value is None:
+            write(_NONE)
+        elif value is True:
+            write(_TRUE)
+        elif value is False:
+            write(_FALSE)
+        elif kind is int:
+            write(_INT)
+            _write_varint(buf, _zigzag(value))
+        elif kind is float:
+            write(_FLOAT)
+            buf.extend(_DOUBLE.pack(value))
+        elif kind is dict:
+            shape = tuple(value)
+            index = shapes.get(shape)
+
+            if index is None and all(type(k) is str for k in shape):
+                index = shapes[shape] = len(shapes)
+                for k in shape:
+                    if k not in strings:
+                        strings[k] = len(strings)
+
+            if index is not None:
+                mark = len(buf)
+                write(_INT_DICT)
+                _write_varint(buf, index)
+
+                for v in value.values():
+                    if type(v) is not int:
+                        # Not all values are integers, so the generic encoding is used instead
+                        del buf[mark:]
+                        break
+
+                    v = v << 1 if v >= 0 else (-v << 1) - 1
+                    while v >= 0x80:
+                        write((v & 0x7F) | 0x80)
+                        v >>= 7
+                    write(v)
+                else:
+                    return
+
+            write(_DICT)
+            _write_varint(buf, len(value))
+            for k, v in value.items():
+                write_value(k)
+                write_value(v)
+        elif kind is list:
+            write(_LIST)
+            _write_varint(buf, len(value))
+            for v in value:
+                write_value(v)
+        elif kind is exp.DataType.Type:
+            write(_DATA_TYPE)
+            index = strings.get(value.value)
+            if index is None:
+                index = strings[value.value] = len(strings)
+            _write_varint(buf, index)
+        else:
+            raise ValueError(f"Unable to serialize value of type {kind.__name__}: {value!r}")
+
+    # The nodes are visited in the same order as in `dump`, so the ancestors of a node always
+    # precede it. The arg key of each node is shifted to make room for the flag that denotes
+    # whether it's part of a list, and it's offset by one to reserve zero for the type key.
+    stack: t.List[t.Tuple[t.Any, int, int]] = [(expression, -1, 0)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        node, parent, key = pop()
+
+        if parent >= 0:
+            offset = count - parent
+            if offset < 0x80:
+                write(offset)
+            else:
+                _write_varint(buf, offset)
+            if key < 0x80:
+                write(key)
+            else:
+                _write_varint(buf, key)
+
+        if isinstance(node, exp.Expression):
+            klass = node.__class__
+            index = classes.get(klass)
+            if index is None:
+                index = classes[klass] = len(classes)
+
+            comments = node.comments
+            meta = node._meta
+
+            write(_EXPRESSION)
+            if index < 0x80:
+                write(index)
+            else:
+                _write_varint(buf, index)
+            write((_COMMENTS if comments is not None else 0) | (_META if meta is not None else 0))
+
+            if comments is not None:
+                _write_varint(buf, len(comments))
+                for comment in comments:
+                    index = strings.get(comment)
+                    if index is None:
+                        index = strings[comment] = len(strings)
+                    _write_varint(buf, index)
+            if meta is not None:
+                write_value(meta)
+
+            for k, vs in reversed(node.args.items()):
+                if vs is None:
+                    continue
+
+                index = strings.get(k)
+                if index is None:
+                    index = strings[k] = len(strings)
+
+                if type(vs) is list:
+                    key = (index + 1) << 1 | 1
+                    for v in reversed(vs):
+                        push((v, count, key))
+                else:
+                    push((vs, count, (index + 1) << 1))
+
+            # The type is pushed last so that it's loaded before the node's children
+            if node._type:
+                push((node._type, count, _TYPE_KEY))
+        elif type(node) is str:
+            index = strings.get(node)
+            if index is None:
+                index = strings[node] = len(strings)
+            write(_STR)
+            if index < 0x80:
+                write(index)
+            else:
+                _write_varint(buf, index)
+        else:
+            write_value(node)
+
+        count += 1
+
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+
+    _write_strings(out, list(strings), "surrogatepass")
+    _write_strings(
+        out,
+        [
+            klass.__qualname__
+            if klass.__module__ == exp.__name__
+            else f"{klass.__module__}.{klass.__qualname__}"
+            for klass in classes
+        ],
+        "strict",
+    )
+
+    _write_varint(out, len(shapes))
+    for shape in shapes:
+        _write_varint(out, len(shape))
+        for k in shape:
+            _write_varint(out, strings[k])
+
+    _write_varint(out, count)
+    out += buf
+    return bytes(out)
+
+
+def loads(data: bytes) -> exp.Expression:
+    """
+    Load an Expression from the binary representation produced by `dumps`.
+
+    Args:
+        data: the binary representation of the expression.
+
+    Returns:
+        The loaded expression.
+    """
+    data = bytes(data)
+    start = len(MAGIC) + 1
+
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Invalid serialized expression: missing header")
+    if data[start - 1] != VERSION:
+        raise ValueError(f"Unsupported serialized expression version: {data[start - 1]}")
+
+    strings, pos = _read_strings(data, start, "surrogatepass")
+    names, pos = _read_strings(data, pos, "strict")
+    classes = [_load_class(name) for name in names]
+
+    size, pos = _read_varint(data, pos)
+    shapes = []
+    for _ in range(size):
+        length, pos = _read_varint(data, pos)
+        shape = []
+        for _ in range(length):
+            index, pos = _read_varint(data, pos)
+            shape.append(strings[index])
+        shapes.append(shape)
+
+    # Arg keys are offset by one, since zero is reserved for the type key
+    arg_keys = [""] + strings
+    count, pos = _read_varint(data, pos)
+    nodes: t.List[t.Any] = []
+    append = nodes.append
+
+    for i in range(count):
+        if i:
+            offset = data[pos]
+            if offset < 0x80:
+                pos += 1
+            else:
+                offset, pos = _read_varint(data, pos)
+
+            key = data[pos]
+            if key < 0x80:
+                pos += 1
+            else:
+                key, pos = _read_varint(data, pos)
+
+        tag = data[pos]
+        pos += 1
+
+        is_expression = tag == _EXPRESSION
+
+        if is_expression:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+            else:
+                index, pos = _read_varint(data, pos)
+
+            node: t.Any = classes[index]()
+            flags = data[pos]
+            pos += 1
+
+            if flags & _COMMENTS:
+                size, pos = _read_varint(data, pos)
+                comments = []
+                for _ in range(size):
+                    index, pos = _read_varint(data, pos)
+                    comments.append(strings[index])
+                node.comments = comments
+
+            if flags & _META:
+                if data[pos] == _INT_DICT:
+                    index, pos = _read_varint(data, pos + 1)
+                    values: t.List[t.Any] = []
+                    for _ in shapes[index]:
+                        value = data[pos]
+                        if value < 0x80:
+                            pos += 1
+                        else:
+                            value, pos = _read_varint(data, pos)
+                        values.append(-((value + 1) >> 1) if value & 1 else value >> 1)
+                    node._meta = dict(zip(shapes[index], values))
+                else:
+                    node._meta, pos = _read_value(data, pos, strings, shapes)
+        elif tag == _STR:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+            else:
+                index, pos = _read_varint(data, pos)
+            node = strings[index]
+        else:
+            node, pos = _read_value(data, pos - 1, strings, shapes)
+
+        append(node)
+
+        if not i:
+            continue
+
+        parent = nodes[i - offset]
+
+        if key == _TYPE_KEY:
+            parent._type = node
+            continue
+
+        arg_key = arg_keys[key >> 1]
+
+        if key & 1:
+            values = parent.args.get(arg_key)
+            if values is None:
+                values = parent.args[arg_key] = []
+            if is_expression:
+                node.parent = parent
+                node.arg_key = arg_key
+                node.index = len(values)
+            values.append(node)
+        else:
+            if is_expression:
+                node.parent = parent
+                node.arg_key = arg_key
+            parent.args[arg_key] = node
+
+    return nodes[0]
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> t.Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_strings(buf: bytearray, strings: t.List[str], errors: str) -> None:
+    _write_varint(buf, len(strings))
+    for value in strings:
+        encoded = value.encode("utf-8", errors)
+        _write_varint(buf, len(encoded))
+        buf += encoded
+
+
+def _read_strings(data: bytes, pos: int, errors: str) -> t.Tuple[t.List[str], int]:
+    count, pos = _read_varint(data, pos)
+    strings = []
+    for _ in range(count):
+        size, pos = _read_varint(data, pos)
+        strings.append(data[pos : pos + size].decode("utf-8", errors))
+        pos += size
+    return strings, pos
+
+
+def _read_value(
+    data: bytes, pos: int, strings: t.List[str], shapes: t.List[t.List[str]]
+) -> t.Tuple[t.Any, int]:
+    tag = data[pos]
+    pos += 1
+
+    if tag == _STR:
+        index, pos = _read_varint(data, pos)
+        return strings[index], pos
+    if tag == _NONE:
+        return None, pos
+    if tag == _TRUE:
+        return True, pos
+    if tag == _FALSE:
+        return False, pos
+    if tag == _INT:
+        value, pos = _read_varint(data, pos)
+        return (-((value + 1) >> 1) if value & 1 else value >> 1), pos
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+    if tag == _DATA_TYPE:
+        index, pos = _read_varint(data, pos)
+        return exp.DataType.Type(strings[index]), pos
+    if tag == _INT_DICT:
+        index, pos = _read_varint(data, pos)
+        values = []
+        for _ in shapes[index]:
+            value, pos = _read_varint(data, pos)
+            values.append(-((value + 1) >> 1) if value & 1 else value >> 1)
+        return dict(zip(shapes[index], values)), pos
+    if tag == _LIST or tag == _DICT:
+        size, pos = _read_varint(data, pos)
+        values = []
+        for _ in range(size * 2 if tag == _DICT else size):
+            value, pos = _read_value(data, pos, strings, shapes)
+            values.append(value)
+        if tag == _LIST:
+            return values, pos
+        return dict(zip(values[::2], values[1::2])), pos
+
+    raise ValueError(f"Invalid serialized expression: unknown tag {tag}")
+
+
+def _load_class(name: str) -> t.Type[exp.Expression]:
+    if "." in name:
+        module_path, name = name.rsplit(".", maxsplit=1)
+        module = __import__(module_path, fromlist=[name])
+    else:
+        module = exp
+
+    return getattr(module, name)
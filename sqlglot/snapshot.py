@@ -0,0 +1,266 @@
+"""
+## Schema snapshots
+
+A snapshot is a file that holds a normalized `sqlglot.schema.MappingSchema`, along with the parsed
+types of its columns. It's written once with `write_snapshot`, e.g. by a deployment step, and then
+opened as a `SnapshotSchema` by every process that needs the schema. Opening a snapshot only reads
+the names of its tables; the columns of a table are decoded the first time it's accessed and each
+distinct type is only decoded once. The file is memory-mapped, so processes that open it, or that
+are forked after it's opened, share its pages instead of holding their own copy.
+
+The snapshot also stores the schema's fingerprint, which `SnapshotSchema.fingerprint` returns as
+long as the schema isn't modified, so caches that are keyed on it, such as the one accepted by
+`sqlglot.optimizer.optimize`, can be shared between the processes that load the same snapshot.
+
+Example:
+    >>> import os, tempfile
+    >>> from sqlglot.schema import MappingSchema
+    >>> path = os.path.join(tempfile.mkdtemp(), "schema.snapshot")
+    >>> schema = MappingSchema({"db": {"x": {"a": "INT", "b": "TEXT"}}})
+    >>> write_snapshot(schema, path) == schema.fingerprint()
+    True
+    >>> snapshot = SnapshotSchema(path)
+    >>> snapshot.column_names("db.x"), snapshot.get_column_type("db.x", "b").sql()
+    (['a', 'b'], 'TEXT')
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import typing as t
+
+from sqlglot import expressions as exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import SchemaError
+from sqlglot.schema import IndexedSchema, MappingSchema, flatten_schema, nested_get
+from sqlglot.serde import _read_strings, _read_varint, _write_strings, _write_varint, dumps, loads
+
+# The file starts with a header, followed by the schema's metadata as JSON, the distinct types of
+# its columns, the columns of each table, the index of the tables and a footer that points to it.
+# The columns of a table are stored as their names and the positions of their types, whereas the
+# index maps the path of each table, e.g. (catalog, db, table), to the position of its columns.
+MAGIC = b"SQLGSCHM"
+VERSION = 1
+
+_FOOTER = struct.Struct("<Q")
+
+
+def write_snapshot(schema: MappingSchema, path: str) -> str:
+    """
+    Writes a snapshot of a schema to a file.
+
+    The snapshot is written to a temporary file that then replaces the target, so that processes
+    which have mapped a previous snapshot at the same path aren't affected.
+
+    Args:
+        schema: the schema. Its types are parsed, so a `SchemaError` is raised if any is invalid.
+        path: the path of the file.
+
+    Returns:
+        The schema's fingerprint, which is stored in the snapshot.
+    """
+    dialect = schema.dialect
+    dialect_class = type(dialect)
+    fingerprint = schema.fingerprint()
+
+    metadata = json.dumps(
+        {
+            "dialect": f"{dialect_class.__module__}.{dialect_class.__qualname__}",
+            "dialect_args": {
+                "version": ".".join(str(part) for part in dialect.version),
+                "normalization_strategy": dialect.normalization_strategy.value,
+                **dialect.settings,
+            },
+            "normalize": schema.normalize,
+            "visible": schema.visible,
+            "fingerprint": fingerprint,
+        },
+        default=lambda value: sorted(value) if isinstance(value, (set, frozenset)) else repr(value),
+    ).encode()
+
+    buf = bytearray(MAGIC)
+    buf.append(VERSION)
+    _write_varint(buf, len(metadata))
+    buf += metadata
+
+    mapping = schema.mapping
+    paths = flatten_schema(mapping, depth=schema.depth()) if not schema.empty else []
+    types: t.Dict[exp.DataType, int] = {}
+    tables = []
+
+    for keys in paths:
+        columns = []
+
+        for name, column_type in t.cast(t.Dict, nested_get(mapping, *zip(keys, keys))).items():
+            if isinstance(column_type, str):
+                column_type = schema._to_data_type(column_type)
+            elif not isinstance(column_type, exp.DataType):
+                raise SchemaError(f"Invalid type for column {name} of {'.'.join(keys)}.")
+
+            index = types.get(column_type)
+            if index is None:
+                index = types[column_type] = len(types)
+
+            columns.append((name, index))
+
+        tables.append((keys, columns))
+
+    _write_varint(buf, len(types))
+    for column_type in types:
+        data = dumps(column_type)
+        _write_varint(buf, len(data))
+        buf += data
+
+    positions = []
+    for _, columns in tables:
+        positions.append(len(buf))
+        _write_strings(buf, [name for name, _ in columns], "surrogatepass")
+        for _, index in columns:
+            _write_varint(buf, index)
+
+    index_pos = len(buf)
+    _write_varint(buf, len(tables))
+    for (keys, _), position in zip(tables, positions):
+        _write_strings(buf, keys, "surrogatepass")
+        _write_varint(buf, position)
+
+    buf += _FOOTER.pack(index_pos)
+    buf += MAGIC
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(buf)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    return fingerprint
+
+
+class SnapshotSchema(IndexedSchema):
+    """
+    A read-mostly schema that's backed by a memory-mapped snapshot written by `write_snapshot`.
+
+    It behaves like the `MappingSchema` the snapshot was written from. Tables can still be added,
+    in which case the fingerprint is computed from the schema's contents, like in `IndexedSchema`.
+
+    Args:
+        path: the path of the snapshot.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data: t.Any = self._mmap
+        size = len(data)
+        footer_pos = size - len(MAGIC) - _FOOTER.size
+
+        if (
+            footer_pos < len(MAGIC) + 1
+            or data[: len(MAGIC)] != MAGIC
+            or data[size - len(MAGIC) :] != MAGIC
+        ):
+            self._mmap.close()
+            raise ValueError(f"Invalid schema snapshot: {path}")
+        if data[len(MAGIC)] != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported schema snapshot version: {data[len(MAGIC)]}")
+
+        length, pos = _read_varint(data, len(MAGIC) + 1)
+        metadata = json.loads(data[pos : pos + length])
+        pos += length
+
+        dialect_module, dialect_name = metadata["dialect"].rsplit(".", maxsplit=1)
+        dialect_class = getattr(__import__(dialect_module, fromlist=[dialect_name]), dialect_name)
+
+        super().__init__(
+            visible=_to_sets(metadata["visible"]),
+            dialect=t.cast(Dialect, dialect_class(**metadata["dialect_args"])),
+            normalize=metadata["normalize"],
+        )
+        self._snapshot_fingerprint: str = metadata["fingerprint"]
+
+        # The types are decoded the first time they're needed and then shared by all the columns
+        count, pos = _read_varint(data, pos)
+        self._type_spans: t.List[t.Tuple[int, int]] = []
+        for _ in range(count):
+            length, pos = _read_varint(data, pos)
+            self._type_spans.append((pos, pos + length))
+            pos += length
+        self._types: t.List[t.Optional[exp.DataType]] = [None] * count
+
+        self._positions: t.Dict[t.Tuple[str, ...], int] = {}
+        count, pos = _read_varint(data, _FOOTER.unpack_from(data, footer_pos)[0])
+        for _ in range(count):
+            keys, pos = _read_strings(data, pos, "surrogatepass")
+            position, pos = _read_varint(data, pos)
+            table = tuple(keys)
+            self._positions[table] = position
+            self._add(table, t.cast(t.Dict, None))
+
+    def close(self) -> None:
+        """Unmaps the snapshot, after which the tables that haven't been accessed can't be used."""
+        self._mmap.close()
+
+    def fingerprint(self) -> str:
+        """
+        Returns the fingerprint of the schema the snapshot was written from, unless the schema has
+        been modified since it was loaded.
+        """
+        if not self._version:
+            return self._snapshot_fingerprint
+
+        self._load_tables()
+        return super().fingerprint()
+
+    def copy(self, **kwargs) -> IndexedSchema:
+        self._load_tables()
+        return super().copy(**kwargs)
+
+    def _columns(self, path: t.Tuple[str, ...]) -> t.Dict:
+        entry = self._tables[path]
+        columns = entry[1]
+
+        if columns is None:
+            data: t.Any = self._mmap
+            names, pos = _read_strings(data, self._positions[path], "surrogatepass")
+            columns = {}
+
+            for name in names:
+                index, pos = _read_varint(data, pos)
+                columns[name] = self._type(index)
+
+            entry[0] = entry[1] = columns
+
+        return columns
+
+    def _type(self, index: int) -> exp.DataType:
+        data_type = self._types[index]
+
+        if data_type is None:
+            start, end = self._type_spans[index]
+            data_type = self._types[index] = t.cast(exp.DataType, loads(self._mmap[start:end]))
+
+        return data_type
+
+    def _load_tables(self) -> None:
+        for path in self._tables:
+            self._columns(path)
+
+
+def _to_sets(visible: t.Any) -> t.Any:
+    if isinstance(visible, dict):
+        return {key: _to_sets(value) for key, value in visible.items()}
+    if isinstance(visible, list):
+        return set(visible)
+    return visible
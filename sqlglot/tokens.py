@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import typing as t
+from array import array
 from enum import auto
 
 from sqlglot.errors import SqlglotError, TokenError
@@ -524,6 +525,115 @@ class Token:
         return f"<Token {attributes}>"
 
 
+class TokenStream(t.Sequence[Token]):
+    """
+    A compact, array-backed sequence of tokens.
+
+    Instead of keeping a `Token` object alive for every token, the token types, offsets and
+    positions are stored in parallel `array.array` columns, and `Token` objects are only built
+    when they're accessed. The text of a token is sliced out of the SQL string on demand, unless
+    it differs from the token's span (e.g. strings, whose quotes are stripped), in which case it
+    is stored separately. The same holds for comments, since few tokens carry them.
+
+    Args:
+        sql: the SQL string the tokens were produced from.
+        tokens: optional tokens to add to the stream.
+    """
+
+    __slots__ = ("sql", "types", "starts", "ends", "lines", "cols", "texts", "comments")
+
+    def __init__(self, sql: str, tokens: t.Optional[t.Iterable[Token]] = None) -> None:
+        self.sql = sql
+        self.types = array("H")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.lines = array("I")
+        self.cols = array("I")
+        self.texts: t.Dict[int, str] = {}
+        self.comments: t.Dict[int, t.List[str]] = {}
+
+        if tokens is not None:
+            self.extend(tokens)
+
+    def append(self, token: Token) -> None:
+        index = len(self.types)
+        start = token.start
+        end = token.end
+
+        self.types.append(_TOKEN_TYPE_TO_INDEX[token.token_type])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(token.line)
+        self.cols.append(token.col)
+
+        text = token.text
+        if text != self.sql[start : end + 1]:
+            self.texts[index] = text
+        if token.comments:
+            self.comments[index] = token.comments
+
+    def extend(self, tokens: t.Iterable[Token]) -> None:
+        for token in tokens:
+            self.append(token)
+
+    def token_type(self, index: int) -> TokenType:
+        """Returns the type of the token at `index`, without building a `Token`."""
+        return _ALL_TOKEN_TYPES[self.types[index]]
+
+    def text(self, index: int) -> str:
+        """Returns the text of the token at `index`, without building a `Token`."""
+        if index < 0:
+            index += len(self.types)
+
+        text = self.texts.get(index)
+        if text is None:
+            text = self.sql[self.starts[index] : self.ends[index] + 1]
+        return text
+
+    def semicolons(self) -> t.List[int]:
+        """Returns the indices of the SEMICOLON tokens, which separate statements."""
+        semicolon = _TOKEN_TYPE_TO_INDEX[TokenType.SEMICOLON]
+        return [i for i, token_type in enumerate(self.types) if token_type == semicolon]
+
+    def _token(self, index: int) -> Token:
+        start = self.starts[index]
+        end = self.ends[index]
+        text = self.texts.get(index)
+
+        return Token(
+            _ALL_TOKEN_TYPES[self.types[index]],
+            self.sql[start : end + 1] if text is None else text,
+            line=self.lines[index],
+            col=self.cols[index],
+            start=start,
+            end=end,
+            comments=self.comments.get(index),
+        )
+
+    @t.overload
+    def __getitem__(self, index: int) -> Token: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> t.List[Token]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._token(i) for i in range(*index.indices(len(self.types)))]
+
+        if index < 0:
+            index += len(self.types)
+        if not 0 <= index < len(self.types):
+            raise IndexError("TokenStream index out of range")
+
+        return self._token(index)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __repr__(self) -> str:
+        return f"<TokenStream tokens: {len(self.types)}>"
+
+
 class _Tokenizer(type):
     def __new__(cls, clsname, bases, attrs):
         klass = super().__new__(cls, clsname, bases, attrs)
@@ -1053,6 +1163,7 @@ class Tokenizer(metaclass=_Tokenizer):
         "sql",
         "size",
         "tokens",
+        "semicolons",
         "dialect",
         "use_rs_tokenizer",
         "_start",
@@ -1065,8 +1176,12 @@ class Tokenizer(metaclass=_Tokenizer):
         "_peek",
         "_prev_token_line",
         "_rs_dialect_settings",
+        "_stream",
     )
 
+    # The number of tokens to buffer before moving them into a TokenStream, see `tokenize_stream`
+    STREAM_FLUSH_SIZE = 256
+
     def __init__(
         self,
         dialect: DialectType = None,
@@ -1095,6 +1210,9 @@ class Tokenizer(metaclass=_Tokenizer):
         self.sql = ""
         self.size = 0
         self.tokens: t.List[Token] = []
+
+        # Indices of the SEMICOLON tokens in `tokens`, set by tokenizers that compute them for free
+        self.semicolons: t.Optional[t.List[int]] = None
         self._start = 0
         self._current = 0
         self._line = 1
@@ -1105,15 +1223,39 @@ class Tokenizer(metaclass=_Tokenizer):
         self._end = False
         self._peek = ""
         self._prev_token_line = -1
+        self._stream: t.Optional[TokenStream] = None
 
     def tokenize(self, sql: str) -> t.List[Token]:
         """Returns a list of tokens corresponding to the SQL string `sql`."""
         if self.use_rs_tokenizer:
             return self.tokenize_rs(sql)
 
+        self._tokenize(sql)
+        return self.tokens
+
+    def tokenize_stream(self, sql: str) -> TokenStream:
+        """
+        Returns a compact `TokenStream` of the tokens corresponding to the SQL string `sql`.
+
+        The Python tokenizer moves tokens into the stream in batches while scanning, so that only
+        a handful of `Token` objects are alive at any point in time.
+        """
+        if self.use_rs_tokenizer or type(self).tokenize is not Tokenizer.tokenize:
+            return TokenStream(sql, self.tokenize(sql))
+
+        stream = TokenStream(sql)
+        self._tokenize(sql, stream)
+
+        stream.extend(self.tokens)
+        self.tokens = []
+
+        return stream
+
+    def _tokenize(self, sql: str, stream: t.Optional[TokenStream] = None) -> None:
         self.reset()
         self.sql = sql
         self.size = len(sql)
+        self._stream = stream
 
         try:
             self._scan()
@@ -1123,8 +1265,6 @@ class Tokenizer(metaclass=_Tokenizer):
             context = self.sql[start:end]
             raise TokenError(f"Error tokenizing '{context}'") from e
 
-        return self.tokens
-
     def _scan(self, until: t.Optional[t.Callable] = None) -> None:
         while self.size and not self._end:
             current = self._current
@@ -1151,8 +1291,13 @@ class Tokenizer(metaclass=_Tokenizer):
                 else:
                     self._scan_keywords()
 
-            if until and until():
-                break
+            if until:
+                if until():
+                    break
+            elif self._stream is not None and len(self.tokens) > self.STREAM_FLUSH_SIZE:
+                # Only the last two tokens may still be inspected or mutated while scanning
+                self._stream.extend(self.tokens[:-2])
+                del self.tokens[:-2]
 
         if self.tokens and self._comments:
             self.tokens[-1].comments.extend(self._comments)
@@ -1579,12 +1724,15 @@ class Tokenizer(metaclass=_Tokenizer):
         if not self._RS_TOKENIZER:
             raise SqlglotError("Rust tokenizer is not available")
 
-        tokens, error_msg = self._RS_TOKENIZER.tokenize(sql, self._rs_dialect_settings)
+        # The token texts are only materialized when they're first accessed, and the statement
+        # boundaries are computed in Rust so that the parser doesn't need to rescan the tokens
+        tokens, semicolons, error_msg = self._RS_TOKENIZER.tokenize(sql, self._rs_dialect_settings)
         for token in tokens:
             token.token_type = _ALL_TOKEN_TYPES[token.token_type_index]
 
         # Setting this here so partial token lists can be inspected even if there is a failure
         self.tokens = tokens
+        self.semicolons = semicolons
 
         if error_msg is not None:
             raise TokenError(error_msg)
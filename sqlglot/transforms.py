@@ -326,9 +326,10 @@ def unnest_to_explode(
             columns = alias.columns if alias else []
             offset = unnest.args.get("offset")
             if offset:
-                columns.insert(
-                    0, offset if isinstance(offset, exp.Identifier) else exp.to_identifier("pos")
-                )
+                columns = [
+                    offset if isinstance(offset, exp.Identifier) else exp.to_identifier("pos"),
+                    *columns,
+                ]
 
             unnest.replace(
                 exp.Table(
@@ -355,7 +356,7 @@ def unnest_to_explode(
                 has_multi_expr = len(exprs) > 1
                 exprs = _unnest_zip_exprs(unnest, exprs, has_multi_expr)
 
-                joins.remove(join)
+                join.pop()
 
                 alias_cols = alias.columns if alias else []
 
@@ -370,10 +371,10 @@ def unnest_to_explode(
 
                 offset = unnest.args.get("offset")
                 if offset:
-                    alias_cols.insert(
-                        0,
+                    alias_cols = [
                         offset if isinstance(offset, exp.Identifier) else exp.to_identifier("pos"),
-                    )
+                        *alias_cols,
+                    ]
 
                 for e, column in zip(exprs, alias_cols):
                     expression.append(
@@ -483,16 +484,14 @@ def explode_projection_to_unnest(
 
                     if is_posexplode:
                         expressions = expression.expressions
-                        expressions.insert(
-                            expressions.index(alias) + 1,
-                            exp.If(
-                                this=exp.column(series_alias, table=series_table_alias).eq(
-                                    exp.column(pos_alias, table=unnest_source_alias)
-                                ),
-                                true=exp.column(pos_alias, table=unnest_source_alias),
-                            ).as_(pos_alias),
-                        )
-                        expression.set("expressions", expressions)
+                        i = expressions.index(alias) + 1
+                        pos = exp.If(
+                            this=exp.column(series_alias, table=series_table_alias).eq(
+                                exp.column(pos_alias, table=unnest_source_alias)
+                            ),
+                            true=exp.column(pos_alias, table=unnest_source_alias),
+                        ).as_(pos_alias)
+                        expression.set("expressions", [*expressions[:i], pos, *expressions[i:]])
 
                     if not arrays:
                         if expression.args.get("from_"):
@@ -689,9 +688,9 @@ def move_ctes_to_top_level(expression: E) -> E:
             inner_with.pop()
 
             if parent_cte:
-                i = top_level_with.expressions.index(parent_cte)
-                top_level_with.expressions[i:i] = inner_with.expressions
-                top_level_with.set("expressions", top_level_with.expressions)
+                ctes = top_level_with.expressions
+                i = ctes.index(parent_cte)
+                top_level_with.set("expressions", [*ctes[:i], *inner_with.expressions, *ctes[i:]])
             else:
                 top_level_with.set(
                     "expressions", top_level_with.expressions + inner_with.expressions
@@ -1,6 +1,8 @@
 use std::path::Path;
 
 use criterion::{black_box, criterion_group, criterion_main, Criterion};
+use pyo3::types::PyString;
+use pyo3::Python;
 use sqlglotrs::settings::{TokenTypeSettings, TokenizerDialectSettings, TokenizerSettings};
 use sqlglotrs::tokenizer::Tokenizer;
 
@@ -60,8 +62,11 @@ fn long(c: &mut Criterion) {
         serde_json::from_str::<TokenizerDialectSettings>(&dialect_settings).unwrap();
     let tokenizer = Tokenizer::new(tokenizer_settings, settings_type_file);
 
-    c.bench_function("long", |b| {
-        b.iter(|| black_box(tokenizer.tokenize(LONG, &dialect_settings)));
+    Python::with_gil(|py| {
+        let sql = PyString::new(py, LONG);
+        c.bench_function("long", |b| {
+            b.iter(|| black_box(tokenizer.tokenize(&sql, &dialect_settings)));
+        });
     });
 }
 
@@ -1,7 +1,8 @@
 use crate::settings::TokenType;
 use pyo3::prelude::*;
-use pyo3::types::{PyList, PyString};
+use pyo3::types::{PyList, PySlice, PyString};
 use pyo3::{pyclass, pymethods, Py, PyObject, Python};
+use std::sync::OnceLock;
 
 #[derive(Debug)]
 #[pyclass]
@@ -10,9 +11,11 @@ pub struct Token {
     pub token_type: TokenType,
     #[pyo3(get, set, name = "token_type")]
     pub token_type_py: PyObject,
-    #[pyo3(get)]
-    pub text: Py<PyString>,
-    #[pyo3(get)]
+    // The text is only materialized as a Python string when it's first accessed, unless it differs
+    // from the token's span in the source string (e.g. unquoted strings), in which case it's owned
+    pub text: OnceLock<Py<PyString>>,
+    pub source: Py<PyString>,
+    #[pyo3(get, set)]
     pub line: usize,
     #[pyo3(get)]
     pub col: usize,
@@ -25,9 +28,11 @@ pub struct Token {
 }
 
 impl Token {
+    #[allow(clippy::too_many_arguments)]
     pub fn new(
         token_type: TokenType,
-        text: String,
+        text: Option<String>,
+        source: &Py<PyString>,
         line: usize,
         col: usize,
         start: usize,
@@ -37,7 +42,11 @@ impl Token {
         Python::with_gil(|py| Token {
             token_type,
             token_type_py: py.None(),
-            text: PyString::new(py, &text).unbind(),
+            text: match text {
+                Some(text) => OnceLock::from(PyString::new(py, &text).unbind()),
+                None => OnceLock::new(),
+            },
+            source: source.clone_ref(py),
             line,
             col,
             start,
@@ -60,8 +69,31 @@ impl Token {
 
 #[pymethods]
 impl Token {
+    #[getter]
+    fn text(&self, py: Python) -> PyResult<Py<PyString>> {
+        if let Some(text) = self.text.get() {
+            return Ok(text.clone_ref(py));
+        }
+
+        let span = PySlice::new(py, self.start as isize, self.end as isize + 1, 1);
+        let text = self
+            .source
+            .bind(py)
+            .get_item(span)?
+            .downcast_into::<PyString>()?
+            .unbind();
+
+        Ok(self.text.get_or_init(|| text).clone_ref(py))
+    }
+
+    #[setter]
+    fn set_text(&mut self, text: Py<PyString>) {
+        self.text = OnceLock::from(text);
+    }
+
     fn __repr__(&self, py: Python) -> PyResult<String> {
-        let text = self.text.bind(py).to_str()?;
+        let text = self.text(py)?;
+        let text = text.bind(py).to_str()?;
         let comments = self.comments.bind(py);
         let token_type_str = self.token_type_py.bind(py).str()?;
         let comments_repr = comments.repr()?;
@@ -2,6 +2,7 @@ use crate::settings::TokenType;
 use crate::trie::{Trie, TrieResult};
 use crate::{Token, TokenTypeSettings, TokenizerDialectSettings, TokenizerSettings};
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use std::cmp::{max, min};
 
 #[derive(Debug)]
@@ -40,32 +41,50 @@ impl Tokenizer {
         }
     }
 
+    /// Tokenizes `sql`, returning the tokens, the indices of the semicolon tokens that separate
+    /// its statements and an error message, if tokenization failed midway.
     pub fn tokenize(
         &self,
-        sql: &str,
+        sql: &Bound<'_, PyString>,
         dialect_settings: &TokenizerDialectSettings,
-    ) -> (Vec<Token>, Option<String>) {
+    ) -> (Vec<Token>, Vec<usize>, Option<String>) {
+        let text = match sql.to_cow() {
+            Ok(text) => text,
+            Err(e) => return (Vec::new(), Vec::new(), Some(format!("Error tokenizing: {}", e))),
+        };
+
         let mut state = TokenizerState::new(
-            sql,
+            &text,
+            sql.clone().unbind(),
             &self.settings,
             &self.token_types,
             dialect_settings,
             &self.keyword_trie,
         );
         let tokenize_result = state.tokenize();
-        match tokenize_result {
+        let (tokens, error) = match tokenize_result {
             Ok(tokens) => (tokens, None),
             Err(e) => {
                 let msg = format!("Error tokenizing '{}': {}", e.context, e.message);
                 (state.tokens, Some(msg))
             }
-        }
+        };
+
+        let semicolons = tokens
+            .iter()
+            .enumerate()
+            .filter(|(_, token)| token.token_type == self.token_types.semicolon)
+            .map(|(i, _)| i)
+            .collect();
+
+        (tokens, semicolons, error)
     }
 }
 
 #[derive(Debug)]
 struct TokenizerState<'a> {
     sql: Vec<char>,
+    source: Py<PyString>,
     size: usize,
     tokens: Vec<Token>,
     start: usize,
@@ -86,6 +105,7 @@ struct TokenizerState<'a> {
 impl<'a> TokenizerState<'a> {
     fn new(
         sql: &str,
+        source: Py<PyString>,
         settings: &'a TokenizerSettings,
         token_types: &'a TokenTypeSettings,
         dialect_settings: &'a TokenizerDialectSettings,
@@ -95,6 +115,7 @@ impl<'a> TokenizerState<'a> {
         let sql_vec_len = sql_vec.len();
         TokenizerState {
             sql: sql_vec,
+            source,
             size: sql_vec_len,
             tokens: Vec::new(),
             start: 0,
@@ -233,7 +254,8 @@ impl<'a> TokenizerState<'a> {
 
         self.tokens.push(Token::new(
             token_type,
-            text.unwrap_or(self.text()),
+            text,
+            &self.source,
             self.line,
             self.column,
             self.start,
@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+from sqlglot import parse_one
+from sqlglot.corpus import Corpus, CorpusWriter
+from sqlglot.serde import dumps
+from tests.helpers import load_sql_fixtures
+
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "test.corpus")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_corpus(self):
+        expressions = [parse_one(sql) for sql in load_sql_fixtures("identity.sql")]
+
+        with CorpusWriter(self.path) as writer:
+            for expression in expressions:
+                writer.add(expression)
+
+        with Corpus(self.path) as corpus:
+            self.assertEqual(len(corpus), len(expressions))
+            self.assertEqual(corpus[5], expressions[5])
+            self.assertEqual(corpus[-1], expressions[-1])
+            self.assertEqual(corpus.data(3), dumps(expressions[3]))
+            self.assertEqual(list(corpus), expressions)
+            self.assertEqual(
+                [node.meta for node in corpus[7].walk()],
+                [node.meta for node in expressions[7].walk()],
+            )
+
+            with self.assertRaises(IndexError):
+                corpus[len(expressions)]
+
+    def test_index(self):
+        with CorpusWriter(self.path) as writer:
+            writer.add(parse_one("SELECT * FROM a.b.x"))
+            writer.add(parse_one("SELECT 1"))
+            writer.add(parse_one("SELECT * FROM b.x JOIN y ON x.id = y.id"))
+            writer.add(parse_one("INSERT INTO x SELECT * FROM (SELECT * FROM z)"))
+
+        with Corpus(self.path) as corpus:
+            self.assertEqual(sorted(corpus.tables()), ["a.b.x", "b.x", "x", "y", "z"])
+            self.assertEqual(corpus.referencing("x"), [0, 2, 3])
+            self.assertEqual(corpus.referencing("b.x"), [0, 2])
+            self.assertEqual(corpus.referencing("a.b.x"), [0])
+            self.assertEqual(corpus.referencing("w"), [])
+            self.assertEqual([e.sql() for e in corpus.find_all("z")], [corpus[3].sql()])
+
+    def test_empty(self):
+        CorpusWriter(self.path).close()
+
+        with Corpus(self.path) as corpus:
+            self.assertEqual(len(corpus), 0)
+            self.assertEqual(list(corpus), [])
+            self.assertEqual(corpus.tables(), [])
+
+    def test_invalid(self):
+        with open(self.path, "wb") as file:
+            file.write(b"SELECT 1")
+
+        with self.assertRaises(ValueError):
+            Corpus(self.path)
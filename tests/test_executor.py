@@ -1,6 +1,8 @@
 import ast
 import csv
 import datetime
+import statistics
+import tracemalloc
 import unittest
 from datetime import date, time
 from multiprocessing import Pool
@@ -12,11 +14,14 @@ from pandas.testing import assert_frame_equal
 
 from sqlglot import exp, find_tables, parse_one, transpile
 from sqlglot.errors import ExecuteError
-from sqlglot.executor import execute
-from sqlglot.executor.python import Python
+from sqlglot.executor import execute, spill
+from sqlglot.executor.aggregate import Avg, Collect, Count, HashAggregate, Max, Sum
+from sqlglot.executor.python import Python, PythonExecutor
+from sqlglot.executor.streaming import StreamingExecutor
 from sqlglot.executor.table import Table, ensure_tables
+from sqlglot.executor.vectorized import ColumnarTable, Vector
 from sqlglot.optimizer import optimize
-from sqlglot.planner import Plan
+from sqlglot.planner import Aggregate, Plan
 from tests.helpers import (
     FIXTURES_DIR,
     SKIP_INTEGRATION,
@@ -52,7 +57,7 @@ def initializer(schema, tables):
     _tables = tables
 
 
-def mp_execute(expression, meta):
+def mp_execute(expression, meta, vectorized=False):
     if not meta.get("execute"):
         return None
 
@@ -62,7 +67,7 @@ def mp_execute(expression, meta):
         name = t.name
         tables[name] = _tables[name]
 
-    return execute(expression, schema=_schema, tables=tables)
+    return execute(expression, schema=_schema, tables=tables, vectorized=vectorized)
 
 
 @unittest.skipIf(SKIP_INTEGRATION, "Skipping Integration Tests since `SKIP_INTEGRATION` is set")
@@ -157,7 +162,7 @@ class TestExecutor(unittest.TestCase):
             )
             assert_frame_equal(a, b, check_dtype=False, check_index_type=False)
 
-    def _mp_execute(self, schema, tables, sqls, tpch):
+    def _mp_execute(self, schema, tables, sqls, tpch, vectorized=False):
         with Pool(
             initializer=initializer,
             initargs=(schema, tables),
@@ -165,7 +170,7 @@ class TestExecutor(unittest.TestCase):
             for i, table in enumerate(
                 pool.starmap(
                     mp_execute,
-                    ((parse_one(sql), args) for args, sql, _ in sqls),
+                    ((parse_one(sql), args, vectorized) for args, sql, _ in sqls),
                 )
             ):
                 if table is not None:
@@ -177,6 +182,9 @@ class TestExecutor(unittest.TestCase):
     def test_execute_tpcds(self):
         self._mp_execute(TPCDS_SCHEMA, self.tpcds_tables, self.tpcds_sqls, False)
 
+    def test_execute_tpcds_vectorized(self):
+        self._mp_execute(TPCDS_SCHEMA, self.tpcds_tables, self.tpcds_sqls, False, vectorized=True)
+
     def test_execute_callable(self):
         tables = {
             "x": [
@@ -940,3 +948,378 @@ class TestExecutor(unittest.TestCase):
             {"id": 2, "product": "Shoes", "price": 60.0},
         ]
         self.assertEqual(table.to_pylist(), expected)
+
+    def test_vectorized(self):
+        tables = {
+            "x": [
+                {"a": 1, "b": 2.5, "c": "x", "d": True},
+                {"a": 1, "b": None, "c": "y", "d": False},
+                {"a": None, "b": 1.0, "c": None, "d": None},
+                {"a": 3, "b": -2.0, "c": "x", "d": True},
+                {"a": 2, "b": 0.0, "c": "z", "d": False},
+            ],
+            "y": [
+                {"a": 1, "e": "p"},
+                {"a": 1, "e": "q"},
+                {"a": None, "e": "r"},
+                {"a": 5, "e": "s"},
+            ],
+        }
+
+        for sql in (
+            "SELECT a + 1 AS a, b * 2 AS b, NOT d AS d FROM x",
+            "SELECT a, b FROM x WHERE a > 1 OR b IS NULL",
+            "SELECT a FROM x WHERE a IN (1, 3) AND NOT c IN ('y')",
+            "SELECT CASE WHEN a > 1 THEN 'big' WHEN a = 1 THEN 'one' ELSE c END AS k FROM x",
+            "SELECT COALESCE(a, b, 0) AS k, IF(d, a, b) AS i FROM x",
+            "SELECT a / 2 AS h, a % 2 AS m, a BETWEEN 1 AND 2 AS btw FROM x",
+            "SELECT CAST(a AS DOUBLE) AS f, CAST(b AS INT) AS i, CAST(a AS TEXT) AS s FROM x",
+            "SELECT UPPER(c) AS u, SUBSTRING(c, 1, 1) AS s, a * 2 > b AS g FROM x",
+            "SELECT a, COUNT(*) AS n, SUM(b) AS s, AVG(b) AS av, MIN(c) AS mi, MAX(a) AS ma "
+            "FROM x GROUP BY a",
+            "SELECT c, SUM(a) AS s, AVG(a) AS av FROM x GROUP BY c ORDER BY c",
+            "SELECT a, SUM(b) * 2 + 1 AS s FROM x GROUP BY a HAVING COUNT(*) > 1",
+            "SELECT a, ARRAY_AGG(c) AS l FROM x GROUP BY a",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a ORDER BY s DESC LIMIT 2",
+            "SELECT SUM(a) AS s, COUNT(*) AS n FROM x WHERE a > 10",
+            "SELECT DISTINCT c FROM x",
+            "SELECT a, c FROM x ORDER BY c, a DESC",
+            "SELECT a FROM x LIMIT 2",
+            "SELECT x.a, y.e FROM x JOIN y ON x.a = y.a",
+            "SELECT x.a, y.e FROM x LEFT JOIN y ON x.a = y.a",
+            "SELECT x.a, y.e FROM x RIGHT JOIN y ON x.a = y.a",
+            "SELECT x.a, y.e FROM x JOIN y ON x.a = y.a AND x.c <> y.e",
+            "SELECT x.a, y.e FROM x CROSS JOIN y WHERE x.a < y.a",
+            "SELECT a FROM x UNION SELECT a FROM y",
+            "SELECT 1 AS one, 'a' AS s",
+        ):
+            with self.subTest(sql):
+                expected = execute(sql, tables=tables)
+                result = execute(sql, tables=tables, vectorized=True)
+                self.assertEqual(result.columns, expected.columns)
+                self.assertEqual(result.rows, expected.rows)
+
+        # Errors are raised by the steps that fall back to PythonExecutor
+        for sql in ("SELECT a / 0 AS r FROM x", "SELECT a FROM x ORDER BY a DESC"):
+            with self.subTest(sql):
+                with self.assertRaises(ExecuteError):
+                    execute(sql, tables=tables, vectorized=True)
+
+        table = ColumnarTable(
+            ["a", "b"], [Vector.from_list([1, None]), Vector.from_list(["x", "y"])], 2
+        )
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.rows, [(1, "x"), (None, "y")])
+        table.rows.append((2, "z"))
+        self.assertEqual(table.vectors[0].to_list(), [1, None, 2])
+        self.assertEqual(table.view(range(1, 2))[2]["b"], "z")
+
+    def test_codegen(self):
+        tables = {
+            "x": [
+                {"a": 1, "b": 2.5, "c": "x"},
+                {"a": 1, "b": None, "c": "y"},
+                {"a": None, "b": 1.0, "c": None},
+                {"a": 3, "b": -2.0, "c": "x"},
+            ],
+            "y": [
+                {"a": 1, "e": "p"},
+                {"a": 3, "e": "x"},
+                {"a": 5, "e": "s"},
+            ],
+            "z": [],
+        }
+
+        for sql in (
+            "SELECT a + 1 AS a, b * 2 AS b FROM x WHERE a > 1 OR b IS NULL",
+            "SELECT CASE WHEN a > 1 THEN 'big' ELSE c END AS k, COALESCE(a, b) AS m FROM x",
+            "SELECT * FROM x LIMIT 2",
+            "SELECT a FROM x LIMIT 0",
+            "SELECT x.a, y.e FROM x JOIN y ON x.a = y.a",
+            "SELECT x.a, y.e FROM x LEFT JOIN y ON x.a = y.a AND x.c <> y.e WHERE x.b > 0",
+            "SELECT x.c, y.e FROM x CROSS JOIN y WHERE x.a < y.a LIMIT 3",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a HAVING COUNT(*) > 1",
+            "SELECT x.a FROM x JOIN z ON x.a = z.a",
+            "SELECT 1 AS one, 'a' AS s",
+        ):
+            with self.subTest(sql):
+                expected = execute(sql, tables=tables)
+                result = execute(sql, tables=tables, codegen=True)
+                self.assertEqual(result.columns, expected.columns)
+                self.assertEqual(result.rows, expected.rows)
+
+        with self.assertRaises(ExecuteError):
+            execute("SELECT a / 0 AS r FROM x", tables=tables, codegen=True)
+
+        executor = PythonExecutor(codegen=True)
+        context = executor.context({"x": Table(["a", "b"], [(1, 2), (3, 4)])})
+        rows = context.tables["x"].rows
+        step = executor.compile_step(context, rows, parse_one("x.a > 1"), [parse_one("x.b")])
+        self.assertEqual(step(rows), [(4,)])
+        self.assertIsNone(executor.compile_step(context, rows, parse_one("y.a > 1")))
+
+    def test_hash_aggregate(self):
+        class SortExecutor(PythonExecutor):
+            def aggregate(self, step, context):
+                return self.sort_aggregate(step, context)
+
+        schema = {"x": {"a": "INT", "b": "DOUBLE", "c": "TEXT"}}
+        tables = ensure_tables(
+            {
+                "x": [
+                    {"a": 2, "b": 0.1, "c": "y"},
+                    {"a": None, "b": 1.5, "c": "x"},
+                    {"a": 1, "b": None, "c": None},
+                    {"a": 2, "b": 0.2, "c": "x"},
+                    {"a": 1, "b": 1e16, "c": "z"},
+                    {"a": 1, "b": -1e16, "c": "z"},
+                    {"a": None, "b": 0.3, "c": "y"},
+                ]
+            }
+        )
+
+        for sql in (
+            "SELECT a, SUM(b) AS s, COUNT(*) AS n, COUNT(b) AS nb, AVG(b) AS av FROM x GROUP BY a",
+            "SELECT c, MIN(a) AS mi, MAX(b) AS ma FROM x GROUP BY c",
+            "SELECT a, c, SUM(b) / COUNT(*) + 1 AS r FROM x GROUP BY a, c",
+            "SELECT a, SUM(b + 1) AS s FROM x GROUP BY a HAVING COUNT(*) > 1",
+            "SELECT a, ARRAY_AGG(c) AS l FROM x GROUP BY a",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a LIMIT 2",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a ORDER BY s",
+            "SELECT SUM(a) AS s, AVG(b) AS av FROM x",
+            "SELECT SUM(a) AS s, COUNT(*) AS n FROM x WHERE a > 10",
+            "SELECT DISTINCT a FROM x",
+        ):
+            with self.subTest(sql):
+                plan = Plan(optimize(sql, schema, leave_tables_isolated=True))
+                expected = SortExecutor(tables=tables).execute(plan)
+
+                for codegen in (False, True):
+                    result = PythonExecutor(tables=tables, codegen=codegen).execute(plan)
+                    self.assertEqual(result.columns, expected.columns)
+                    self.assertEqual(result.rows, expected.rows)
+
+        # COUNT is computed incrementally, rather than by collecting the rows of each group
+        sql = "SELECT a, COUNT(*) AS n, COUNT(b) AS m, COUNT('') AS o FROM x GROUP BY a"
+        plan = Plan(optimize(sql, schema, leave_tables_isolated=True))
+        step = next(step for step in plan.dag if isinstance(step, Aggregate))
+        _, accumulators, _ = PythonExecutor().aggregator(step)
+        self.assertEqual([type(accumulator) for accumulator in accumulators], [Count] * 3)
+        self.assertIsInstance(
+            PythonExecutor().accumulator(exp.Count(this=exp.Star(), big_int=True), lambda e: 1),
+            Count,
+        )
+
+        result = PythonExecutor(tables=tables).execute(plan)
+        self.assertEqual(result.rows, SortExecutor(tables=tables).execute(plan).rows)
+        self.assertEqual(sorted(result.rows, key=str)[0], (1, 3, 2, 3))
+
+        aggregate = HashAggregate(1, [Sum(1), Avg(1), Max(2), Collect([2], list)])
+        aggregate.update([("a", 0.1, "x"), ("b", 1, None)])
+        other = HashAggregate(1, [Sum(1), Avg(1), Max(2), Collect([2], list)])
+        other.update([("a", 0.2, "z"), ("a", 0.3, "y")])
+        aggregate.merge(other)
+
+        self.assertEqual(
+            {key: aggregate.finalize(states) for key, states in aggregate.groups.items()},
+            {
+                ("a",): [
+                    0.1 + (0.2 + 0.3),
+                    statistics.fmean([0.1, 0.2, 0.3]),
+                    "z",
+                    ["x", "z", "y"],
+                ],
+                ("b",): [1, 1.0, None, [None]],
+            },
+        )
+
+    def test_memory_budget(self):
+        tables = {
+            "x": [{"a": i % 7, "b": i, "c": str(i % 3) if i % 5 else None} for i in range(200)],
+            "y": [{"a": i, "d": f"d{i}"} for i in range(0, 10, 2)],
+        }
+
+        for sql in (
+            "SELECT a, b FROM x ORDER BY a DESC, c",
+            "SELECT a, b FROM x ORDER BY c NULLS FIRST, a LIMIT 50",
+            "SELECT x.b, y.d FROM x JOIN y ON x.a = y.a",
+            "SELECT x.b, y.d FROM x LEFT JOIN y ON x.a = y.a",
+            "SELECT x.b, y.d FROM x RIGHT JOIN y ON x.a = y.a",
+            "SELECT a, c, SUM(b) AS s, COUNT(*) AS n FROM x GROUP BY a, c",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a LIMIT 3",
+            "SELECT DISTINCT c FROM x",
+            "SELECT SUM(b) AS s FROM x",
+            "SELECT a FROM x UNION SELECT a FROM y",
+            "SELECT a FROM x INTERSECT SELECT a FROM y",
+            "SELECT a FROM x EXCEPT SELECT a FROM y",
+            "SELECT a FROM x UNION ALL SELECT a FROM y",
+            "SELECT x.b, y.d FROM x CROSS JOIN y WHERE x.b < 3",
+            "SELECT x.b, y.d, z.b FROM x JOIN y ON x.a = y.a JOIN x AS z ON y.a = z.b",
+            "WITH t AS (SELECT a, b FROM x) SELECT t.b, u.b FROM t JOIN t AS u ON t.b = u.b",
+        ):
+            with self.subTest(sql):
+                expected = execute(sql, tables=tables)
+                result = execute(sql, tables=tables, memory_budget=1)
+                self.assertEqual(result.columns, expected.columns)
+
+                # Queries with a budget are streamed, so their rows are only ordered by ORDER BY
+                if " ORDER BY " in sql:
+                    self.assertEqual(result.rows, expected.rows)
+                else:
+                    self.assertEqual(sorted(result.rows, key=repr), sorted(expected.rows, key=repr))
+
+        with self.assertRaises(ExecuteError):
+            execute("SELECT a FROM x", tables=tables, vectorized=True, memory_budget=1)
+
+        tables = {
+            "x": Table(["a", "b", "c"], [(i % 100, i, f"c{i}") for i in range(5000)]),
+            "y": Table(["a", "d"], [(i % 100, f"d{i}") for i in range(5000)]),
+        }
+
+        for sql in (
+            "SELECT COUNT(*) AS n FROM x JOIN y ON x.b = y.a",
+            "SELECT COUNT(*) AS n FROM (SELECT c FROM x UNION SELECT d FROM y) AS t",
+            "SELECT COUNT(*) AS n, SUM(s) AS s FROM (SELECT b, SUM(a) AS s FROM x GROUP BY b) AS t",
+        ):
+            with self.subTest(sql):
+                results = []
+                peaks = []
+
+                for memory_budget in (None, 1 << 16):
+                    tracemalloc.start()
+                    try:
+                        results.append(
+                            execute(sql, tables=tables, memory_budget=memory_budget).rows
+                        )
+                        peaks.append(tracemalloc.get_traced_memory()[1])
+                    finally:
+                        tracemalloc.stop()
+
+                self.assertEqual(results[0], results[1])
+                self.assertLess(peaks[1], peaks[0] * 0.75)
+
+        rows = [(i % 10, i) for i in range(1000)]
+        self.assertEqual(
+            list(spill.external_sort(rows, key=lambda row: row[0], budget=500)),
+            sorted(rows, key=lambda row: row[0]),
+        )
+
+        files = spill.partition(rows, key=lambda row: row[0], count=3)
+        self.assertEqual(sum(len(file) for file in files), len(rows))
+        for file in files:
+            self.assertEqual(
+                list(file), [row for row in rows if hash(row[0]) % 3 == files.index(file)]
+            )
+        spill.close(files)
+
+    def test_streaming(self):
+        tables = {
+            "x": [{"a": i % 7, "b": i, "c": str(i % 3) if i % 5 else None} for i in range(200)],
+            "y": [{"a": i, "d": f"d{i}"} for i in range(0, 10, 2)],
+        }
+
+        for sql in (
+            "SELECT a, b FROM x WHERE b > 10 ORDER BY a DESC, c, b",
+            "SELECT a, b FROM x ORDER BY c NULLS FIRST, a, b LIMIT 50",
+            "SELECT x.b, y.d FROM x JOIN y ON x.a = y.a",
+            "SELECT x.b, y.d FROM x LEFT JOIN y ON x.a = y.a",
+            "SELECT x.b, y.d FROM x RIGHT JOIN y ON x.a = y.a",
+            "SELECT x.b, y.d FROM x JOIN y ON x.a = y.a AND x.b > y.a * 10",
+            "SELECT x.b, y.d FROM x CROSS JOIN y WHERE x.b < 3",
+            "SELECT a, c, SUM(b) AS s, COUNT(*) AS n FROM x GROUP BY a, c",
+            "SELECT a, SUM(b) AS s FROM x GROUP BY a HAVING COUNT(*) > 28",
+            "SELECT DISTINCT c FROM x",
+            "SELECT SUM(b) AS s FROM x",
+            "SELECT b FROM x WHERE a IN (SELECT a FROM y)",
+            "SELECT b FROM x WHERE EXISTS(SELECT 1 FROM y WHERE y.a = x.a)",
+            "WITH t AS (SELECT a, d FROM y) SELECT t.d, u.a FROM t JOIN t AS u ON t.a = u.a",
+            "SELECT a FROM x UNION SELECT a FROM y",
+            "SELECT a FROM x INTERSECT SELECT a FROM y",
+            "SELECT a FROM x EXCEPT SELECT a FROM y",
+            "SELECT a FROM x UNION ALL SELECT a FROM y",
+        ):
+            with self.subTest(sql):
+                expected = execute(sql, tables=tables)
+
+                for kwargs in ({}, {"codegen": True}, {"memory_budget": 1}):
+                    result = execute(sql, tables=tables, streaming=True, **kwargs)
+                    self.assertEqual(result.columns, expected.columns)
+
+                    if " ORDER BY " in sql:
+                        self.assertEqual(result.rows, expected.rows)
+                    else:
+                        self.assertEqual(
+                            sorted(result.rows, key=repr), sorted(expected.rows, key=repr)
+                        )
+
+        self.assertEqual(
+            execute(
+                "SELECT b FROM x WHERE EXISTS(SELECT 1 FROM y WHERE d = 'd4') AND b < 2",
+                tables=tables,
+                streaming=True,
+            ).rows,
+            [(0,), (1,)],
+        )
+        self.assertEqual(
+            execute(
+                "SELECT b FROM x WHERE NOT EXISTS(SELECT 1 FROM y WHERE d = 'd4')",
+                tables=tables,
+                streaming=True,
+            ).rows,
+            [],
+        )
+
+        pulled = []
+
+        class CountingExecutor(StreamingExecutor):
+            def chunks(self, rows):
+                for batch in super().chunks(rows):
+                    pulled.append(len(batch))
+                    yield batch
+
+        schema = {"x": {"a": "INT", "b": "INT", "c": "TEXT"}, "y": {"a": "INT", "d": "TEXT"}}
+
+        for sql, expected, count in (
+            ("SELECT b FROM x LIMIT 3", [(0,), (1,), (2,)], 10),
+            ("SELECT b FROM x WHERE a = 6 LIMIT 2", [(6,), (13,)], 20),
+            ("SELECT x.b, y.d FROM x JOIN y ON x.a = y.a LIMIT 2", [(0, "d0"), (2, "d2")], 15),
+            ("SELECT b FROM x WHERE a IN (SELECT a FROM y) LIMIT 1", [(0,)], 15),
+            ("SELECT b FROM x WHERE EXISTS(SELECT 1 FROM y) AND b < 2 LIMIT 1", [(0,)], 15),
+        ):
+            with self.subTest(sql):
+                pulled.clear()
+                plan = Plan(optimize(sql, schema, leave_tables_isolated=True))
+                executor = CountingExecutor(tables=ensure_tables(tables), batch_size=10)
+                self.assertEqual(executor.execute(plan).rows, expected)
+                self.assertEqual(sum(pulled), count)
+
+        # The rows past the limit are never projected, so they can't fail
+        for sql, rows, expected in (
+            ("SELECT 10 / i AS c FROM z LIMIT 1", [1, 0], 10.0),
+            ("SELECT -i AS c FROM z WHERE i > 0 LIMIT 1", [1, 0, None], -1),
+            ("SELECT 10 / i AS c FROM z JOIN y ON z.i = y.a LIMIT 1", [2, 0], 5.0),
+        ):
+            for kwargs in ({}, {"codegen": True}):
+                with self.subTest(sql, **kwargs):
+                    z = [{"i": i} for i in rows]
+                    result = execute(sql, tables={**tables, "z": z}, streaming=True, **kwargs)
+                    self.assertEqual(result.rows, [(expected,)])
+
+        class SortStreamingExecutor(StreamingExecutor):
+            def requires_sort_aggregate(self, step):
+                return True
+
+        plan = Plan(
+            optimize(
+                "SELECT a, SUM(b) AS s FROM x WHERE b > 3 GROUP BY a HAVING COUNT(*) > 27",
+                schema,
+                leave_tables_isolated=True,
+            )
+        )
+        self.assertEqual(
+            SortStreamingExecutor(tables=ensure_tables(tables)).execute(plan).rows,
+            PythonExecutor(tables=ensure_tables(tables)).execute(plan).rows,
+        )
+
+        with self.assertRaises(ExecuteError):
+            execute("SELECT a FROM x", tables=tables, vectorized=True, streaming=True)
@@ -624,6 +624,43 @@ class TestExpressions(unittest.TestCase):
 
         self.assertEqual(expression.transform(remove_all_columns).sql(), "SELECT FROM x")
 
+    def test_undo_mutations(self):
+        expression = parse_one("SELECT a, b /* c */ FROM x JOIN y ON x.id = y.id")
+        original = expression.copy()
+        columns = list(expression.find_all(exp.Column))
+
+        with exp.undo_mutations():
+            expression.find(exp.Join).pop()
+            expression.selects[0].replace(exp.column("z"))
+            expression.selects[1].pop_comments()
+            expression.selects[1].type = "int"
+            expression.selects[1].meta["foo"] = "bar"
+            expression.append("expressions", columns[-1])
+            expression.set("where", exp.Where(this=columns[2]))
+            self.assertEqual(expression.sql(), "SELECT z, b, y.id FROM x WHERE x.id")
+
+            with exp.undo_mutations():
+                expression.set("expressions", None)
+
+            self.assertEqual(expression.sql(), "SELECT FROM x WHERE x.id")
+
+        self.assertEqual(expression, original)
+        self.assertEqual(expression.sql(), original.sql())
+        self.assertEqual(expression.selects[1].comments, [" c "])
+        self.assertIsNone(expression.selects[1].type)
+        self.assertNotIn("foo", expression.selects[1].meta)
+
+        for node in expression.walk():
+            for child in node.iter_expressions():
+                self.assertIs(child.parent, node)
+
+        with self.assertRaises(ValueError):
+            with exp.undo_mutations():
+                expression.find(exp.Column).replace(exp.column("z"))
+                raise ValueError
+
+        self.assertEqual(expression.sql(), original.sql())
+
     def test_replace(self):
         expression = parse_one("SELECT a, b FROM x")
         expression.find(exp.Column).replace(parse_one("c"))
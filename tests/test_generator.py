@@ -2,6 +2,7 @@ import unittest
 
 from sqlglot import exp, parse_one
 from sqlglot.expressions import Func
+from sqlglot.generator import Generator
 from sqlglot.parser import Parser
 from sqlglot.tokens import Tokenizer
 
@@ -35,6 +36,64 @@ class TestGenerator(unittest.TestCase):
             "DATE_TRUNC('MONTH', event_date)",
         )
 
+    def test_dispatch(self):
+        class CustomExpression(exp.Expression): ...
+
+        class CustomProperty(exp.Property):
+            arg_types = {"this": True, "value": True}
+
+        class NewGenerator(Generator):
+            TRANSFORMS = {
+                **Generator.TRANSFORMS,
+                exp.Column: lambda self, e: f"col({self.sql(e, 'this')})",
+            }
+
+            def customexpression_sql(self, expression: CustomExpression) -> str:
+                return "CUSTOM"
+
+        self.assertEqual(NewGenerator().generate(CustomExpression()), "CUSTOM")
+        self.assertEqual(NewGenerator().generate(exp.column("a")), "col(a)")
+        self.assertEqual(Generator().generate(exp.column("a")), "a")
+        NewGenerator().generate(CustomProperty(this=exp.var("x"), value=exp.Literal.number(1)))
+        self.assertIs(NewGenerator._DISPATCH[CustomProperty], Generator.property_sql)
+        self.assertIn(CustomExpression, NewGenerator._DISPATCH)
+        self.assertNotIn(CustomExpression, Generator._DISPATCH)
+
+        with self.assertRaises(ValueError):
+            Generator().generate(CustomExpression())
+
+        with self.assertRaises(ValueError):
+            Generator().sql(1)  # type: ignore
+
+    def test_copy_on_write(self):
+        for sql, write, expected in (
+            (
+                "SELECT * FROM t CROSS JOIN UNNEST(arr) AS u(c) QUALIFY ROW_NUMBER() OVER (ORDER BY c) = 1",
+                "spark",
+                "SELECT * FROM (SELECT *, ROW_NUMBER() OVER (ORDER BY c) AS _w FROM t LATERAL VIEW EXPLODE(arr) u AS c) AS _t WHERE _w = 1",
+            ),
+            (
+                "SELECT * FROM (WITH c AS (SELECT 1 AS x) SELECT x FROM c) AS t",
+                "tsql",
+                "WITH c AS (SELECT 1 AS x) SELECT * FROM (SELECT x AS x FROM c) AS t",
+            ),
+            ("SELECT * FROM t WHERE 1", "tsql", "SELECT * FROM t WHERE 1 <> 0"),
+        ):
+            with self.subTest(f"{sql} -> {write}"):
+                expression = parse_one(sql)
+                original = expression.copy()
+
+                self.assertEqual(expression.sql(write, copy_on_write=True), expected)
+                self.assertEqual(expression.sql(write, copy_on_write=True), expected)
+                self.assertEqual(expression, original)
+
+                for node in expression.walk():
+                    for child in node.iter_expressions():
+                        self.assertIs(child.parent, node)
+
+                self.assertEqual(expression.sql(write, copy=False), expected)
+                self.assertNotEqual(expression, original)
+
     def test_identify(self):
         self.assertEqual(parse_one("x").sql(identify=True), '"x"')
         self.assertEqual(parse_one("x").sql(identify=False), "x")
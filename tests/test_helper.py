@@ -1,6 +1,6 @@
 import unittest
 
-from sqlglot.helper import merge_ranges, name_sequence, tsort
+from sqlglot.helper import LRUCache, merge_ranges, name_sequence, tsort
 
 
 class TestHelper(unittest.TestCase):
@@ -46,3 +46,29 @@ class TestHelper(unittest.TestCase):
         self.assertEqual([(0, 1), (2, 3)], merge_ranges([(0, 1), (2, 3)]))
         self.assertEqual([(0, 3)], merge_ranges([(0, 1), (1, 3)]))
         self.assertEqual([(0, 1), (2, 4)], merge_ranges([(2, 3), (0, 1), (3, 4)]))
+
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("c"))
+
+        cache.put("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+
+        info = cache.info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.currsize, 2)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.info().hits, 0)
+
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=0)
@@ -0,0 +1,117 @@
+import unittest
+
+from sqlglot import ParseError, TokenError, parse
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.incremental import IncrementalParser
+
+
+class TestIncremental(unittest.TestCase):
+    def validate(self, script, read=None):
+        self.assertEqual(
+            [
+                (t.token_type, t.text, t.line, t.col, t.start, t.end, t.comments)
+                for t in script.tokens
+            ],
+            [
+                (t.token_type, t.text, t.line, t.col, t.start, t.end, t.comments)
+                for t in Dialect.get_or_raise(read).tokenize(script.sql)
+            ],
+        )
+
+        expected = parse(script.sql, read=read)
+        self.assertEqual(script.expressions, expected)
+
+        for expression, other in zip(script.expressions, expected):
+            if expression:
+                self.assertEqual(
+                    [node.meta for node in expression.walk()],
+                    [node.meta for node in other.walk()],
+                )
+
+    def edit(self, script, old, new, occurrence=1):
+        start = -1
+        for _ in range(occurrence):
+            start = script.sql.index(old, start + 1)
+
+        return script.edit(start, start + len(old), new)
+
+    def test_edits(self):
+        script = IncrementalParser(
+            "SELECT a FROM x;\n-- second\n"
+            "SELECT *\nFROM (SELECT b FROM (SELECT c FROM y) AS y) AS z WHERE d IN (SELECT 1);\n"
+            "/* third */ SELECT e FROM w"
+        )
+        self.validate(script)
+        first, second, third = script.expressions
+        subquery = second.find(type(second))
+
+        self.edit(script, "c FROM y", "c, cc FROM y")
+        self.validate(script)
+        self.assertIs(script.expressions[1], second)
+        self.assertIs(second.find(type(second)), subquery)
+        self.assertIs(script.expressions[2], third)
+
+        self.edit(script, "b FROM", "bb\n\n FROM")
+        self.validate(script)
+        self.assertIs(script.expressions[1], second)
+
+        self.edit(script, "WHERE", "\n  WHERE")
+        self.validate(script)
+        self.assertEqual(script.expressions, [first, second, third])
+
+        self.edit(script, "d IN", "dd IN")
+        self.validate(script)
+        self.assertIsNot(script.expressions[1], second)
+        self.assertIs(script.expressions[0], first)
+        self.assertIs(script.expressions[2], third)
+
+        self.edit(script, "SELECT a FROM x;", "")
+        self.validate(script)
+        self.assertEqual(len(script.expressions), 2)
+
+        self.edit(script, "", "SELECT 2; -- first\n")
+        self.validate(script)
+        self.assertEqual(len(script.expressions), 4)
+
+        self.edit(script, ";\n/*", "; -- x\n/*")
+        self.validate(script)
+
+        self.edit(script, "", "SELECT 0;\n")
+        self.edit(script, "w", "w;")
+        self.validate(script)
+
+        self.edit(script, script.sql, "")
+        self.validate(script)
+        self.assertEqual(script.expressions, [None])
+
+    def test_errors(self):
+        script = IncrementalParser("SELECT a FROM x; SELECT b FROM y; SELECT c FROM z")
+        first, _, third = script.expressions
+
+        with self.assertRaises(ParseError):
+            self.edit(script, "SELECT b", "SELECT b +")
+
+        self.assertEqual(script.sql, "SELECT a FROM x; SELECT b + FROM y; SELECT c FROM z")
+        self.assertEqual(script.expressions, [first, None, third])
+
+        with self.assertRaises(ParseError):
+            self.edit(script, "c", "cc")
+
+        self.edit(script, "b +", "b + 1")
+        self.validate(script)
+
+        with self.assertRaises(TokenError):
+            self.edit(script, "b + 1", "'b + 1")
+
+        self.assertEqual(script.expressions, [first])
+
+        self.edit(script, "'b", "b")
+        self.validate(script)
+
+    def test_dialect(self):
+        script = IncrementalParser("SELECT `a` FROM (SELECT 1 AS `a`) AS x", read="mysql")
+        self.edit(script, "1", "2")
+        self.validate(script, read="mysql")
+        self.assertEqual(
+            script.expressions[0].sql("mysql"), "SELECT `a` FROM (SELECT 2 AS `a`) AS x"
+        )
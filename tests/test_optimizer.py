@@ -1,5 +1,6 @@
 import unittest
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
 from functools import partial
 from unittest.mock import patch
 
@@ -11,7 +12,11 @@ from sqlglot import exp, optimizer, parse_one
 from sqlglot.errors import ANSI_RESET, ANSI_UNDERLINE, OptimizeError, SchemaError
 from sqlglot.optimizer.annotate_types import annotate_types
 from sqlglot.optimizer.normalize import normalization_distance
-from sqlglot.optimizer.scope import build_scope, traverse_scope, walk_in_scope
+from sqlglot.optimizer.statistics import Statistics, TableStats
+from sqlglot.optimizer.scope import build_scope, cached_scopes, traverse_scope, walk_in_scope
+from sqlglot.optimizer.trace import Profiler, Tracer
+from sqlglot.helper import Budget, LRUCache
+from sqlglot.optimizer.optimizer import fingerprint
 from sqlglot.schema import MappingSchema
 from tests.helpers import (
     TPCDS_SCHEMA,
@@ -322,6 +327,38 @@ class TestOptimizer(unittest.TestCase):
 
         self.check_file("normalize", normalize, schema=self.schema)
 
+    def test_normalize_factor(self):
+        for sql, expected, dnf in (
+            ("(x AND y) OR (x AND z)", "x AND (y OR z)", False),
+            ("(x OR y) AND (x OR z)", "x OR (y AND z)", True),
+            ("(x AND y) OR (x AND z AND w)", "x AND (y OR z) AND (y OR w)", False),
+            ("(x AND y) OR (z AND w)", "(x OR z) AND (x OR w) AND (y OR z) AND (y OR w)", False),
+            ("(x AND y) OR (z AND w)", "(x AND y) OR (z AND w)", True),
+            ("(x AND y AND y) OR x OR x", "x", False),
+            ("(x AND y) OR (x AND y AND z)", "x AND y", False),
+            ("x AND ((a AND b) OR (a AND c))", "x AND a AND (b OR c)", False),
+            (
+                "SELECT * FROM t WHERE (t.a = 1 AND t.b = 1) OR (t.a = 1 AND t.b = 2)",
+                "SELECT * FROM t WHERE t.a = 1 AND (t.b = 1 OR t.b = 2)",
+                False,
+            ),
+        ):
+            with self.subTest(sql):
+                self.assertEqual(
+                    optimizer.normalize.normalize(parse_one(sql), dnf=dnf, factor=True).sql(),
+                    expected,
+                )
+
+        # The common factors are pulled out, even if the rest is too far from the normal form
+        condition = " OR ".join(f"(x = 1 AND a = {i} AND b = {i})" for i in range(100))
+        normalized = optimizer.normalize.normalize(parse_one(condition), factor=True)
+        self.assertTrue(normalized.sql().startswith("x = 1 AND ((a = 0 AND b = 0) OR (a = 1"))
+        self.assertEqual(normalized.sql().count("x = 1"), 1)
+
+        # Nothing is rewritten if there's nothing to factor out
+        condition = parse_one(" OR ".join(f"a = {i} AND b = {i}" for i in range(100)))
+        self.assertIs(optimizer.normalize.normalize(condition, factor=True), condition)
+
     @patch("sqlglot.generator.logger")
     def test_qualify_columns(self, logger):
         self.assertEqual(
@@ -781,6 +818,29 @@ SELECT :with_,WITH :expressions,CTE :this,UNION :this,SELECT :expressions,1,:exp
             optimizer.simplify.simplify(parse_one(sql)).sql(pretty=True),
         )
 
+    def test_simplify_fixpoint(self):
+        visited = []
+        rewrite_between = optimizer.simplify.Simplifier.rewrite_between
+
+        def _rewrite_between(self, expression):
+            visited.append(expression.sql())
+            return rewrite_between(self, expression)
+
+        with patch.object(optimizer.simplify.Simplifier, "rewrite_between", _rewrite_between):
+            expression = parse_one("a = 1 + 1 OR (b = 1 AND c = 2) OR (d = 3 AND NOT NOT e = 4)")
+            self.assertEqual(
+                simplify(expression).sql(), "a = 2 OR (b = 1 AND c = 2) OR (d = 3 AND e = 4)"
+            )
+
+        # The subtrees that were left untouched by a pass aren't visited by the following ones
+        self.assertEqual(visited.count("(b = 1 AND c = 2)"), 1)
+        self.assertEqual(visited.count("c = 2"), 1)
+        self.assertEqual(visited.count("a = 2"), 1)
+
+        # Long chains of connectors whose operands can't be simplified together take linear time
+        expression = parse_one(" OR ".join(f"a = {i} AND b = {i}" for i in range(2000)))
+        self.assertEqual(len(list(simplify(expression).flatten())), 2000)
+
     def test_unnest_subqueries(self):
         self.check_file("unnest_subqueries", optimizer.unnest_subqueries.unnest_subqueries)
 
@@ -854,6 +914,104 @@ SELECT :with_,WITH :expressions,CTE :this,UNION :this,SELECT :expressions,1,:exp
             optimizer.optimize_joins.optimize_joins,
         )
 
+    def test_optimize_joins_stats(self):
+        stats = Statistics(
+            {
+                "db.fact": TableStats(1_000_000, {"d1": 100, "d2": 1000}),
+                "db.d1": TableStats(100),
+                "db.d2": TableStats(1000, {"c": 10}),
+                "db.big": TableStats(10_000_000),
+            }
+        )
+
+        def reorder(sql, **kwargs):
+            return optimizer.optimize_joins.optimize_joins(parse_one(sql), stats=stats, **kwargs)
+
+        # The filtered dimension is joined first, and cross products are avoided
+        self.assertEqual(
+            reorder(
+                "SELECT f.a FROM d1 JOIN fact AS f ON f.d1 = d1.id JOIN d2 ON f.d2 = d2.id AND d2.c = 1"
+            ).sql(),
+            "SELECT f.a FROM fact AS f JOIN d2 ON f.d2 = d2.id AND d2.c = 1 JOIN d1 ON f.d1 = d1.id",
+        )
+        self.assertEqual(
+            reorder(
+                "SELECT f.a FROM fact AS f JOIN d1 ON f.d1 = d1.id JOIN d2 ON f.d2 = d2.id WHERE d2.c = 1"
+            ).sql(),
+            "SELECT f.a FROM fact AS f JOIN d2 ON f.d2 = d2.id JOIN d1 ON f.d1 = d1.id WHERE d2.c = 1",
+        )
+
+        # Derived tables that filter a single table are estimated from its statistics
+        self.assertEqual(
+            reorder(
+                "SELECT f.a FROM big JOIN fact AS f ON f.a = big.a "
+                "JOIN (SELECT d2.id AS id FROM db.d2 AS d2 WHERE d2.c = 1) AS d ON f.d2 = d.id"
+            ).sql(),
+            "SELECT f.a FROM fact AS f JOIN (SELECT d2.id AS id FROM db.d2 AS d2 WHERE d2.c = 1) AS d "
+            "ON f.d2 = d.id JOIN big ON f.a = big.a",
+        )
+
+        # Queries with outer joins, stars or unqualified columns keep their order
+        for sql in (
+            "SELECT f.a FROM big JOIN fact AS f ON f.a = big.a LEFT JOIN d1 ON f.d1 = d1.id",
+            "SELECT * FROM big JOIN fact AS f ON f.a = big.a JOIN d1 ON f.d1 = d1.id",
+            "SELECT f.a FROM big JOIN fact AS f ON a = big.a JOIN d1 ON f.d1 = d1.id",
+        ):
+            with self.subTest(sql):
+                self.assertEqual(reorder(sql).sql(), sql)
+
+        # Joins that get no condition are explicit cross joins, which keeps the tables before them
+        # visible to the conditions of the joins after them
+        self.assertEqual(
+            optimizer.optimize_joins.reorder_joins(
+                parse_one("SELECT x.a FROM x JOIN y ON x.a = y.a CROSS JOIN z WHERE z.b = x.b"),
+                stats=Statistics(
+                    {"x": TableStats(10), "y": TableStats(1000, {"a": 10}), "z": TableStats(10)}
+                ),
+            ).sql(),
+            "SELECT x.a FROM x CROSS JOIN z JOIN y ON x.a = y.a WHERE z.b = x.b",
+        )
+
+        # Large joins are ordered greedily, with the same result in this case
+        sql = (
+            "SELECT f.a FROM big JOIN fact AS f ON f.a = big.a JOIN d1 ON f.d1 = d1.id AND d1.b = 1"
+        )
+        expected = (
+            "SELECT f.a FROM fact AS f JOIN d1 ON f.d1 = d1.id AND d1.b = 1 JOIN big ON f.a = big.a"
+        )
+        self.assertEqual(reorder(sql).sql(), expected)
+        with patch("sqlglot.optimizer.optimize_joins.DP_MAX_TABLES", 2):
+            self.assertEqual(reorder(sql).sql(), expected)
+
+        tables = [f"t{i}" for i in range(12)]
+        chain = Statistics({table: TableStats(10 ** (i % 4 + 1)) for i, table in enumerate(tables)})
+        sql = f"SELECT t0.a FROM {tables[0]} " + " ".join(
+            f"JOIN {b} ON {a}.a = {b}.a" for a, b in zip(tables, tables[1:])
+        )
+        optimized = optimizer.optimize_joins.optimize_joins(parse_one(sql), stats=chain)
+        joined = {optimized.args["from_"].name}
+        for join in optimized.args["joins"]:
+            self.assertTrue(exp.column_table_names(join.args["on"]) <= joined | {join.this.name})
+            joined.add(join.this.name)
+        self.assertEqual(joined, set(tables))
+
+        # The statistics are passed through optimize
+        self.assertEqual(
+            optimizer.optimize(
+                "SELECT f.a FROM big JOIN fact AS f ON f.a = big.a JOIN d1 ON f.d1 = d1.id WHERE d1.b = 1",
+                schema={
+                    "db": {
+                        t: {"a": "INT", "b": "INT", "id": "INT", "d1": "INT"}
+                        for t in ("big", "fact", "d1")
+                    }
+                },
+                db="db",
+                stats=stats,
+            ).sql(),
+            'SELECT "f"."a" AS "a" FROM "db"."fact" AS "f" JOIN "db"."d1" AS "d1" '
+            'ON "d1"."b" = 1 AND "d1"."id" = "f"."d1" JOIN "db"."big" AS "big" ON "big"."a" = "f"."a"',
+        )
+
     def test_eliminate_joins(self):
         self.check_file(
             "eliminate_joins",
@@ -1048,6 +1206,251 @@ SELECT :with_,WITH :expressions,CTE :this,UNION :this,SELECT :expressions,1,:exp
             level="warning",
         )
 
+    def test_cached_scopes(self):
+        sql = """
+        WITH cte AS (SELECT a FROM x)
+        SELECT * FROM cte, (SELECT b FROM y) AS z WHERE cte.a IN (SELECT c FROM w)
+        """
+        expression = parse_one(sql)
+
+        with cached_scopes() as cache:
+            scopes = traverse_scope(expression)
+            self.assertEqual(len(scopes), 4)
+            self.assertEqual(traverse_scope(expression), scopes)
+            self.assertIs(build_scope(expression), scopes[-1])
+
+            # Only the scope of the derived table and its ancestor are rebuilt
+            derived_table = expression.args["joins"][0].this.this
+            derived_table.select("d", copy=False)
+            rebuilt = traverse_scope(expression)
+
+            self.assertIs(rebuilt[0], scopes[0])
+            self.assertIs(rebuilt[2], scopes[2])
+            self.assertIsNot(rebuilt[1], scopes[1])
+            self.assertIsNot(rebuilt[-1], scopes[-1])
+            self.assertIs(rebuilt[0].parent, rebuilt[-1])
+            self.assertIs(rebuilt[-1].sources["cte"], rebuilt[0])
+            self.assertEqual(rebuilt[1].expression.sql(), "SELECT b, d FROM y")
+
+            # Changing a scope, as opposed to the tree, also invalidates it
+            rebuilt[2].rename_source("w", "u")
+            final = traverse_scope(expression)
+            self.assertIsNot(final[2], rebuilt[2])
+            self.assertEqual(list(final[2].sources), ["cte", "w"])
+
+            # Other trees are built from scratch without affecting the cache
+            self.assertEqual(len(traverse_scope(parse_one("SELECT 1"))), 1)
+            self.assertEqual(cache.builds, 4)
+
+            # Nested blocks are no-ops
+            with cached_scopes() as nested:
+                self.assertIsNone(nested)
+
+        for scope, expected in zip(final, traverse_scope(expression)):
+            self.assertIs(scope.expression, expected.expression)
+            self.assertEqual(list(scope.sources), list(expected.sources))
+
+        # The subquery's scope can't be reused as is once its columns are qualified and the UNNEST
+        # that encloses it is aliased, otherwise its columns would be qualified with that alias
+        sql = """
+        WITH cte AS (SELECT 1 AS col)
+        SELECT * FROM cte
+        LEFT JOIN UNNEST((SELECT ARRAY_AGG(DISTINCT x) AS agg FROM UNNEST([1]) AS x WHERE col = 1))
+        """
+        with patch("sqlglot.optimizer.optimizer.cached_scopes", nullcontext):
+            expected = optimizer.optimize(sql).sql()
+
+        self.assertEqual(optimizer.optimize(sql).sql(), expected)
+        self.assertNotIn('"_0"."x"', expected)
+
+        # Other rules may change the tree without the cache noticing, e.g. by setting args directly
+        where = exp.Where(
+            this=parse_one("y.a IN (SELECT z.a FROM (SELECT x.a AS a, x.b AS b FROM x AS x) AS z)")
+        )
+
+        def add_filter(expression):
+            where.parent = expression
+            expression.args["where"] = where
+            return expression
+
+        sql = "SELECT y.a FROM (SELECT x.a, x.b FROM x) AS y"
+        rules = (
+            optimizer.qualify.qualify,
+            add_filter,
+            optimizer.pushdown_projections.pushdown_projections,
+        )
+        self.assertEqual(
+            optimizer.optimize(sql, schema={"x": {"a": "INT", "b": "INT"}}, rules=rules).sql(),
+            "SELECT y.a AS a FROM (SELECT x.a AS a FROM x AS x) AS y "
+            "WHERE y.a IN (SELECT z.a FROM (SELECT x.a AS a FROM x AS x) AS z)",
+        )
+
+        with patch("sqlglot.optimizer.optimizer.cached_scopes") as cached:
+            optimizer.optimize("SELECT 1", reuse_scopes=False)
+            cached.assert_not_called()
+
+    def test_optimize_cache(self):
+        schema = MappingSchema({"x": {"a": "INT", "b": "TEXT", "c": "DOUBLE"}})
+        cache = LRUCache()
+
+        def optimize(sql, **kwargs):
+            expected = optimizer.optimize(sql, schema=schema, **kwargs)
+            optimized = optimizer.optimize(sql, schema=schema, cache=cache, **kwargs)
+            self.assertEqual(optimized.sql(), expected.sql())
+            self.assertEqual(
+                [node.type for node in optimized.walk()], [node.type for node in expected.walk()]
+            )
+            return optimized
+
+        sql = "SELECT a, c * {} AS d FROM x WHERE b = '{}' AND a > {} ORDER BY 1"
+        optimize(sql.format("1.5", "foo", 5))
+        self.assertEqual(cache.info().misses, 1)
+
+        expression = parse_one(sql.format("2.5", "bar", 10))
+        optimize(expression)
+        optimize(sql.format("3.5", "baz", 15))
+        self.assertEqual(cache.info().hits, 2)
+        self.assertEqual(expression.sql(), sql.format("2.5", "bar", 10))
+
+        # The kinds of the literals, which literals are equal and positional references matter
+        for other in (
+            sql.format("1", "foo", 5),
+            sql.format("1.5", "foo", "'5'"),
+            sql.format("1.5", "foo", "1.5"),
+            sql.format("1.5", "foo", 5).replace("ORDER BY 1", "ORDER BY 2"),
+        ):
+            self.assertNotEqual(fingerprint(parse_one(other)), fingerprint(parse_one(sql)))
+            optimize(other)
+        self.assertEqual(cache.info().hits, 2)
+
+        # Results that depend on the literals' values aren't reused for other values
+        optimize("SELECT a FROM x WHERE a = 1 AND a = 1")
+        optimize("SELECT a FROM x WHERE a = 2 AND a = 2")
+
+        # A hit isn't simplified further, even if the new values would allow it
+        optimize("SELECT a FROM x WHERE a > 1 AND a < 2")
+        self.assertEqual(
+            optimizer.optimize(
+                "SELECT a FROM x WHERE a > 2 AND a < 1", schema=schema, cache=cache
+            ).sql(),
+            'SELECT "x"."a" AS "a" FROM "x" AS "x" WHERE "x"."a" < 1 AND "x"."a" > 2',
+        )
+        optimize("SELECT a FROM x WHERE a > 1 + 1")
+        optimize("SELECT a FROM x WHERE a > 2 + 2")
+
+        # The date part of EXTRACT determines the type of its result
+        year, date = (f"SELECT EXTRACT('{part}' FROM x) AS p FROM t" for part in ("YEAR", "DATE"))
+        self.assertNotEqual(fingerprint(parse_one(year)), fingerprint(parse_one(date)))
+        for query, expected in ((year, "INT"), (date, "DATE")):
+            optimized = optimizer.optimize(query, schema={"t": {"x": "TIMESTAMP"}}, cache=cache)
+            self.assertEqual(optimized.selects[0].type.sql(), expected)
+
+        # So does everything else the result depends on
+        misses = cache.info().misses
+        schema.add_table("y", {"a": "INT"})
+        optimize(sql.format("1.5", "foo", 5))
+        optimize(sql.format("1.5", "foo", 5), rules=optimizer.RULES[:-1])
+        optimize(sql.format("1.5", "foo", 5), dialect="duckdb")
+        self.assertEqual(cache.info().misses, misses + 3)
+
+    def test_tracer(self):
+        traces = []
+        tracer = Tracer(traces.append, memory=True)
+        sql = "SELECT a FROM (SELECT a, b FROM x) AS y WHERE a > 1"
+        optimized = optimizer.optimize(sql, schema={"x": {"a": "INT", "b": "INT"}}, tracer=tracer)
+
+        names = [trace.name for trace in traces]
+        self.assertEqual(names[-1], "optimize")
+        self.assertEqual(
+            [name for name in names if name.startswith("optimize.qualify")],
+            [
+                "optimize.qualify.normalize_identifiers",
+                "optimize.qualify.qualify_tables",
+                "optimize.qualify.isolate_table_selects",
+                "optimize.qualify.qualify_columns",
+                "optimize.qualify.validate_qualify_columns",
+                "optimize.qualify",
+            ],
+        )
+        self.assertEqual(
+            [name for name in names if name.count(".") == 1],
+            [f"optimize.{rule.__name__}" for rule in optimizer.RULES],
+        )
+
+        merge_subqueries = traces[names.index("optimize.merge_subqueries")]
+        self.assertLess(merge_subqueries.nodes_after, merge_subqueries.nodes_before)
+        self.assertGreater(merge_subqueries.scope_builds, 0)
+        self.assertIs(traces[-1].expression, optimized)
+        self.assertEqual(traces[-1].nodes_before, len(list(parse_one(sql).walk())))
+        self.assertEqual(traces[-1].nodes_after, len(list(optimized.walk())))
+        self.assertGreaterEqual(
+            traces[-1].memory_peak, max(trace.memory_peak for trace in traces[:-1])
+        )
+
+        # Standalone calls trace their steps as well, but they don't share scopes
+        traces.clear()
+        optimizer.qualify.qualify(parse_one(sql), tracer=Tracer(traces.append))
+        self.assertEqual(traces[0].name, "normalize_identifiers")
+        self.assertEqual(traces[-1].name, "validate_qualify_columns")
+        self.assertIsNone(traces[0].scope_builds)
+        self.assertIsNone(traces[0].memory_peak)
+
+        profiler = Profiler(slowest=1)
+        for sql in ("SELECT a FROM x", "SELECT a FROM x WHERE a IN (SELECT b FROM y)"):
+            optimizer.optimize(sql, tracer=profiler)
+
+        self.assertEqual(profiler.stats["optimize"].calls, 2)
+        self.assertEqual(profiler.stats["optimize.qualify.qualify_columns"].calls, 2)
+        self.assertEqual(len(profiler.slowest), 1)
+        self.assertEqual(profiler.slowest[0].seconds, profiler.stats["optimize"].max_seconds)
+        self.assertTrue(profiler.report().startswith("rule"))
+        self.assertIn("optimize.simplify", profiler.report())
+
+    def test_budget(self):
+        schema = {"x": {"a": "INT", "b": "INT"}}
+        sql = "SELECT a FROM (SELECT a FROM x WHERE (a = 1 AND b = 2) OR (a = 3 AND b = 4)) AS y"
+
+        self.assertEqual(
+            optimizer.optimize(sql, schema=schema, budget=Budget(seconds=60)).sql(),
+            optimizer.optimize(sql, schema=schema).sql(),
+        )
+        self.assertEqual(
+            optimizer.optimize(sql, schema=schema, budget=Budget(operations=0)).sql(),
+            'WITH "y" AS (SELECT "x"."a" AS "a" FROM "x" AS "x" WHERE ("x"."a" = 1 AND "x"."b" = 2)'
+            ' OR ("x"."a" = 3 AND "x"."b" = 4)) SELECT "y"."a" AS "a" FROM "y" AS "y"',
+        )
+
+        # A connector whose normalization runs out of budget is restored
+        condition = "(a AND b) OR (c AND d)"
+        budget = Budget()
+        normalized = optimizer.normalize.normalize(parse_one(condition), budget=budget).sql()
+        self.assertEqual(normalized, "(a OR c) AND (b OR c) AND (a OR d) AND (b OR d)")
+
+        for operations, expected in ((budget.spent - 1, condition), (budget.spent, normalized)):
+            self.assertEqual(
+                optimizer.normalize.normalize(
+                    parse_one(condition), budget=Budget(operations=operations)
+                ).sql(),
+                expected,
+            )
+
+        # The operands that weren't compared yet are left as they are
+        simplify = optimizer.simplify.simplify
+        condition = "x = 1 OR y = 2 OR x = 1 OR TRUE"
+        self.assertEqual(
+            simplify(parse_one(condition), budget=Budget(operations=0)).sql(), condition
+        )
+        self.assertEqual(
+            simplify(parse_one(condition), budget=Budget(operations=3)).sql(),
+            "TRUE OR x = 1 OR y = 2",
+        )
+        self.assertEqual(simplify(parse_one(condition), budget=Budget()).sql(), "TRUE")
+
+        # Budgeted results aren't cached
+        cache = LRUCache()
+        optimizer.optimize(sql, schema=schema, cache=cache, budget=Budget(operations=0))
+        self.assertEqual(len(cache), 0)
+
     def test_annotate_types(self):
         for i, (meta, sql, expected) in enumerate(
             load_sql_fixture_pairs("optimizer/annotate_types.sql"), start=1
@@ -1,9 +1,11 @@
+import io
 import time
 import unittest
 from unittest.mock import patch
 
-from sqlglot import Parser, exp, parse, parse_one
-from sqlglot.errors import ErrorLevel, ParseError
+from sqlglot import Dialect, Parser, TokenType, exp, parse, parse_iter, parse_one
+from sqlglot.errors import ErrorLevel, ParseError, TokenError
+from sqlglot.helper import LRUCache
 from sqlglot.parser import logger as parser_logger
 from tests.helpers import assert_logger_contains
 
@@ -1047,3 +1049,109 @@ class TestParser(unittest.TestCase):
         self.assertIsInstance(
             parse_one("ALL PRIVILEGES", into=exp.GrantPrivilege), exp.GrantPrivilege
         )
+
+    def test_parse_cache(self):
+        # Loading a dialect module may parse SQL templates, so we do it before enabling the cache
+        Dialect.get_or_raise("duckdb")
+
+        cache = LRUCache(maxsize=2)
+        Dialect.PARSE_CACHE = cache
+
+        try:
+            first = parse_one("SELECT a FROM b")
+            first.set("limit", exp.Limit(expression=exp.Literal.number(1)))
+
+            hits = cache.info().hits
+            second = parse_one("SELECT a FROM b")
+            self.assertEqual(second.sql(), "SELECT a FROM b")
+            self.assertIsNot(first, second)
+            self.assertEqual(cache.info().hits, hits + 1)
+
+            misses = cache.info().misses
+            parse_one("SELECT a FROM b", read="duckdb")
+            parse_one("SELECT a FROM b", read="duckdb, normalization_strategy = uppercase")
+            parse_one("SELECT a FROM b", error_level=ErrorLevel.RAISE)
+            self.assertEqual(cache.info().misses, misses + 3)
+            self.assertEqual(len(cache), 2)
+            self.assertGreater(cache.info().evictions, 0)
+
+            for _ in range(2):
+                self.assertIsInstance(
+                    parse_one("ROLE blah", into=exp.GrantPrincipal), exp.GrantPrincipal
+                )
+
+            parse_one("SELECT (1", error_level=ErrorLevel.IGNORE)
+            self.assertNotIn("SELECT (1", [key[-1] for key in cache._data])
+        finally:
+            Dialect.PARSE_CACHE = None
+
+    def test_parse_iter(self):
+        sql = "SELECT 'a;b' AS x; /* c; */ SELECT 2;\nSELECT\n3 -- d;\n; INSERT INTO t VALUES (1)"
+        expected = [e.sql() for e in parse(sql)]
+
+        for chunk_size in (1, 5, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    [e.sql() for e in parse_iter(sql, chunk_size=chunk_size)], expected
+                )
+                self.assertEqual(
+                    [e.sql() for e in parse_iter(io.StringIO(sql), chunk_size=chunk_size)],
+                    expected,
+                )
+
+        expressions = parse_iter("SELECT 1;\nSELECT 2;\nSELECT (", chunk_size=4)
+        self.assertEqual(next(expressions).sql(), "SELECT 1")
+        self.assertEqual(next(expressions).sql(), "SELECT 2")
+
+        with self.assertRaises(ParseError) as ctx:
+            next(expressions)
+        self.assertEqual(ctx.exception.errors[0]["line"], 3)
+
+        with self.assertRaises(TokenError):
+            list(parse_iter("SELECT 1; SELECT 'a", chunk_size=4))
+
+        self.assertEqual(list(parse_iter("")), [])
+        self.assertEqual(
+            [e.sql("duckdb") for e in parse_iter("SELECT `a`", read="mysql")], ['SELECT "a"']
+        )
+
+        def positions(expressions):
+            return [(node.sql(), node.meta) for e in expressions for node in e.walk() if node._meta]
+
+        sql = "SELECT a FROM t; SELECT bb FROM u;\nSELECT c,\n  d FROM v; SELECT e FROM w"
+        expected = positions(parse(sql))
+
+        # The script is either read at once or cut mid-statement by the chunks
+        for chunk_size in (1, 3, 16, 1000):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(positions(parse_iter(sql, chunk_size=chunk_size)), expected)
+
+        bb = [meta for name, meta in expected if name == "bb"][0]
+        self.assertEqual((bb["line"], bb["col"], bb["start"], bb["end"]), (1, 26, 24, 25))
+
+        # Long statements and unterminated strings aren't re-tokenized on every chunk
+        tokenize = Dialect().tokenizer_class.tokenize
+        tokenized = []
+
+        def _tokenize(self, sql):
+            tokenized.append(len(sql))
+            return tokenize(self, sql)
+
+        for sql in ("SELECT " + ", ".join(["a"] * 5000), "SELECT '" + "a" * 10000 + "'"):
+            tokenized.clear()
+            with patch("sqlglot.tokens.Tokenizer.tokenize", _tokenize):
+                self.assertEqual(len(list(parse_iter(sql, chunk_size=10))), 1)
+            self.assertLess(sum(tokenized), 5 * len(sql))
+
+    def test_parse_with_semicolons(self):
+        sql = "SELECT 1; /* c */ ; SELECT 2;"
+        tokens = Dialect().tokenize(sql)
+        semicolons = [
+            i for i, token in enumerate(tokens) if token.token_type == TokenType.SEMICOLON
+        ]
+
+        self.assertEqual(
+            Parser().parse(tokens, sql, semicolons),
+            Parser().parse(tokens, sql),
+        )
+        self.assertEqual(Parser().parse([], "", []), [None])
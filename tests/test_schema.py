@@ -1,8 +1,13 @@
+import threading
+import time
 import unittest
+from unittest import mock
 
 from sqlglot import exp, parse_one, to_table
 from sqlglot.errors import SchemaError
-from sqlglot.schema import MappingSchema, ensure_schema
+from sqlglot.helper import LRUCache
+from sqlglot.optimizer import optimize
+from sqlglot.schema import IndexedSchema, LazySchema, MappingSchema, ensure_schema
 
 
 class TestSchema(unittest.TestCase):
@@ -340,3 +345,202 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(found, {"c": "int"})
         found = schema.find(exp.to_table("x"), ensure_data_types=True)
         self.assertEqual(found, {"c": exp.DataType.build("int")})
+
+    def test_fingerprint(self):
+        schema = MappingSchema({"x": {"c": "int"}})
+        fingerprint = schema.fingerprint()
+        self.assertEqual(schema.version, 0)
+        self.assertEqual(MappingSchema({"X": {"C": "int"}}).fingerprint(), fingerprint)
+        self.assertNotEqual(MappingSchema({"x": {"c": "text"}}).fingerprint(), fingerprint)
+        self.assertNotEqual(
+            MappingSchema({"x": {"c": "int"}}, dialect="bigquery").fingerprint(), fingerprint
+        )
+
+        schema.add_table("x")
+        self.assertEqual(schema.version, 0)
+
+        schema.add_table("y", {"d": "int"})
+        self.assertEqual(schema.version, 1)
+        self.assertNotEqual(schema.fingerprint(), fingerprint)
+
+    def test_indexed_schema(self):
+        mapping = {
+            "c1": {
+                "d1": {"x": {"a": "int", "B": "text"}, "Y": {'"C"': "int", "Select": "text"}},
+                "d2": {"x": {"e": "array<int>"}},
+            },
+            "c2": {"d1": {"z": {"f": "int"}}},
+        }
+
+        for dialect in (None, "snowflake", "bigquery"):
+            with self.subTest(dialect):
+                expected = MappingSchema(mapping, dialect=dialect)
+                schema = IndexedSchema(mapping, dialect=dialect)
+
+                for table, column in (
+                    ("c1.d1.x", "b"),
+                    ("d1.y", '"C"'),
+                    ("y", "select"),
+                    ("z", "F"),
+                    ("d2.x", "e"),
+                    ("c2.d1.x", "a"),
+                    ("w", "a"),
+                ):
+                    for method in ("column_names", "get_column_type", "has_column"):
+                        args = (table,) if method == "column_names" else (table, column)
+                        self.assertEqual(
+                            getattr(schema, method)(*args), getattr(expected, method)(*args)
+                        )
+
+                with self.assertRaisesRegex(
+                    SchemaError, "(?i)Ambiguous mapping for x: d1.c1, d2.c1"
+                ):
+                    schema.column_names("x")
+                self.assertIsNone(schema.find(to_table("x"), raise_on_missing=False))
+
+                self.assertEqual(
+                    schema.find(to_table("c1.d2.x"), ensure_data_types=True),
+                    expected.find(to_table("c1.d2.x"), ensure_data_types=True),
+                )
+                self.assertEqual(schema.supported_table_args, ("this", "db", "catalog"))
+                self.assertEqual(schema.mapping, expected.mapping)
+
+        # Tables whose names normalize to the same path are merged
+        mapping = {"Foo": {"a": "int", "C": "int"}, "foo": {"b": "text", "c": "text"}}
+        for dialect in (None, "snowflake"):
+            with self.subTest(dialect):
+                expected = MappingSchema(mapping, dialect=dialect)
+                schema = IndexedSchema(mapping, dialect=dialect)
+                self.assertEqual(len(schema.column_names("foo")), 3)
+                self.assertEqual(schema.column_names("foo"), expected.column_names("foo"))
+                self.assertEqual(
+                    schema.get_column_type("foo", "c"), expected.get_column_type("foo", "c")
+                )
+                self.assertEqual(schema.mapping, expected.mapping)
+
+        # Equal types are parsed once
+        schema = IndexedSchema({"x": {"a": "int", "b": "int"}, "y": {"c": "int"}})
+        self.assertIs(schema.get_column_type("x", "a"), schema.get_column_type("y", "c"))
+
+        # The fingerprint doesn't depend on which tables have been accessed
+        fingerprint = schema.fingerprint()
+        schema.column_names("x")
+        self.assertEqual(
+            IndexedSchema({"y": {"c": "int"}, "x": {"a": "int", "b": "int"}}).fingerprint(),
+            fingerprint,
+        )
+        self.assertEqual(schema.fingerprint(), fingerprint)
+
+        schema.add_table("z", {"D": "text"})
+        self.assertEqual(schema.version, 1)
+        self.assertNotEqual(schema.fingerprint(), fingerprint)
+        self.assertEqual(schema.column_names("z"), ["d"])
+        self.assertEqual(schema.copy().column_names("z"), ["d"])
+
+        with self.assertRaises(SchemaError):
+            schema.add_table("a.b", {"c": "int"})
+        with self.assertRaises(SchemaError):
+            IndexedSchema({"x": {}})
+
+        self.assertTrue(IndexedSchema().empty)
+        self.assertEqual(IndexedSchema().column_names("x"), [])
+
+    def test_lazy_schema(self):
+        catalog = {
+            ("db", "x"): {"A": "int", "b": "text"},
+            ("db", "y"): {"a": "int", "c": "double"},
+        }
+        calls = []
+
+        def fetch(paths):
+            calls.append(paths)
+            return {path: catalog[path] for path in paths if path in catalog}
+
+        schema = LazySchema(fetch)
+        self.assertFalse(schema.empty)
+
+        sql = "WITH z AS (SELECT * FROM x) SELECT * FROM z JOIN y USING (a) WHERE b = 'b'"
+        expected = optimize(
+            sql,
+            schema=MappingSchema({"db": {"x": catalog[("db", "x")], "y": catalog[("db", "y")]}}),
+            db="db",
+        )
+        self.assertEqual(optimize(sql, schema=schema, db="db"), expected)
+        self.assertEqual(calls, [[("db", "x"), ("db", "y")]])
+
+        self.assertEqual(schema.column_names("db.X"), ["a", "b"])
+        self.assertEqual(schema.get_column_type("db.x", "a").sql(), "INT")
+        self.assertTrue(schema.has_column("db.y", exp.column("C")))
+        self.assertEqual(len(calls), 1)
+
+        # Missing tables are cached as well
+        self.assertEqual(schema.column_names("db.w"), [])
+        self.assertEqual(schema.get_column_type("db.w", "a").sql(), "UNKNOWN")
+        self.assertFalse(schema.has_column("db.w", "a"))
+        self.assertEqual(calls[1:], [[("db", "w")]])
+
+        schema.add_table("db.v", {"d": "int"})
+        schema.prefetch(["db.v", "db.x", "v"])
+        self.assertEqual(schema.column_names("db.v"), ["d"])
+        self.assertEqual(calls[2:], [[("v",)]])
+
+        # The least recently used tables are evicted and expired tables are fetched again
+        calls.clear()
+        with mock.patch("sqlglot.schema.time.monotonic", return_value=0):
+            schema = LazySchema(fetch, maxsize=1, ttl=10)
+            schema.prefetch(["db.x", "db.y"])
+            schema.column_names("db.y")
+            schema.column_names("db.x")
+
+        with mock.patch("sqlglot.schema.time.monotonic", return_value=20):
+            schema.column_names("db.x")
+
+        self.assertEqual(calls, [[("db", "x"), ("db", "y")], [("db", "x")], [("db", "x")]])
+        self.assertEqual(schema.cache_info().evictions, 2)
+
+        # Lookups wait for the tables that are fetched in the background
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_fetch(paths):
+            started.set()
+            release.wait(5)
+            return fetch(paths)
+
+        calls.clear()
+        schema = LazySchema(slow_fetch)
+        future = schema.prefetch(["db.x"], wait=False)
+        started.wait(5)
+        lookup = threading.Thread(target=lambda: calls.append(schema.column_names("db.x")))
+        lookup.start()
+        time.sleep(0.01)
+        release.set()
+        lookup.join(5)
+        self.assertEqual(future.result(), {("db", "x"): {"a": "int", "b": "text"}})
+        self.assertEqual(calls, [[("db", "x")], ["a", "b"]])
+
+        # Errors are raised by the lookups and the tables are fetched again afterwards
+        def failing_fetch(paths):
+            calls.append(paths)
+            raise ValueError("unavailable")
+
+        calls.clear()
+        schema = LazySchema(failing_fetch)
+        with self.assertRaises(ValueError):
+            schema.column_names("x")
+        with self.assertRaises(ValueError):
+            schema.prefetch(["x"])
+        self.assertEqual(calls, [[("x",)], [("x",)]])
+
+        # Optimized queries aren't cached, since the tables may change when they're fetched again
+        cache = LRUCache()
+        with mock.patch("sqlglot.schema.time.monotonic", return_value=0):
+            schema = LazySchema(fetch, ttl=10)
+            optimized = optimize("SELECT * FROM x", schema=schema, db="db", cache=cache)
+            self.assertEqual(optimized.named_selects, ["a", "b"])
+
+        catalog[("db", "x")] = {"a": "int", "b": "text", "e": "int"}
+        with mock.patch("sqlglot.schema.time.monotonic", return_value=20):
+            optimized = optimize("SELECT * FROM x", schema=schema, db="db", cache=cache)
+            self.assertEqual(optimized.named_selects, ["a", "b", "e"])
+        self.assertEqual(cache.info().currsize, 0)
@@ -4,6 +4,7 @@ import unittest
 
 from sqlglot import exp, parse_one
 from sqlglot.optimizer.annotate_types import annotate_types
+from sqlglot.serde import dumps, loads
 from tests.helpers import load_sql_fixtures
 
 
@@ -45,3 +46,60 @@ class TestSerde(unittest.TestCase):
         before = expr.sql()
         self.assertEqual(before, self.dump_load(expr).sql())
         self.assertEqual(before, pickle.loads(pickle.dumps(expr)).sql())
+        self.assertEqual(before, loads(dumps(expr)).sql())
+
+    def test_binary(self):
+        for sql in load_sql_fixtures("identity.sql"):
+            with self.subTest(sql):
+                before = parse_one(sql)
+                after = loads(dumps(before))
+                self.assertEqual(repr(before), repr(after))
+                self.assertEqual(
+                    [(node.comments, node.meta) for node in before.walk()],
+                    [(node.comments, node.meta) for node in after.walk()],
+                )
+
+                for node in after.walk():
+                    if node.parent:
+                        siblings = node.parent.args[node.arg_key]
+                        self.assertIs(
+                            node, siblings if node.index is None else siblings[node.index]
+                        )
+
+    def test_binary_attributes(self):
+        before = annotate_types(parse_one("SELECT CAST('1' AS STRUCT<x ARRAY<INT>>) /* c */, 1.5"))
+        before.meta.update(
+            {
+                "a": [1, -(2**70), 1.5, None, True],
+                "b": {"c": "d", 1: False},
+                2: exp.DataType.Type.INT,
+            }
+        )
+        before.selects[1].meta["x"] = -1
+        after = loads(dumps(before))
+
+        self.assertEqual(before, after)
+        self.assertEqual(before.meta, after.meta)
+        self.assertEqual(before.selects[1].meta, after.selects[1].meta)
+        self.assertEqual(before.selects[0].comments, after.selects[0].comments)
+        self.assertEqual(before.selects[0].type, after.selects[0].type)
+        self.assertEqual(before.selects[0].this.type, after.selects[0].this.type)
+        self.assertIsNone(after.selects[0].type.parent)
+        self.assertEqual(after.selects[0].type.sql(), "STRUCT<x ARRAY<INT>>")
+
+        custom = loads(dumps(CustomExpression(this=exp.Literal.string("\ud800"))))
+        self.assertIsInstance(custom, CustomExpression)
+        self.assertEqual(custom.name, "\ud800")
+
+    def test_binary_errors(self):
+        expression = parse_one("SELECT 1")
+        expression.meta["x"] = object()
+
+        with self.assertRaises(ValueError):
+            dumps(expression)
+
+        # Pickling falls back to the JSON-like format
+        self.assertEqual(pickle.loads(pickle.dumps(expression)), expression)
+
+        with self.assertRaises(ValueError):
+            loads(b"SELECT 1")
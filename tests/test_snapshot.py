@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from sqlglot import exp, parse_one
+from sqlglot.errors import SchemaError
+from sqlglot.optimizer import optimize
+from sqlglot.schema import IndexedSchema, MappingSchema
+from sqlglot.snapshot import SnapshotSchema, write_snapshot
+from tests.helpers import TPCH_SCHEMA
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "schema.snapshot")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_snapshot(self):
+        schema = MappingSchema(TPCH_SCHEMA)
+        self.assertEqual(write_snapshot(schema, self.path), schema.fingerprint())
+
+        snapshot = SnapshotSchema(self.path)
+        self.assertEqual(snapshot.fingerprint(), schema.fingerprint())
+        self.assertEqual(snapshot.supported_table_args, schema.supported_table_args)
+        self.assertEqual(list(snapshot.mapping), list(schema.mapping))
+
+        for table in TPCH_SCHEMA:
+            self.assertEqual(snapshot.column_names(table), schema.column_names(table))
+            for column in TPCH_SCHEMA[table]:
+                self.assertEqual(
+                    snapshot.get_column_type(table, column), schema.get_column_type(table, column)
+                )
+
+        # Equal types are only decoded once
+        self.assertIs(
+            snapshot.get_column_type("orders", "o_orderkey"),
+            snapshot.get_column_type("lineitem", "l_orderkey"),
+        )
+
+        sql = "SELECT o_orderkey, SUM(l_quantity) FROM orders JOIN lineitem ON o_orderkey = l_orderkey GROUP BY 1"
+        self.assertEqual(
+            optimize(parse_one(sql), schema=snapshot).sql(),
+            optimize(parse_one(sql), schema=schema).sql(),
+        )
+
+        snapshot.add_table("z", {"a": "int"})
+        self.assertNotEqual(snapshot.fingerprint(), schema.fingerprint())
+        self.assertEqual(snapshot.copy().column_names("z"), ["a"])
+        self.assertEqual(snapshot.copy().column_names("orders"), schema.column_names("orders"))
+        snapshot.close()
+
+    def test_settings(self):
+        schema = IndexedSchema(
+            {"c": {"Db": {"X": {"a": "INT", '"B"': "STRUCT<x VARCHAR(10)>"}}}},
+            visible={"C": {"DB": {"X": {"A"}}}},
+            dialect="snowflake, version = 9.1",
+        )
+        write_snapshot(schema, self.path)
+
+        snapshot = SnapshotSchema(self.path)
+        self.assertEqual(snapshot.dialect.version, (9, 1, 0))
+        self.assertEqual(snapshot.fingerprint(), schema.fingerprint())
+        self.assertEqual(snapshot.column_names("c.db.x"), ["A", "B"])
+        self.assertEqual(snapshot.column_names("c.db.x", only_visible=True), ["A"])
+        self.assertEqual(
+            snapshot.get_column_type("db.x", exp.column("B", quoted=True)).sql("snowflake"),
+            "OBJECT(X VARCHAR(10))",
+        )
+
+        # Snapshots are replaced atomically, so schemas that are open keep their contents
+        write_snapshot(MappingSchema({"y": {"b": "INT"}}), self.path)
+        self.assertEqual(snapshot.column_names("c.db.x"), ["A", "B"])
+        self.assertEqual(SnapshotSchema(self.path).column_names("y"), ["b"])
+        self.assertEqual(os.listdir(self.directory.name), ["schema.snapshot"])
+
+    def test_empty(self):
+        write_snapshot(MappingSchema(), self.path)
+
+        snapshot = SnapshotSchema(self.path)
+        self.assertTrue(snapshot.empty)
+        self.assertEqual(snapshot.column_names("x"), [])
+        self.assertEqual(snapshot.fingerprint(), MappingSchema().fingerprint())
+
+    def test_invalid(self):
+        with open(self.path, "wb") as file:
+            file.write(b"SELECT 1")
+
+        with self.assertRaises(ValueError):
+            SnapshotSchema(self.path)
+
+        schema = MappingSchema({"x": {"a": "INT"}})
+        schema.add_table("y", {"b": 1})
+        with self.assertRaises(SchemaError):
+            write_snapshot(schema, self.path)
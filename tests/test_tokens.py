@@ -1,8 +1,10 @@
 import unittest
 
+from sqlglot import Parser
 from sqlglot.dialects import BigQuery
-from sqlglot.errors import TokenError
-from sqlglot.tokens import Tokenizer, TokenType
+from sqlglot.errors import ParseError, TokenError
+from sqlglot.tokens import Tokenizer, TokenStream, TokenType
+from tests.helpers import load_sql_fixtures
 
 
 class TestTokens(unittest.TestCase):
@@ -208,3 +210,47 @@ x"""
             repr(Tokenizer().tokenize("foo")),
             "[<Token token_type: TokenType.VAR, text: foo, line: 1, col: 3, start: 0, end: 2, comments: []>]",
         )
+
+    def test_token_stream(self):
+        sql = ";\n".join(load_sql_fixtures("identity.sql"))
+        tokens = Tokenizer().tokenize(sql)
+
+        class FlushingTokenizer(Tokenizer):
+            STREAM_FLUSH_SIZE = 4
+
+        for stream in (FlushingTokenizer().tokenize_stream(sql), TokenStream(sql, tokens)):
+            self.assertEqual(len(stream), len(tokens))
+            self.assertEqual(repr(stream[:]), repr(tokens))
+            self.assertEqual(repr(stream[-1]), repr(tokens[-1]))
+            self.assertEqual(stream.token_type(3), tokens[3].token_type)
+            self.assertEqual(stream.text(-2), tokens[-2].text)
+            self.assertEqual(
+                stream.semicolons(),
+                [i for i, token in enumerate(tokens) if token.token_type == TokenType.SEMICOLON],
+            )
+            self.assertEqual(Parser().parse(stream, sql), Parser().parse(tokens, sql))
+
+        with self.assertRaises(IndexError):
+            TokenStream("")[0]
+
+        stream = Tokenizer().tokenize_stream("SELECT 'a' /* b */")
+        self.assertEqual(stream.texts, {1: "a"})
+        self.assertEqual(stream.comments, {1: [" b "]})
+
+        # The parser only materializes the tokens of a statement when it gets to it
+        sql = "SELECT (; SELECT 1; SELECT 2"
+        stream = Tokenizer().tokenize_stream(sql)
+        slices = []
+
+        class RecordingTokenStream(TokenStream):
+            def __getitem__(self, index):
+                if isinstance(index, slice):
+                    slices.append(index)
+                return super().__getitem__(index)
+
+        recording = RecordingTokenStream(sql)
+        recording.extend(stream[:])
+
+        with self.assertRaises(ParseError):
+            Parser().parse(recording, sql)
+        self.assertEqual(slices, [slice(0, 2)])
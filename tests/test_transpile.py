@@ -2,7 +2,7 @@ import os
 import unittest
 from unittest import mock
 
-from sqlglot import parse_one, transpile
+from sqlglot import exp, parse_many, parse_one, transpile, transpile_many
 from sqlglot.errors import ErrorLevel, ParseError, UnsupportedError
 from sqlglot.helper import logger as helper_logger
 from sqlglot.parser import logger as parser_logger
@@ -1036,3 +1036,35 @@ FROM tbl1""",
         sql = "1 AND 2 OR 3 AND " * 1000
         sql += "4"
         self.assertEqual(len(parse_one(sql).sql()), 17001)
+
+    def test_transpile_many(self):
+        sqls = ["SELECT IFNULL(a, b) FROM c", "SELECT (", "SELECT 1; SELECT 2"] * 5
+        expected = [["SELECT COALESCE(a, b) FROM c"], None, ["SELECT 1", "SELECT 2"]] * 5
+
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                results = transpile_many(
+                    sqls, read="mysql", write="duckdb", max_workers=max_workers, chunksize=4
+                )
+                self.assertEqual(len(results), len(sqls))
+
+                for result, expected_result in zip(results, expected):
+                    if expected_result is None:
+                        self.assertIsInstance(result, ParseError)
+                        self.assertEqual(result.errors[0]["line"], 1)
+                    else:
+                        self.assertEqual(result, expected_result)
+
+        self.assertEqual(
+            transpile_many(["SELECT a FROM b"], pretty=True), [["SELECT\n  a\nFROM b"]]
+        )
+
+        # The generator is built once per worker, so its settings are validated upfront
+        with self.assertRaises(TypeError):
+            transpile_many(["SELECT 1"] * 4, max_workers=2, chunksize=1, prety=True)
+
+    def test_parse_many(self):
+        results = parse_many(["SELECT 1", "SELECT (", "x = 1"], max_workers=2, chunksize=1)
+        self.assertIsInstance(results[0][0], exp.Select)
+        self.assertIsInstance(results[1], ParseError)
+        self.assertIsInstance(results[2][0], exp.EQ)